@@ -1,16 +1,26 @@
 import os
 import re
-import shutil
 import ftplib
 
+from ftp_deploy import FTPSessionPool, DeployQueue, format_deploy_report
+from local_copy import CopyStats, copy_file
+
 ro_directory = r'e:\Carte\BB\17 - Site Leadership\Principal 2022\ro'
 en_directory = r'c:\Folder1\fisiere_gata'
+principal_2022_en_directory = r'e:\Carte\BB\17 - Site Leadership\Principal 2022\en'
 
 # Detalii FTP hardcodate
 FTP_SERVER = "ftp.neculaifantanaru.com"
 FTP_USER = "neculaif"
 FTP_PASSWORD = "PASSWORD'"  # Parola hardcodată
 FTP_REMOTE_DIR = "/public_html/en/"  # Directorul corect pe serverul FTP
+FTP_PORT = 21
+FTP_SESSIONS = 4  # Câte sesiuni FTP deschise în paralel la copy_fisiere_gata
+FTP_DELTA_SYNC = True  # Urcă doar fișierele noi sau schimbate de la ultima sincronizare
+# Copierea locală: 'copy', 'hardlink' (Principal și Principal 2022 pe același disc) sau 'reflink'.
+# Fișierele identice nu se rescriu în niciun mod.
+LOCAL_COPY_MODE = 'copy'
+FTP_MANIFEST = r'c:\Folder1\ftp_manifest.json'  # Ce s-a urcat ultima dată (nume, dimensiune, sha1)
 
 def get_ro_filename(en_content):
    match = re.search(r'<li><a cunt_code="\+40" href="https://neculaifantanaru\.com/(.*?)\.html"', en_content)
@@ -20,7 +30,8 @@ def get_image_url(content):
    img_match = re.search(r'<img src="(https://neculaifantanaru\.com/images/.*?_image\.jpg)"', content)
    return img_match.group(1) if img_match else None
 
-def process_files():
+def process_files(on_done=None):
+   """on_done(cale): apelat pentru fiecare fișier imediat ce a fost terminat (ex. DeployQueue.push)"""
    print("Start procesare fișiere...")
 
    for en_file in os.listdir(en_directory):
@@ -70,6 +81,9 @@ def process_files():
 
        except Exception as e:
            print(f"Eroare la procesarea {en_file}: {str(e)}")
+       finally:
+           if on_done:
+               on_done(en_file_path)
 
    print("\nProcesare terminată")
 
@@ -77,7 +91,8 @@ def upload_to_ftp(local_file_path, remote_file_name):
     """Încarcă un fișier pe serverul FTP"""
     try:
         # Conectare la server
-        ftp = ftplib.FTP(FTP_SERVER)
+        ftp = ftplib.FTP()
+        ftp.connect(FTP_SERVER, FTP_PORT)
         ftp.login(FTP_USER, FTP_PASSWORD)
         print(f"Conectat la {FTP_SERVER} ca {FTP_USER}")
 
@@ -129,6 +144,19 @@ def upload_to_ftp(local_file_path, remote_file_name):
         print(f"Eroare la încărcarea pe FTP a fișierului {remote_file_name}: {str(e)}")
         return False
 
+def open_deploy_queue(copy_dir=None, sessions=None, delta=None):
+    """
+    Pornește publicarea în fundal: sesiuni FTP persistente + coada de copiere în copy_dir.
+    Firele din fundal nu afișează nimic pe fișier (s-ar amesteca cu mesajele pașilor);
+    erorile apar în raportul de la final. Cu delta (implicit FTP_DELTA_SYNC) se urcă doar fișierele schimbate față de FTP_MANIFEST.
+    """
+    delta = FTP_DELTA_SYNC if delta is None else delta
+    pool = FTPSessionPool(FTP_SERVER, FTP_USER, FTP_PASSWORD, FTP_REMOTE_DIR,
+                          size=sessions or FTP_SESSIONS, port=FTP_PORT, verbose=False)
+    deploy = DeployQueue(pool, copy_dir=copy_dir, manifest_path=FTP_MANIFEST if delta else None,
+                         owns_pool=True, copy_mode=LOCAL_COPY_MODE)
+    return deploy.start()
+
 def copy_output_files():
     """Copiază fișierele din folderul output în folderul en din Principal (păstrează originalele)"""
     source_dir = r'e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python\output'
@@ -147,8 +175,7 @@ def copy_output_files():
 
     # Contoare pentru statistici
     total_files = 0
-    copied_files = 0
-    error_files = 0
+    stats = CopyStats()
 
     for filename in os.listdir(source_dir):
         if not filename.endswith('.html'):
@@ -159,37 +186,33 @@ def copy_output_files():
         target_path = os.path.join(target_dir, filename)
 
         try:
-            # Verifică dacă fișierul există deja la destinație
-            if os.path.exists(target_path):
-                print(f"Fișierul există deja la destinație, se suprascrie: {filename}")
-
-            # Copiază fișierul la destinație (păstrează originalul)
-            shutil.copy2(source_path, target_path)
-            print(f"Fișier copiat cu succes: {filename}")
-            copied_files += 1
+            # Copiază fișierul la destinație doar dacă diferă (păstrează originalul)
+            if copy_file(source_path, target_path, LOCAL_COPY_MODE, stats) != 'identic':
+                print(f"Fișier copiat cu succes: {filename}")
 
         except Exception as e:
             print(f"Eroare la copierea fișierului {filename}: {str(e)}")
-            error_files += 1
 
     print(f"\nRezultat copiere din output în Principal/en:")
     print(f"- Total fișiere procesate: {total_files}")
-    print(f"- Fișiere copiate cu succes: {copied_files}")
-    print(f"- Fișiere cu erori: {error_files}")
+    print(f"- Fișiere copiate cu succes: {stats.copied + stats.linked}")
+    print(f"- Fișiere identice (nerescrise): {stats.identical}")
+    print(f"- Fișiere cu erori: {stats.errors}")
+    print(f"- {stats.summary()}")
 
     return True
 
-def copy_fisiere_gata():
-    """Copiază fișierele din folderul fisiere_gata în folderul en din Principal 2022 și pe FTP (păstrează originalele)"""
-    source_dir = r'c:\Folder1\fisiere_gata'
-    target_dir = r'e:\Carte\BB\17 - Site Leadership\Principal 2022\en'
-
+def start_fisiere_gata_deploy(source_dir=en_directory, target_dir=principal_2022_en_directory):
+    """
+    Pornește publicarea fișierelor din fisiere_gata: pe FTP și copiere în Principal 2022/en.
+    Fișierele se pun în coadă cu push() pe măsură ce sunt gata; returnează coada (sau None).
+    """
     print("\nÎncărcare fișiere pe FTP și copiere în Principal 2022/en...")
 
     # Verifică existența directoarelor
     if not os.path.exists(source_dir):
         print(f"Directorul sursă nu există: {source_dir}")
-        return False
+        return None
 
     if not os.path.exists(target_dir):
         print(f"Directorul țintă nu există: {target_dir}")
@@ -199,58 +222,53 @@ def copy_fisiere_gata():
             print(f"Directorul țintă a fost creat: {target_dir}")
         except Exception as e:
             print(f"Nu s-a putut crea directorul țintă: {str(e)}")
-            return False
+            return None
 
-    # Contoare pentru statistici
-    total_files = 0
-    copied_files = 0
-    uploaded_files = 0
-    error_files = 0
+    return open_deploy_queue(target_dir)
 
+def finish_fisiere_gata_deploy(deploy, source_dir=en_directory):
+    """Pune în coadă fișierele rămase, așteaptă ambele cozi (bariera) și afișează raportul"""
     for filename in os.listdir(source_dir):
-        if not filename.endswith('.html'):
-            continue
-
-        total_files += 1
         source_path = os.path.join(source_dir, filename)
-        target_path = os.path.join(target_dir, filename)
-
-        try:
-            # Primul pas: Încărcare pe FTP
-            ftp_success = upload_to_ftp(source_path, filename)
-            if ftp_success:
-                uploaded_files += 1
+        if filename.endswith('.html') and os.path.abspath(source_path) not in deploy.pushed:
+            deploy.push(source_path, filename)
 
-            # Al doilea pas: Copiere în directorul local
-            # Verifică dacă fișierul există deja la destinație
-            if os.path.exists(target_path):
-                print(f"Fișierul există deja la destinație, se suprascrie: {filename}")
-
-            # Copiază fișierul la destinație (păstrează originalul)
-            shutil.copy2(source_path, target_path)
-            print(f"Fișier copiat cu succes în directorul local: {filename}")
-            copied_files += 1
-
-        except Exception as e:
-            print(f"Eroare la procesarea fișierului {filename}: {str(e)}")
-            error_files += 1
+    report = deploy.finish()
 
     print(f"\nRezultat procesare din fisiere_gata:")
-    print(f"- Total fișiere procesate: {total_files}")
-    print(f"- Fișiere încărcate pe FTP: {uploaded_files}")
-    print(f"- Fișiere copiate în director local: {copied_files}")
-    print(f"- Fișiere cu erori: {error_files}")
+    print(f"- Total fișiere procesate: {len(report['status'])}")
+    print(f"- Fișiere încărcate pe FTP: {report['uploaded_files']}")
+    print(f"- Fișiere neschimbate (neîncărcate din nou): {report['skipped_files']}")
+    print(f"- Fișiere copiate în director local: {report['copied_files']}")
+    print(f"- Fișiere identice în director local (nerescrise): {report['identical_files']}")
+    print(f"- Fișiere cu erori: {report['upload_errors'] + len(report['copy_errors'])}")
+    for line in format_deploy_report(report):
+        print(line)
+
+    return report
 
+def copy_fisiere_gata():
+    """Copiază fișierele din folderul fisiere_gata în folderul en din Principal 2022 și pe FTP (păstrează originalele)"""
+    source_dir = en_directory
+    deploy = start_fisiere_gata_deploy(source_dir)
+    if deploy is None:
+        return False
+    finish_fisiere_gata_deploy(deploy, source_dir)
     return True
 
 if __name__ == "__main__":
+    # Încărcarea pe FTP și copierea în Principal 2022/en pornesc în fundal:
+    # fiecare fișier din fisiere_gata intră în coadă imediat ce e procesat
+    deploy = start_fisiere_gata_deploy()
+
     # Prima etapă - procesarea fișierelor conform codului original
-    process_files()
+    process_files(on_done=deploy.push if deploy else None)
 
     # A doua etapă - copierea fișierelor din output în Principal/en (păstrează originalele)
     copy_output_files()
 
-    # A treia etapă - încărcarea pe FTP și copierea fișierelor din fisiere_gata în Principal 2022/en (păstrează originalele)
-    copy_fisiere_gata()
+    # A treia etapă - bariera: se așteaptă încărcarea pe FTP și copierea fișierelor din fisiere_gata
+    if deploy:
+        finish_fisiere_gata_deploy(deploy)
 
     print("\nToate operațiunile au fost finalizate!")
\ No newline at end of file
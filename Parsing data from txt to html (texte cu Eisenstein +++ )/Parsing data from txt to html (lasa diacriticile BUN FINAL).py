@@ -1,7 +1,25 @@
 import re
 import os
+import sys
 from unidecode import unidecode
 
+# article_template e în folderul cu scripturile principale, un nivel mai sus
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from article_template import ArticleTemplate
+
+# Textele pe care se ancorează înlocuirile din fill_article; un articol care le conține
+# în valori e randat cu lanțul complet, nu prin template-ul compilat
+ARTICLE_MARKERS = (
+    '<title>', '| Neculai Fantanaru</title>', '<meta name="description" content="', '<link rel="canonical" href="',
+    '<!-- FLAGS_1 -->', '<div class="cautareField">', '<div align="right">', 'flag_lang_ro.jpg', '<meta charset="',
+    '<!-- ARTICOL START -->', '<table', '<h1 class="den_articol" itemprop="name">', '</h1></td>', '</table>',
+    '</div>', '<p align="justify" class="text_obisnuit style3">', '<!-- ARTICOL FINAL -->',
+)
+
+def unsafe_value(name, value):
+    """Titlul din h1 urmează după \\1 în înlocuire: o cifră la început ar schimba referința"""
+    return name == 'clean_title' and value[:1].isdigit()
+
 # specificatii Trebuie sa ai asa: ----- IDEE 29------
 # specificatii Trebuie sa ai asa: Titlul Articolului
 # specificatii Trebuie sa ai asa: Corpul Articolului
@@ -66,28 +84,33 @@ def fix_double_quotes(content):
 def clean_description(description):
     return re.sub(r'[":\'`]', '', description)
 
-def create_html_file(model, article, output_dir):
-    # Process article content
+def article_values(article):
+    """Slug-ul și valorile unui articol din txt pentru fill_article"""
     lines = article.strip().split('\n')
     title = lines[0].strip()
     description = lines[2].strip() if len(lines) > 2 else ""
     content = '\n'.join(lines[3:]) if len(lines) > 3 else ""
 
     slug = create_slug(title)
-    formatted_content = format_content(content, description)
-
     clean_title = clean_description(title)
     clean_desc = clean_description(description)
 
-    clean_title_no_diacritics = unidecode(clean_title)
-    clean_desc_no_diacritics = unidecode(clean_desc)
+    return slug, {
+        'clean_title': clean_title,
+        'clean_title_no_diacritics': unidecode(clean_title),
+        'clean_desc_no_diacritics': unidecode(clean_desc),
+        'canonical_link': f"https://neculaifantanaru.com/{slug}.html",
+        'formatted_content': format_content(content, description),
+    }
 
+def fill_article(model, values):
+    """Pune valorile articolului (article_values) în fișierul model"""
     new_content = model
-    canonical_link = f"https://neculaifantanaru.com/{slug}.html"
+    canonical_link = values['canonical_link']
 
     # Actualizează secțiunile <title>, <meta description> și <link rel="canonical">
-    new_content = re.sub(r'<title>.*?\| Neculai Fantanaru</title>', f'<title>{clean_title_no_diacritics} | Neculai Fantanaru</title>', new_content)
-    new_content = re.sub(r'<meta name="description" content=".*?">', f'<meta name="description" content="{clean_desc_no_diacritics}">', new_content)
+    new_content = re.sub(r'<title>.*?\| Neculai Fantanaru</title>', f'<title>{values["clean_title_no_diacritics"]} | Neculai Fantanaru</title>', new_content)
+    new_content = re.sub(r'<meta name="description" content=".*?">', f'<meta name="description" content="{values["clean_desc_no_diacritics"]}">', new_content)
     new_content = re.sub(r'<link rel="canonical" href=".*?"', f'<link rel="canonical" href="{canonical_link}"', new_content)
 
     # Înlocuirea URL-ului în secțiunea FLAGS_1
@@ -99,8 +122,13 @@ def create_html_file(model, article, output_dir):
 
     # Înlocuirea conținutului articolului
     content_pattern = r'(<!-- ARTICOL START -->.*?<table.*?<td><h1 class="den_articol" itemprop="name">).*?(</h1></td>.*?</table>\s*)(.*?)(</div>\s*<p align="justify" class="text_obisnuit style3">&nbsp;</p>\s*<!-- ARTICOL FINAL -->)'
-    replacement = r'\1{}\2\n{}\n\4'.format(clean_title, formatted_content)
-    new_content = re.sub(content_pattern, replacement, new_content, flags=re.DOTALL)
+    replacement = r'\1{}\2\n{}\n\4'.format(values['clean_title'], values['formatted_content'])
+    return re.sub(content_pattern, replacement, new_content, flags=re.DOTALL)
+
+def create_html_file(model, article, output_dir, template=None):
+    # Process article content; cu template (ArticleTemplate compilat din model) pagina e un join
+    slug, values = article_values(article)
+    new_content = template.render(values) if template is not None else fill_article(model, values)
 
     # Fixează ghilimelele duble
     new_content = fix_double_quotes(new_content)
@@ -134,6 +162,7 @@ def main():
 
     print(f"Citire fișier model: {model_file}")
     model = read_model_file(model_file)
+    template = ArticleTemplate(model, fill_article, ARTICLE_MARKERS, unsafe_value)
 
     print(f"Citire fișier de intrare: {input_file}")
     articles = read_articles(input_file)
@@ -145,9 +174,10 @@ def main():
     print(f"Procesare articole și creare fișiere HTML în: {output_dir}")
     for i, article in enumerate(articles, 1):
         print(f"Procesare articol {i} din {len(articles)}")
-        create_html_file(model, article, output_dir)
+        create_html_file(model, article, output_dir, template)
 
     print("Procesare completă. Toate fișierele HTML au fost create.")
+    print(template.report())
 
 if __name__ == "__main__":
     main()
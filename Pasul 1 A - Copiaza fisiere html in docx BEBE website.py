@@ -1,11 +1,24 @@
+import io
 import os
 from bs4 import BeautifulSoup
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 import re
 from tqdm import tqdm
 import time
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Documentul se scrie direct ca XML (docx_writer), nu prin obiectele python-docx
+from docx_writer import DocxWriter, ALIGN_CENTER
+from script_pool import script_function, POOL_ERRORS
+
+TITLE_COLOR = 'FF0000'  # roșu
+ID_COLOR = '808080'     # gri
+ID_SIZE = 8             # puncte
+
+# Extragerea articolelor (citire, BeautifulSoup, paragrafe) rulează pe un pool de procese;
+# documentul se asamblează apoi în ordine, în procesul curent
+EXTRACT_PROCESSES = os.cpu_count() or 1  # 1 = totul în procesul curent
+EXTRACT_PROCESS_MIN_FILES = 16           # sub acest număr de fișiere procesele nu se justifică
 
 # Lista fișierelor specifice de procesat  # toate articolele sunt preluate din  e:\Carte\BB\17 - Site Leadership\Principal\ro\
 SPECIFIC_FILES = [
@@ -40,26 +53,23 @@ def process_paragraph(paragraph, p_tag, is_bold=False):
     for element in p_tag.children:
         if isinstance(element, str):
             # Text simplu
-            run = paragraph.add_run(element)
-            run.bold = is_text_obisnuit2
+            paragraph.add_run(element, bold=is_text_obisnuit2)
         elif element.name == 'em':
             # Text italic
-            run = paragraph.add_run(element.get_text())
-            run.italic = True
-            run.bold = is_text_obisnuit2
+            paragraph.add_run(element.get_text(), bold=is_text_obisnuit2, italic=True)
         elif element.name == 'span' and 'text_obisnuit2' in element.get('class', []):
             # Text în span cu clasa text_obisnuit2 - trebuie să fie bold
-            run = paragraph.add_run(element.get_text())
-            run.bold = True
+            paragraph.add_run(element.get_text(), bold=True)
         else:
             # Alte elemente - procesare normală
-            run = paragraph.add_run(element.get_text() if element.name else str(element))
-            run.bold = is_text_obisnuit2
+            paragraph.add_run(element.get_text() if element.name else str(element), bold=is_text_obisnuit2)
+
+# Compilat o singură dată (nu la fiecare fișier)
+ID_PATTERN = re.compile(r'<!-- \$item_id = (\d+); // Replace that with your rating id -->')
 
 def extract_item_id(content):
     """Extrage ID-ul articolului din comentariul HTML"""
-    id_pattern = re.compile(r'<!-- \$item_id = (\d+); // Replace that with your rating id -->')
-    match = id_pattern.search(content)
+    match = ID_PATTERN.search(content)
     if match:
         return match.group(1)
     return "N/A"  # Returnează N/A dacă nu găsește ID-ul
@@ -99,22 +109,13 @@ def process_html_file(file_path, document):
         title_text = title.text
         print(f"Adăugare titlu: {title_text[:50]}...")
 
-        # Crează un paragraf pentru titlu
-        title_paragraph = document.add_paragraph()
-        title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        # Adaugă titlul cu formatare
-        run = title_paragraph.add_run(title_text)
-        run.bold = True
-        font = run.font
-        font.color.rgb = RGBColor(255, 0, 0)
+        # Crează un paragraf pentru titlu, cu formatare
+        title_paragraph = document.add_paragraph(alignment=ALIGN_CENTER)
+        title_paragraph.add_run(title_text, bold=True, color=TITLE_COLOR)
 
-        # Adaugă ID-ul articolului doar sub titlu
-        id_paragraph = document.add_paragraph()
-        id_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        id_run = id_paragraph.add_run(f"ID: {item_id}")
-        id_run.font.color.rgb = RGBColor(128, 128, 128)  # Culoare gri
-        id_run.font.size = Pt(8)  # Dimensiune mică pentru text
+        # Adaugă ID-ul articolului doar sub titlu (gri, dimensiune mică)
+        id_paragraph = document.add_paragraph(alignment=ALIGN_CENTER)
+        id_paragraph.add_run(f"ID: {item_id}", color=ID_COLOR, size=ID_SIZE)
 
     # Găsește conținutul între markeri
     start_marker = '<!-- ARTICOL START -->'
@@ -147,6 +148,53 @@ def process_html_file(file_path, document):
     end_time = time.time()
     print(f"Procesate {paragraphs_processed} paragrafe în {end_time - start_time:.2f} secunde")
 
+def extract_html_file(file_path):
+    """
+    Extrage un articol într-un DocxWriter propriu (poate rula într-un proces copil).
+    Returnează (XML-ul paragrafelor, ce s-a afișat, mesajul erorii sau None).
+    """
+    document = DocxWriter()
+    output = io.StringIO()
+    error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            process_html_file(file_path, document)
+        except Exception as e:
+            error = str(e)
+    return document.body_xml(), output.getvalue(), error
+
+def extract_html_files(files, processes=None, on_result=None):
+    """Extragerea tuturor fișierelor, în ordine; pe procese dacă sunt destule fișiere"""
+    processes = EXTRACT_PROCESSES if processes is None else processes
+    results = []
+    if processes > 1 and len(files) >= EXTRACT_PROCESS_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                for result in pool.map(script_function(extract_html_file), files):
+                    results.append(result)
+                    if on_result:
+                        on_result()
+        except POOL_ERRORS as e:
+            print(f"  Extragere în procese indisponibilă ({e}), continuăm în procesul curent.")
+    for file_path in files[len(results):]:
+        results.append(extract_html_file(file_path))
+        if on_result:
+            on_result()
+    return results
+
+def build_document(files, processes=None, on_result=None):
+    """Documentul pentru toate fișierele: extragere în paralel, asamblare în ordine"""
+    document = DocxWriter()
+    results = extract_html_files(files, processes, on_result)
+    for file_path, (body_xml, output, error) in zip(files, results):
+        print(output, end='')
+        document.append_body(body_xml)
+        if error is not None:
+            print(f"\nEroare la procesarea fișierului {os.path.basename(file_path)}: {error}")
+            document.add_paragraph(f"EROARE LA PROCESARE: {os.path.basename(file_path)}")
+            document.add_paragraph(f"Detalii eroare: {error}")
+    return document
+
 def main():
     input_folder = r'e:\Carte\BB\17 - Site Leadership\Principal\ro'
     output_file = 'articole_compilate.docx'
@@ -172,18 +220,9 @@ def main():
         for file in missing_files:
             print(f"- {file}")
 
-    document = Document()
-
-    # Crează progress bar
+    # Crează progress bar (avansează pe măsură ce articolele sunt extrase)
     with tqdm(total=len(files_to_process), desc="Progres total") as pbar:
-        for file_path in files_to_process:
-            try:
-                process_html_file(file_path, document)
-            except Exception as e:
-                print(f"\nEroare la procesarea fișierului {os.path.basename(file_path)}: {e}")
-                document.add_paragraph(f"EROARE LA PROCESARE: {os.path.basename(file_path)}")
-                document.add_paragraph(f"Detalii eroare: {str(e)}")
-            pbar.update(1)
+        document = build_document(files_to_process, on_result=lambda: pbar.update(1))
 
     print("\nSalvare document final...")
     document.save(output_file)
@@ -9,9 +9,12 @@ import os
 import re
 from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from bs4 import BeautifulSoup
 import unidecode
 
+import config
+import corpus_index
+from id_registry import IdRegistry
+
 def normalize_title(title):
     """Normalizează titlul pentru comparare"""
     # Elimină diacriticele
@@ -29,43 +32,6 @@ def generate_filename_from_title(title):
     normalized = re.sub(r'-+', '-', normalized).strip('-')
     return f"{normalized}.html"
 
-def extract_id_from_html(file_path):
-    """Extrage ID-ul din fișierul HTML"""
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-        
-        # Căutăm pattern-ul pentru ID
-        patterns = [
-            r'<!-- \$item_id = (\d+);',
-            r'\$item_id = (\d+);'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content)
-            if match:
-                return match.group(1)
-        
-        return None
-    except Exception as e:
-        print(f"Eroare la citirea {file_path}: {e}")
-        return None
-
-def extract_title_from_html(file_path):
-    """Extrage titlul din fișierul HTML"""
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        title_tag = soup.find('h1', class_='den_articol')
-        if title_tag:
-            return title_tag.get_text().strip()
-        return None
-    except Exception as e:
-        print(f"Eroare la citirea titlului din {file_path}: {e}")
-        return None
-
 def build_ro_index(ro_dir):
     """Construiește un index al fișierelor RO cu titluri și ID-uri"""
     index = {}  # normalized_title -> (filename, id, original_title)
@@ -73,13 +39,19 @@ def build_ro_index(ro_dir):
     
     print(f"Indexare fișiere din: {ro_dir}")
     
-    for filename in os.listdir(ro_dir):
-        if not filename.endswith('.html'):
-            continue
-        
-        file_path = os.path.join(ro_dir, filename)
-        title = extract_title_from_html(file_path)
-        item_id = extract_id_from_html(file_path)
+    # ID-urile vin din registrul scris de Pasul 0; titlurile din indexul persistent
+    # (se recitesc doar fișierele modificate)
+    registry = IdRegistry.load(config.ID_REGISTRY)
+    unregistered = 0
+    for page in corpus_index.load_folder(ro_dir, 'ro'):
+        filename = page['filename']
+        title = page['title']
+        item_id = registry.id_for_file('ro', page['path'])
+        if item_id is None:
+            # Pagină nouă de la ultima rulare a Pasului 0: ID-ul ei, dacă are
+            unregistered += 1
+            item_id = page['item_id']
+        item_id = str(item_id) if item_id is not None else None
         
         if title and item_id:
             normalized = normalize_title(title)
@@ -90,6 +62,8 @@ def build_ro_index(ro_dir):
             filename_index[filename_base] = (filename, item_id, title)
     
     print(f"Indexate {len(index)} fișiere RO")
+    if unregistered:
+        print(f"ATENȚIE: {unregistered} fișiere RO lipsesc din registrul ID-urilor - rulați din nou Pasul 0")
     return index, filename_index
 
 def find_matching_ro_file(en_title, ro_index, ro_filename_index):
@@ -1,9 +1,33 @@
 import os
 import re
+import time
+import argparse
 import unidecode
-from docx import Document
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from article_template import ArticleTemplate
+from docx_reader import iter_paragraphs, ALIGN_CENTER
+from page_model import Page
+from rewrite_rules import RuleSet, PASUL2_POST_PROCESS_RULES, PASUL2_FINAL_RULES
+from script_pool import script_function, POOL_ERRORS
+
+EMPTY_PARAGRAPH_PATTERN = re.compile(r'<p class="text_obisnuit"></p>\s*')
+
+RENDER_JOBS = 1                   # --jobs N: câte procese randează articolele (1 = totul în procesul curent)
+RENDER_PROCESS_MIN_ARTICLES = 16  # sub acest număr de articole procesele nu se justifică
+SLOWEST_ARTICLES = 5              # câte articole apar în raportul de timpi
+
+# Reguli compilate o singură dată pentru toate articolele
+POST_PROCESS_RULES = RuleSet(PASUL2_POST_PROCESS_RULES)
+FINAL_RULES = RuleSet(PASUL2_FINAL_RULES)
+
+# Textele pe care se ancorează înlocuirile din fill_article; un articol care le conține
+# în valori e randat cu lanțul complet, nu prin template-ul compilat (article_template)
+ARTICLE_MARKERS = (
+    '<title>', '</title>', '<h1 class="den_articol" itemprop="name">', '</h1>', 'zzz.html',
+    '<meta name="description" content="', '<!-- SASA-1 -->', '<!-- SASA-2 -->', '<td class="text_dreapta">On ',
+)
 
 def make_links_clickable(text):
     """Identifică și transformă linkurile în format <a href="...">...</a>"""
@@ -22,23 +46,24 @@ def add_content_to_meta(html_content, content_to_add):
     else:
         return html_content
 
-def extract_data_from_docx(file_path):
-    """Extrage titlurile, corpurile articolelor și ID-urile din documentul Word"""
-    doc = Document(file_path)
-    articles = []
+def iter_articles(file_path):
+    """
+    Titlurile, corpurile articolelor și ID-urile din documentul Word, ca tupluri
+    (titlu, corp, id) date pe măsură ce se citește documentul (docx_reader).
+    """
     current_title = None
     current_body = []
     current_id = None
     is_id_line = False
 
-    for para in doc.paragraphs:
+    for para in iter_paragraphs(file_path):
         text = para.text.strip()
 
         # Verifică dacă paragraful este un titlu (centrat și nu este ID)
-        if para.alignment == WD_PARAGRAPH_ALIGNMENT.CENTER and text and not text.startswith("ID:"):
-            # Dacă avem deja un titlu, salvăm articolul anterior
+        if para.alignment == ALIGN_CENTER and text and not text.startswith("ID:"):
+            # Dacă avem deja un titlu, dăm mai departe articolul anterior
             if current_title:
-                articles.append((current_title, current_body, current_id))
+                yield current_title, current_body, current_id
                 current_body = []
                 current_id = None
             current_title = text
@@ -51,25 +76,27 @@ def extract_data_from_docx(file_path):
         elif current_title and text:
             is_id_line = False  # Resetăm flag-ul
             formatted_text = []
-            for run in para.runs:
+            for run_text, bold, italic in para.runs:
                 # Verificăm dacă textul este bold, italic, sau ambele
-                if run.bold and run.italic:
-                    formatted_text.append(f'<strong><em>{run.text}</em></strong>')
-                elif run.bold:
-                    formatted_text.append(f'<strong>{run.text}</strong>')
-                elif run.italic:
-                    formatted_text.append(f'<em>{run.text}</em>')
+                if bold and italic:
+                    formatted_text.append(f'<strong><em>{run_text}</em></strong>')
+                elif bold:
+                    formatted_text.append(f'<strong>{run_text}</strong>')
+                elif italic:
+                    formatted_text.append(f'<em>{run_text}</em>')
                 else:
-                    formatted_text.append(run.text)
+                    formatted_text.append(run_text)
             paragraph_text = ''.join(formatted_text)
             paragraph_text = make_links_clickable(paragraph_text)  # Adaugă linkuri clickable
             current_body.append(paragraph_text)
 
-    # Adăugăm ultimul articol
+    # Ultimul articol
     if current_title:
-        articles.append((current_title, current_body, current_id))
+        yield current_title, current_body, current_id
 
-    return articles
+def extract_data_from_docx(file_path):
+    """Extrage titlurile, corpurile articolelor și ID-urile din documentul Word (listă de tupluri)"""
+    return list(iter_articles(file_path))
 
 def remove_diacritics(text):
     """Elimină diacriticele din text"""
@@ -121,11 +148,26 @@ def capitalize_title(title):
     capitalized_words = [word.capitalize() for word in words]
     return ' '.join(capitalized_words)
 
-def update_html_content(html_content, title, first_sentence, body, filename, article_id):
-    """Actualizează conținutul HTML cu datele articolului"""
+def article_values(title, body, filename, article_id):
+    """Valorile unui articol pentru fill_article (titluri, meta description, corp formatat, data)"""
+    title_without_diacritics = remove_diacritics(title)
+    return {
+        'article_id': article_id,
+        'title_without_diacritics': title_without_diacritics,
+        'title': title,
+        'filename': filename,
+        'bold_text': extract_bold_from_body(body),  # textul bold doar din acest articol
+        'formatted_body': format_body(body),
+        'current_date': datetime.now().strftime("%B %d, %Y"),
+        'capitalized_title': capitalize_title(title_without_diacritics),
+        'capitalized_h1': capitalize_title(title),
+    }
+
+def fill_article(html_content, values):
+    """Pune valorile articolului (article_values) în template"""
     # Adăugăm ID-ul articolului la începutul fișierului
-    if article_id:
-        id_comment = f'<!-- $item_id = {article_id}; // ID-ul din fisierul limba romana -->\n'
+    if values['article_id']:
+        id_comment = f'<!-- $item_id = {values["article_id"]}; // ID-ul din fisierul limba romana -->\n'
         # Verificăm dacă există deja un comentariu de ID
         if '<!-- $item_id =' not in html_content:
             # Adăugăm comentariul la începutul fișierului
@@ -134,42 +176,38 @@ def update_html_content(html_content, title, first_sentence, body, filename, art
             # Înlocuim comentariul existent
             html_content = re.sub(r'<!-- \$item_id = \d+;.*?-->\n?', id_comment, html_content)
 
-    title_without_diacritics = remove_diacritics(title)
-    capitalized_title = capitalize_title(title_without_diacritics)
-
     # Actualizăm titlul paginii și titlul articolului
-    html_content = re.sub(r'<title>.*?</title>', f'<title>{title_without_diacritics} | Neculai Fantanaru (en)</title>', html_content)
-    html_content = re.sub(r'<h1 class="den_articol" itemprop="name">.*?</h1>', f'<h1 class="den_articol" itemprop="name">{title}</h1>', html_content)
+    html_content = re.sub(r'<title>.*?</title>', f'<title>{values["title_without_diacritics"]} | Neculai Fantanaru (en)</title>', html_content)
+    html_content = re.sub(r'<h1 class="den_articol" itemprop="name">.*?</h1>', f'<h1 class="den_articol" itemprop="name">{values["title"]}</h1>', html_content)
 
     # Înlocuim placeholder-ul pentru URL cu numele fișierului generat
-    html_content = html_content.replace('zzz.html', filename)
-
-    # Extragem textul bold doar din acest articol
-    bold_text = extract_bold_from_body(body)
+    html_content = html_content.replace('zzz.html', values['filename'])
 
     # Actualizăm meta description
-    meta_desc = f'<meta name="description" content="{bold_text}">'
+    meta_desc = f'<meta name="description" content="{values["bold_text"]}">'
     html_content = re.sub(r'<meta name="description" content=".*?">', meta_desc, html_content)
 
-    # Formatăm și inserăm conținutul corpului articolului
-    formatted_body = format_body(body)
-    html_content = re.sub(r'<!-- SASA-1 -->.*?<!-- SASA-2 -->', f'<!-- SASA-1 -->\n{formatted_body}\n<!-- SASA-2 -->', html_content, flags=re.DOTALL)
+    # Inserăm conținutul corpului articolului
+    html_content = re.sub(r'<!-- SASA-1 -->.*?<!-- SASA-2 -->', f'<!-- SASA-1 -->\n{values["formatted_body"]}\n<!-- SASA-2 -->', html_content, flags=re.DOTALL)
 
     # MODIFICARE IMPORTANTĂ: Actualizăm data DOAR în secțiunea header, nu în conținutul articolului
     # Găsim secțiunea header care conține data
     header_pattern = r'<td class="text_dreapta">On .*?, in'
-    current_date = datetime.now().strftime("%B %d, %Y")
 
     if re.search(header_pattern, html_content):
         # Înlocuim data doar în header
-        html_content = re.sub(header_pattern, f'<td class="text_dreapta">On {current_date}, in', html_content)
+        html_content = re.sub(header_pattern, f'<td class="text_dreapta">On {values["current_date"]}, in', html_content)
 
     # Capitalizăm titlul pentru afișare
-    html_content = re.sub(r'<title>.*?</title>', f'<title>{capitalized_title} | Neculai Fantanaru (en)</title>', html_content)
-    html_content = re.sub(r'<h1 class="den_articol" itemprop="name">.*?</h1>', f'<h1 class="den_articol" itemprop="name">{capitalize_title(title)}</h1>', html_content)
+    html_content = re.sub(r'<title>.*?</title>', f'<title>{values["capitalized_title"]} | Neculai Fantanaru (en)</title>', html_content)
+    html_content = re.sub(r'<h1 class="den_articol" itemprop="name">.*?</h1>', f'<h1 class="den_articol" itemprop="name">{values["capitalized_h1"]}</h1>', html_content)
 
     return html_content
 
+def update_html_content(html_content, title, first_sentence, body, filename, article_id):
+    """Actualizează conținutul HTML cu datele articolului"""
+    return fill_article(html_content, article_values(title, body, filename, article_id))
+
 def extract_bold_from_body(body_paragraphs):
     """Extrage textul bold din paragrafele corpului articolului curent."""
     bold_text_parts = []
@@ -195,15 +233,8 @@ def extract_bold_from_body(body_paragraphs):
 
 def post_process_html(html_content):
     """Aplică procesări suplimentare conținutului HTML"""
-    # Înlocuire string "NBSP" cu spațiu
-    html_content = html_content.replace("NBSP", " ")
-
-    # Înlocuire caracter non-breaking space (U+00A0) cu spațiu normal
-    html_content = html_content.replace("\u00A0", " ")
-
-    # Înlocuire entitate HTML &nbsp; cu spațiu normal
-    html_content = html_content.replace("&nbsp;", " ")
-
+    # "NBSP", caracterul U+00A0 și entitatea &nbsp; devin spațiu normal (o singură trecere)
+    html_content, _ = POST_PROCESS_RULES.apply(html_content)
     return html_content
 
 def extract_text_obisnuit2(html_content):
@@ -244,107 +275,36 @@ def clean_meta_description(description):
 
     return cleaned
 
-def update_meta_description(file_path):
-    """Actualizează meta description-ul fișierului HTML"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-
+def update_meta_description(content):
+    """Actualizează meta description-ul paginii HTML"""
     text_obisnuit2 = extract_text_obisnuit2(content)
 
     if text_obisnuit2:
         cleaned_description = clean_meta_description(text_obisnuit2)
 
-        updated_content = re.sub(
-            r'<meta name="description" content=".*?">',
-            f'<meta name="description" content="{cleaned_description}">',
-            content
-        )
-
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(updated_content)
-
-def remove_empty_paragraphs(file_path):
-    """Elimină paragrafele goale din fișierul HTML"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-
-    # Găsim secțiunea dintre ARTICOL START și ARTICOL FINAL
-    pattern = r'(<!-- ARTICOL START -->.*?<!-- ARTICOL FINAL -->)'
-    article_section = re.search(pattern, content, re.DOTALL)
-
-    if article_section:
-        article_content = article_section.group(1)
-        # Eliminăm paragrafele goale
-        updated_article_content = re.sub(r'<p class="text_obisnuit"></p>\s*', '', article_content)
-        # Înlocuim secțiunea originală cu cea actualizată
-        content = content.replace(article_content, updated_article_content)
-
-    with open(file_path, 'w', encoding='utf-8') as file:
-        file.write(content)
-
-def format_numbered_paragraphs(content):
-    """Formatează paragrafele numerotate"""
-    # Înlocuiește paragrafele care încep cu un număr urmat de punct
-    content = re.sub(
-        r'<strong>(\d+\.\s+)</strong>(.*?)</p>',
-        r'<p class="text_obisnuit"><span class="text_obisnuit2">\1</span>\2</p>',
-        content
-    )
+        # Rescriem doar regiunea meta description, nu tot conținutul
+        page = Page(content)
+        page.set('meta_description', cleaned_description)
+        content = page.text
+
     return content
 
-def final_regex_replacements(file_path):
+def remove_empty_paragraphs(content):
+    """Elimină paragrafele goale din pagina HTML"""
+    # Lucrăm doar pe secțiunea dintre ARTICOL START și ARTICOL FINAL
+    page = Page(content)
+    page.sub('articol', EMPTY_PARAGRAPH_PATTERN, '')
+    return page.text
+
+def final_regex_replacements(content):
     """Aplică înlocuirile finale cu regex pentru a curăța și îmbunătăți formatarea"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-
-    content = format_numbered_paragraphs(content)
-
-    # Înlocuire pentru paragrafele cu <p class="text_obisnuit"><strong><em>...</em></strong>
-    # Devine: <p class="text_obisnuit2"><em>...</em></p>
-    content = re.sub(
-        r'<p class="text_obisnuit"><strong><em>(.*?)</em></strong></p>',
-        r'<p class="text_obisnuit2"><em>\1</em></p>',
-        content
-    )
-
-    # Devine: <p class="text_obisnuit2"><em>...</em></p>
-    content = re.sub(
-        r'<p class="text_obisnuit"><strong>(.*?)</strong></p>',
-        r'<p class="text_obisnuit2">\1</p>',
-        content
-    )
-
-    # Înlocuire pentru paragrafele cu <p class="text_obisnuit"><strong>...</strong> care conțin text după </strong>
-    # Devine: <p class="text_obisnuit"><span class="text_obisnuit2">...</span> textul rămas</p>
-    content = re.sub(
-        r'<p class="text_obisnuit"><strong>(.*?)</strong>(.*?)</p>',
-        r'<p class="text_obisnuit"><span class="text_obisnuit2">\1</span>\2</p>',
-        content
-    )
-
-    # Înlocuire pentru adăugarea lui <br><br> înainte de paragrafele care conțin "* Notă:" în structura nouă
-    content = re.sub(
-        r'(<p class="text_obisnuit"><span class="text_obisnuit2">\* Note:)',
-        r'<br><br>\n\1',
-        content
-    )
-
-    # Alte înlocuiri specifice pentru curățarea tagurilor nedorite
-    content = re.sub(r'<e</p>', '</p>', content)
-    content = re.sub(r'</span></p>', '</p>', content)
-    content = re.sub(r'<em></em>', '', content)
-    content = re.sub(r'</strong>\s*<strong>', '', content)
-    content = re.sub(r'<strong>', '', content)
-    content = re.sub(r'</strong>', '', content)
-
-    with open(file_path, 'w', encoding='utf-8') as file:
-        file.write(content)
-
-def fix_specific_formatting_issues(file_path):
-    """Verifică și repară probleme de formatare specifice"""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
+    # Regulile (paragrafe numerotate, strong -> text_obisnuit2, curățarea tagurilor
+    # nedorite) sunt declarate în rewrite_rules.PASUL2_FINAL_RULES, în ordinea lor
+    content, _ = FINAL_RULES.apply(content)
+    return content
 
+def fix_specific_formatting_issues(content):
+    """Verifică și repară probleme de formatare specifice"""
     # Fixăm problema cu data inserată în mijlocul paragrafului
     # Căutăm pattern-uri ca: "antique shop. On March 25, 2025, in equations"
     problematic_pattern = r'antique shop\. On [A-Za-z]+ \d+, \d{4}, in equations'
@@ -354,14 +314,103 @@ def fix_specific_formatting_issues(file_path):
 
     # Alte pattern-uri problematice pot fi adăugate aici
 
-    with open(file_path, 'w', encoding='utf-8') as file:
-        file.write(content)
+    return content
+
+# Post-procesarea aplicată în memorie, în ordine, înainte de singura scriere a fișierului
+POST_PROCESSING_CHAIN = [
+    fix_specific_formatting_issues,  # Reparăm probleme specifice de formatare
+    update_meta_description,         # Actualizăm meta description-ul
+    remove_empty_paragraphs,         # Eliminăm paragrafele goale
+    final_regex_replacements,        # Aplicăm înlocuirile finale cu regex
+]
+
+def apply_post_processing(content):
+    """Aplică lanțul de post-procesare pe pagina randată"""
+    # Echivalentul recitirii fișierului în mod text: capetele de rând devin '\n'
+    content = content.replace('\r\n', '\n').replace('\r', '\n')
+    for step in POST_PROCESSING_CHAIN:
+        content = step(content)
+    return content
 
-def main():
+def find_slug_collisions(tasks):
+    """Numele de fișier pe care le-ar scrie mai multe articole: {fișier: [titluri, în ordine]}"""
+    titles_by_filename = {}
+    for title, _, filename, _ in tasks:
+        titles_by_filename.setdefault(filename, []).append(title)
+    return {filename: titles for filename, titles in titles_by_filename.items() if len(titles) > 1}
+
+def render_article(template, title, body, filename, article_id, output_dir):
+    """Randează, post-procesează și scrie un articol; returnează durata în secunde"""
+    start = time.perf_counter()
+    updated_html = template.render(article_values(title, body, filename, article_id))
+
+    # Aplicăm post-procesarea chiar înainte de salvare
+    updated_html = post_process_html(updated_html)
+
+    # Restul transformărilor rulează în memorie; fișierul se scrie o singură dată
+    updated_html = apply_post_processing(updated_html)
+
+    output_path = os.path.join(output_dir, filename)
+    with open(output_path, 'w', encoding='utf-8') as file:
+        file.write(updated_html)
+    return time.perf_counter() - start
+
+# Template-ul compilat în fiecare proces copil (o dată, la pornirea procesului)
+_worker_template = None
+
+def _init_render_worker(html_content):
+    global _worker_template
+    _worker_template = ArticleTemplate(html_content, fill_article, ARTICLE_MARKERS)
+
+def _render_in_worker(task):
+    """
+    Rulat în procesul copil: (secunde, randat prin join, aplicările regulilor),
+    ca procesul principal să adune statisticile template-ului și ale regulilor.
+    """
+    rendered = _worker_template.rendered
+    before = [dict(rules.counts) for rules in (POST_PROCESS_RULES, FINAL_RULES)]
+    seconds = render_article(_worker_template, *task)
+    fired = [{name: n - counts[name] for name, n in rules.counts.items() if n != counts[name]}
+             for rules, counts in zip((POST_PROCESS_RULES, FINAL_RULES), before)]
+    return seconds, _worker_template.rendered > rendered, fired
+
+def render_articles(tasks, template, output_dir, jobs=None, on_result=None):
+    """
+    Randează și scrie articolele, în ordine; pe procese dacă sunt destule.
+    Returnează duratele pe articol; on_result(task, secunde) se apelează după fiecare.
+    """
+    jobs = RENDER_JOBS if jobs is None else jobs
+    durations = []
+    if jobs > 1 and len(tasks) >= RENDER_PROCESS_MIN_ARTICLES:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=script_function(_init_render_worker),
+                                     initargs=(template.source,)) as pool:
+                work = [(title, body, filename, article_id, output_dir) for title, body, filename, article_id in tasks]
+                for task, (seconds, joined, fired) in zip(tasks, pool.map(script_function(_render_in_worker), work)):
+                    if joined:
+                        template.rendered += 1
+                    else:
+                        template.fallbacks += 1
+                    for rules, counts in zip((POST_PROCESS_RULES, FINAL_RULES), fired):
+                        for name, n in counts.items():
+                            rules.counts[name] += n
+                    durations.append(seconds)
+                    if on_result:
+                        on_result(task, seconds)
+        except POOL_ERRORS as e:
+            # Doar pool-ul indisponibil (procese care nu pornesc, date care nu se pot trimite);
+            # erorile articolelor (ex. fișier de ieșire blocat) se propagă
+            print(f"Randare în procese indisponibilă ({e}), continuăm în procesul curent.")
+    for task in tasks[len(durations):]:
+        title, body, filename, article_id = task
+        seconds = render_article(template, title, body, filename, article_id, output_dir)
+        durations.append(seconds)
+        if on_result:
+            on_result(task, seconds)
+    return durations
+
+def main(docx_path="bebe.docx", html_path="index.html", output_dir="output", jobs=None):
     """Funcția principală care rulează procesul de conversie"""
-    docx_path = "bebe.docx"
-    html_path = "index.html"
-    output_dir = "output"
 
     if not os.path.exists(docx_path):
         print(f"Error: File '{docx_path}' not found.")
@@ -381,43 +430,55 @@ def main():
         print("No articles found in the document.")
         return
 
+    with open(html_path, 'r', encoding='utf-8') as file:
+        html_content = file.read()
+    # Template-ul se compilează o singură dată; fiecare articol e apoi un join
+    template = ArticleTemplate(html_content, fill_article, ARTICLE_MARKERS)
+
+    tasks = []
     for title, body, article_id in articles:
         filename = generate_filename(title)
         print(f"Processing article: {title}")
         print(f"Article ID: {article_id}")
         print(f"Generated filename: {filename}")
 
-        with open(html_path, 'r', encoding='utf-8') as file:
-            html_content = file.read()
-
         if not body:
             print(f"Warning: Empty body for article '{title}'. Skipping.")
             continue
+        tasks.append((title, body, filename, article_id))
 
-        updated_html = update_html_content(html_content, title, body[0], body, filename, article_id)
-
-        # Aplicăm post-procesarea chiar înainte de salvare
-        updated_html = post_process_html(updated_html)
-
-        output_path = os.path.join(output_dir, filename)
-        with open(output_path, 'w', encoding='utf-8') as file:
-            file.write(updated_html)
+    # Articolele cu același nume de fișier: rămâne ultimul (îl suprascria oricum pe cel dinainte)
+    collisions = find_slug_collisions(tasks)
+    if collisions:
+        print(f"\nWarning: {len(collisions)} file name(s) generated by more than one article:")
+        for filename, titles in collisions.items():
+            print(f"  {filename}: {' | '.join(titles)} (keeping the last one)")
+        last_index = {task[2]: index for index, task in enumerate(tasks)}
+        tasks = [task for index, task in enumerate(tasks) if last_index[task[2]] == index]
 
-        # Reparăm probleme specifice de formatare
-        fix_specific_formatting_issues(output_path)
+    def saved(task, seconds):
+        print(f"Saved and updated meta description for: {task[2]} ({seconds:.3f}s)")
 
-        # Actualizăm meta description-ul
-        update_meta_description(output_path)
-
-        # Eliminăm paragrafele goale
-        remove_empty_paragraphs(output_path)
-
-        # Aplicăm înlocuirile finale cu regex
-        final_regex_replacements(output_path)
-
-        print(f"Saved and updated meta description for: {filename}")
+    start = time.perf_counter()
+    durations = render_articles(tasks, template, output_dir, jobs, on_result=saved)
+    elapsed = time.perf_counter() - start
 
     print("All articles have been processed successfully.")
+    print(template.report())
+    print(f"\nRendered {len(durations)} articles in {elapsed:.2f}s "
+          f"(sum of per-article times: {sum(durations):.2f}s, jobs: {jobs or RENDER_JOBS})")
+    slowest = sorted(zip(durations, tasks), key=lambda item: item[0], reverse=True)[:SLOWEST_ARTICLES]
+    for seconds, task in slowest:
+        print(f"  {seconds:.3f}s  {task[2]}")
+
+    print("\nRewrite rules fired:")
+    for line in POST_PROCESS_RULES.report() + FINAL_RULES.report():
+        print(line)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Convertește bebe.docx în fișiere HTML.")
+    parser.add_argument('--jobs', type=int, default=RENDER_JOBS,
+                        help=f"câte procese randează articolele (implicit {RENDER_JOBS}; "
+                             f"procesele pornesc de la {RENDER_PROCESS_MIN_ARTICLES} articole)")
+    args = parser.parse_args()
+    main(jobs=args.jobs)
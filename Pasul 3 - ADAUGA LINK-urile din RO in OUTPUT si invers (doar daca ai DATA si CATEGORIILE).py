@@ -1,17 +1,29 @@
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+import config
+from page_model import Page
+from script_pool import script_function, POOL_ERRORS
+
+# Indexarea directoarelor RO/OUTPUT: fire pentru citire (I/O), procese pentru extragerea regex
+INDEX_THREADS = min(32, (os.cpu_count() or 1) * 4)
+INDEX_PROCESSES = os.cpu_count() or 1   # 1 = extragerea rulează în procesul curent
+INDEX_PROCESS_MIN_FILES = 200           # sub acest număr de fișiere procesele nu se justifică
+VERBOSE_INDEX = False                   # True = afișează fiecare fișier indexat (ca înainte)
+
+# Pattern-urile ID-ului, compilate o singură dată, în ordinea în care se încearcă
+ID_PATTERNS = [
+    re.compile(r'<!-- \$item_id = (\d+); // .*? -->'),
+    re.compile(r'<!-- item_id = (\d+); -->'),
+    re.compile(r'<!-- id: (\d+) -->'),
+]
+
 def extract_item_id(file_content):
     """Extrage ID-ul articolului din comentariul HTML."""
-    patterns = [
-        r'<!-- \$item_id = (\d+); // .*? -->',
-        r'<!-- item_id = (\d+); -->',
-        r'<!-- id: (\d+) -->'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, file_content)
+    for pattern in ID_PATTERNS:
+        match = pattern.search(file_content)
         if match:
             return match.group(1)
     return None
@@ -79,6 +91,127 @@ def extract_filename_from_url(url_tag, language):
         return match.group(1)
     return None
 
+def describe_flags(file_content):
+    """Extrage o singură dată link-urile RO/EN din FLAGS (tag RO, nume fișier RO, nume fișier EN, fără .html)."""
+    _, flags_content = extract_flags_section(file_content)
+    if not flags_content:
+        return None, None, None
+
+    ro_link = extract_language_link(flags_content, 'ro')
+    ro_filename = extract_filename_from_url(ro_link, 'ro') if ro_link else None
+    en_link = extract_language_link(flags_content, 'en')
+    en_filename = extract_filename_from_url(en_link, 'en') if en_link else None
+
+    ro_base = os.path.splitext(ro_filename)[0] if ro_filename else None
+    en_base = os.path.splitext(en_filename)[0] if en_filename else None
+    return ro_link, ro_base, en_base
+
+def build_reverse_indexes(ro_files):
+    """
+    Construiește o singură dată indexurile inverse peste fișierele RO:
+    - by_en_slug: slug EN din FLAGS -> fișierele RO care indică spre el
+    - by_slug: numele fișierului RO (fără .html) -> fișier
+    - by_flags_ro: link-ul RO din propriul FLAGS -> fișier
+    Listele păstrează ordinea din ro_files, ca metodele de căutare să aleagă același fișier.
+    """
+    by_en_slug = {}
+    by_slug = {}
+    by_flags_ro = {}
+
+    for id_key, all_ro_files in ro_files.items():
+        for ro_file in all_ro_files:
+            ro_file['item_id'] = id_key
+            # FLAGS poate fi deja extras la indexare (index_directory cu with_flags=True)
+            flags = ro_file.pop('flags', None) or describe_flags(ro_file['content'])
+            ro_link, ro_base, en_base = flags
+            ro_file['flags_ro_link'] = ro_link
+            ro_file['flags_ro'] = ro_base
+            ro_file['flags_en'] = en_base
+
+            by_slug.setdefault(os.path.splitext(ro_file['filename'])[0], []).append(ro_file)
+            if en_base:
+                by_en_slug.setdefault(en_base, []).append(ro_file)
+            if ro_base:
+                by_flags_ro.setdefault(ro_base, []).append(ro_file)
+
+    return by_en_slug, by_slug, by_flags_ro
+
+def read_html_file(file_path):
+    """Citește un fișier HTML; returnează (conținut, eroare)."""
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read(), None
+    except Exception as e:
+        return None, e
+
+def scan_file_content(content, with_flags=False):
+    """Extragerea regex pentru un fișier: ID-ul și, opțional, link-urile din FLAGS."""
+    item_id = extract_item_id(content)
+    if item_id and with_flags:
+        return item_id, describe_flags(content)
+    return item_id, None
+
+def _scan_file_content_with_flags(content):
+    return scan_file_content(content, with_flags=True)
+
+def _scan_contents(contents, with_flags, processes):
+    """Rulează extragerea regex pe un pool de procese, cu revenire la procesul curent."""
+    scan = _scan_file_content_with_flags if with_flags else scan_file_content
+    if processes > 1 and len(contents) >= INDEX_PROCESS_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                chunksize = max(1, len(contents) // (processes * 4))
+                return list(pool.map(script_function(scan), contents, chunksize=chunksize))
+        except POOL_ERRORS as e:
+            print(f"  Extragere în procese indisponibilă ({e}), continuăm în procesul curent.")
+    return [scan(content) for content in contents]
+
+def index_directory(directory, label, with_flags=False, threads=None, processes=None, verbose=None):
+    """
+    Indexează fișierele .html dintr-un director: citirea pe un pool de fire,
+    extragerea ID-ului (și a FLAGS) pe un pool de procese.
+    Returnează lista de intrări {'path', 'filename', 'content', 'item_id'[, 'flags']}
+    în ordinea din os.listdir, ca rezultatul să fie identic cu indexarea serială.
+    """
+    threads = threads or INDEX_THREADS
+    processes = INDEX_PROCESSES if processes is None else processes
+    verbose = VERBOSE_INDEX if verbose is None else verbose
+
+    filenames = [filename for filename in os.listdir(directory) if filename.endswith('.html')]
+    paths = [os.path.join(directory, filename) for filename in filenames]
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(read_html_file, paths))
+
+    readable = [content for content, error in results if error is None]
+    scans = iter(_scan_contents(readable, with_flags, processes))
+
+    entries = []
+    for count, (filename, file_path, (content, error)) in enumerate(zip(filenames, paths, results), 1):
+        if verbose:
+            print(f"  Indexare {label} #{count}: {filename}")
+        if error is not None:
+            print(f"    - Eroare la citirea fișierului {filename}: {error}")
+            continue
+        item_id, flags = next(scans)
+        if not item_id:
+            if verbose:
+                print(f"    - Niciun ID găsit")
+            continue
+        if verbose:
+            print(f"    - ID găsit: {item_id}")
+        entry = {
+            'path': file_path,
+            'filename': filename,
+            'content': content,
+            'item_id': item_id
+        }
+        if with_flags:
+            entry['flags'] = flags
+        entries.append(entry)
+
+    return len(filenames), entries
+
 def is_special_term(ro_filename, en_filename):
     """
     Determină dacă perechea de URL-uri conține un termen special/străin care ar trebui păstrat.
@@ -170,9 +303,10 @@ def is_special_term(ro_filename, en_filename):
 
 def update_flags_section(file_content, ro_link, en_link, special_term=False):
     """Actualizează secțiunea FLAGS cu noile link-uri."""
-    # Extragem secțiunea FLAGS
-    flags_section, flags_content = extract_flags_section(file_content)
-    if not flags_section or not flags_content:
+    # Scanăm pagina o singură dată și lucrăm doar pe regiunea FLAGS
+    page = Page(file_content)
+    flags_content = page.get('flags')
+    if not flags_content:
         return file_content, False
 
     # Facem o copie a conținutului original pentru a verifica dacă au fost făcute modificări
@@ -263,11 +397,9 @@ def update_flags_section(file_content, ro_link, en_link, special_term=False):
     if original_flags_content == updated_flags_content:
         return file_content, False
 
-    # Reconstruim secțiunea FLAGS
-    updated_flags_section = f'<!-- FLAGS_1 -->{updated_flags_content}<!-- FLAGS -->'
-
-    # Înlocuim secțiunea veche cu cea nouă
-    return file_content.replace(flags_section, updated_flags_section), True
+    # Lipim noua secțiune FLAGS la offset-ul ei, fără a rescana fișierul
+    page.set('flags', updated_flags_content)
+    return page.text, True
 
 def process_files(ro_dir, output_dir):
     """Procesează toate fișierele și face schimbul de flags."""
@@ -278,65 +410,25 @@ def process_files(ro_dir, output_dir):
 
     # Indexăm fișierele RO după ID - stocăm lista de fișiere pentru fiecare ID
     print("\nIndexare fișiere RO...")
-    ro_file_count = 0
-    for filename in os.listdir(ro_dir):
-        if not filename.endswith('.html'):
-            continue
-
-        ro_file_count += 1
-        # Afișăm numele fișierului în timp real
-        print(f"  Indexare RO #{ro_file_count}: {filename}")
-
-        file_path = os.path.join(ro_dir, filename)
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                item_id = extract_item_id(content)
-                if item_id:
-                    ro_file_data = {
-                        'path': file_path,
-                        'filename': filename,
-                        'content': content
-                    }
-                    # Stocăm lista de fișiere pentru fiecare ID (pentru cazurile cu ID duplicat)
-                    if item_id not in ro_files:
-                        ro_files[item_id] = []
-                    ro_files[item_id].append(ro_file_data)
-                    print(f"    - ID găsit: {item_id}")
-                else:
-                    print(f"    - Niciun ID găsit")
-        except Exception as e:
-            print(f"    - Eroare la citirea fișierului: {e}")
+    ro_file_count, ro_entries = index_directory(ro_dir, 'RO', with_flags=True)
+    for entry in ro_entries:
+        item_id = entry.pop('item_id')
+        # Stocăm lista de fișiere pentru fiecare ID (pentru cazurile cu ID duplicat)
+        if item_id not in ro_files:
+            ro_files[item_id] = []
+        ro_files[item_id].append(entry)
 
     print(f"Total: {ro_file_count} fișiere RO verificate, {len(ro_files)} ID-uri unice.\n")
 
+    # Indexuri inverse pentru metodele de rezervă: o singură extragere FLAGS per fișier RO,
+    # apoi fiecare căutare este o simplă interogare de dicționar
+    ro_by_en_slug, ro_by_slug, ro_by_flags_ro = build_reverse_indexes(ro_files)
+
     # Indexăm fișierele OUTPUT după ID
     print(f"Indexare fișiere OUTPUT din {output_dir}...")
-    output_file_count = 0
-    for filename in os.listdir(output_dir):
-        if not filename.endswith('.html'):
-            continue
-
-        output_file_count += 1
-        # Afișăm numele fișierului în timp real
-        print(f"  Indexare OUTPUT #{output_file_count}: {filename}")
-
-        file_path = os.path.join(output_dir, filename)
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                item_id = extract_item_id(content)
-                if item_id:
-                    output_files[item_id] = {
-                        'path': file_path,
-                        'filename': filename,
-                        'content': content
-                    }
-                    print(f"    - ID găsit: {item_id}")
-                else:
-                    print(f"    - Niciun ID găsit")
-        except Exception as e:
-            print(f"    - Eroare la citirea fișierului: {e}")
+    output_file_count, output_entries = index_directory(output_dir, 'OUTPUT')
+    for entry in output_entries:
+        output_files[entry.pop('item_id')] = entry
 
     print(f"Total: {output_file_count} fișiere OUTPUT verificate, {len(output_files)} cu ID-uri valide.\n")
     print(f"Rezumat: {len(ro_files)} fișiere RO și {len(output_files)} fișiere OUTPUT cu ID-uri.")
@@ -373,130 +465,75 @@ def process_files(ro_dir, output_dir):
             ro_file = ro_files[item_id][0]
             print(f"  [DEBUG] GĂSIT: Fișier RO prin ID: {ro_file['filename']} (ID: {item_id})")
         
-        # METODA SECUNDARĂ: Dacă nu am găsit prin ID, căutăm printre TOATE fișierele RO unul care are link-ul EN către numele fișierului OUTPUT
+        # METODA SECUNDARĂ: Dacă nu am găsit prin ID, căutăm fișierele RO care au link-ul EN către numele fișierului OUTPUT
         # Chiar dacă majoritatea link-urilor EN sunt greșite, unele pot fi corecte
-        # IMPORTANT: Verificăm și dacă link-ul RO din fișierul RO găsit se potrivește cu numele fișierului RO
+        # IMPORTANT: Verificăm și dacă link-ul RO din fișierul RO găsit se potrivește cu link-ul RO din OUTPUT
         # pentru a evita potrivirile false cauzate de link-uri EN greșite
+        ro_filename_in_output_base = os.path.splitext(ro_filename_in_output)[0] if ro_filename_in_output else None
+        en_candidates = ro_by_en_slug.get(output_filename_base, [])
         if not ro_file:
-            ro_file_found_by_en_link = False
-            for id_key, all_ro_files in ro_files.items():
-                for candidate_ro_file in all_ro_files:
-                    candidate_flags_section, candidate_flags_content = extract_flags_section(candidate_ro_file['content'])
-                if candidate_flags_content:
-                    candidate_en_link = extract_language_link(candidate_flags_content, 'en')
-                    if candidate_en_link:
-                        candidate_en_filename = extract_filename_from_url(candidate_en_link, 'en')
-                        if candidate_en_filename:
-                            candidate_en_filename_base = os.path.splitext(candidate_en_filename)[0]
-                            if candidate_en_filename_base == output_filename_base:
-                                # Găsit un fișier RO cu link-ul EN către OUTPUT
-                                # Verificăm dacă link-ul RO din acest fișier RO se potrivește cu link-ul RO din OUTPUT
-                                candidate_ro_link = extract_language_link(candidate_flags_content, 'ro')
-                                if candidate_ro_link:
-                                    candidate_ro_filename = extract_filename_from_url(candidate_ro_link, 'ro')
-                                    if candidate_ro_filename and ro_filename_in_output:
-                                        candidate_ro_filename_base = os.path.splitext(candidate_ro_filename)[0]
-                                        ro_filename_in_output_base = os.path.splitext(ro_filename_in_output)[0]
-                                        if candidate_ro_filename_base == ro_filename_in_output_base:
-                                            # Link-ul RO se potrivește - acesta este fișierul RO corect!
-                                            ro_file = candidate_ro_file
-                                            ro_file_found_by_en_link = True
-                                            print(f"  [DEBUG] GĂSIT: Fișier RO prin potrivire link EN + verificare link RO: {ro_file['filename']} (ID: {id_key})")
-                                            break
-                                        else:
-                                            # Link-ul RO nu se potrivește - continuăm căutarea
-                                            print(f"  [DEBUG] Fișier RO găsit prin link EN dar link-ul RO nu se potrivește: {candidate_ro_file['filename']} (link RO: {candidate_ro_filename_base}, link RO din OUTPUT: {ro_filename_in_output_base})")
-                                            continue
-                                    else:
-                                        # Nu avem link RO pentru verificare - folosim acest fișier RO
-                                        ro_file = candidate_ro_file
-                                        ro_file_found_by_en_link = True
-                                        print(f"  [DEBUG] GĂSIT: Fișier RO prin potrivire link EN (fără verificare link RO): {ro_file['filename']} (ID: {id_key})")
-                                        break
-                                else:
-                                    # Nu avem link RO în fișierul RO - folosim acest fișier RO
-                                    ro_file = candidate_ro_file
-                                    ro_file_found_by_en_link = True
-                                    print(f"  [DEBUG] GĂSIT: Fișier RO prin potrivire link EN (fără link RO în fișier): {ro_file['filename']} (ID: {id_key})")
-                                    break
-                if ro_file_found_by_en_link:
+            verified = ro_by_flags_ro.get(ro_filename_in_output_base, []) if ro_filename_in_output_base else []
+            for candidate_ro_file in en_candidates:
+                if not candidate_ro_file['flags_ro_link']:
+                    # Nu avem link RO în fișierul RO - folosim acest fișier RO
+                    ro_file = candidate_ro_file
+                    print(f"  [DEBUG] GĂSIT: Fișier RO prin potrivire link EN (fără link RO în fișier): {ro_file['filename']} (ID: {ro_file['item_id']})")
                     break
-            if ro_file_found_by_en_link:
+                if candidate_ro_file['flags_ro'] and ro_filename_in_output_base:
+                    if any(candidate_ro_file is match for match in verified):
+                        # Link-ul RO se potrivește - acesta este fișierul RO corect!
+                        ro_file = candidate_ro_file
+                        print(f"  [DEBUG] GĂSIT: Fișier RO prin potrivire link EN + verificare link RO: {ro_file['filename']} (ID: {ro_file['item_id']})")
+                        break
+                    # Link-ul RO nu se potrivește - continuăm căutarea
+                    print(f"  [DEBUG] Fișier RO găsit prin link EN dar link-ul RO nu se potrivește: {candidate_ro_file['filename']} (link RO: {candidate_ro_file['flags_ro']}, link RO din OUTPUT: {ro_filename_in_output_base})")
+                    continue
+                # Nu avem link RO pentru verificare - folosim acest fișier RO
+                ro_file = candidate_ro_file
+                print(f"  [DEBUG] GĂSIT: Fișier RO prin potrivire link EN (fără verificare link RO): {ro_file['filename']} (ID: {ro_file['item_id']})")
                 break
-        
+
         # METODA SUPLIMENTARĂ 1: Folosim link-ul RO din OUTPUT pentru a găsi fișierul RO corect
         # (chiar dacă link-ul RO din OUTPUT poate fi greșit, uneori poate fi corect)
-        if not ro_file and ro_filename_in_output:
-            ro_filename_in_output_base = os.path.splitext(ro_filename_in_output)[0]
+        if not ro_file and ro_filename_in_output_base:
             print(f"  [DEBUG] Căutăm fișier RO prin link-ul RO din OUTPUT: {ro_filename_in_output_base}")
-            
-            for id_key, all_ro_files in ro_files.items():
-                for candidate_ro_file in all_ro_files:
-                    candidate_filename_base = os.path.splitext(candidate_ro_file['filename'])[0]
-                    if candidate_filename_base == ro_filename_in_output_base:
-                        # Găsit un fișier RO cu numele care se potrivește cu link-ul RO din OUTPUT
-                        # Verificăm dacă link-ul EN din acest fișier RO se potrivește cu numele fișierului OUTPUT
-                        candidate_flags_section, candidate_flags_content = extract_flags_section(candidate_ro_file['content'])
-                        if candidate_flags_content:
-                            candidate_en_link = extract_language_link(candidate_flags_content, 'en')
-                            if candidate_en_link:
-                                candidate_en_filename = extract_filename_from_url(candidate_en_link, 'en')
-                                if candidate_en_filename:
-                                    candidate_en_filename_base = os.path.splitext(candidate_en_filename)[0]
-                                    if candidate_en_filename_base == output_filename_base:
-                                        # Link-ul EN se potrivește - acesta este fișierul RO corect!
-                                        ro_file = candidate_ro_file
-                                        print(f"  [DEBUG] GĂSIT: Fișier RO prin link RO din OUTPUT + verificare link EN: {ro_file['filename']} (ID: {id_key})")
-                                        break
-                        if ro_file:
-                            break
-                if ro_file:
+
+            for candidate_ro_file in ro_by_slug.get(ro_filename_in_output_base, []):
+                # Verificăm dacă link-ul EN din acest fișier RO se potrivește cu numele fișierului OUTPUT
+                if candidate_ro_file['flags_en'] == output_filename_base:
+                    # Link-ul EN se potrivește - acesta este fișierul RO corect!
+                    ro_file = candidate_ro_file
+                    print(f"  [DEBUG] GĂSIT: Fișier RO prin link RO din OUTPUT + verificare link EN: {ro_file['filename']} (ID: {ro_file['item_id']})")
                     break
-        
+
         # METODA SUPLIMENTARĂ 2: Dacă nu am găsit prin link-ul EN cu verificare link RO,
-        # colectăm toate fișierele RO care au link-ul EN către OUTPUT și le sortăm
+        # luăm toate fișierele RO care au link-ul EN către OUTPUT și le sortăm
         # după cât de bine se potrivesc (dacă link-ul RO din fișierul RO se potrivește cu numele fișierului RO)
         if not ro_file:
             candidates = []
-            for id_key, all_ro_files in ro_files.items():
-                for candidate_ro_file in all_ro_files:
-                    candidate_flags_section, candidate_flags_content = extract_flags_section(candidate_ro_file['content'])
-                    if candidate_flags_content:
-                        candidate_en_link = extract_language_link(candidate_flags_content, 'en')
-                        if candidate_en_link:
-                            candidate_en_filename = extract_filename_from_url(candidate_en_link, 'en')
-                            if candidate_en_filename:
-                                candidate_en_filename_base = os.path.splitext(candidate_en_filename)[0]
-                                if candidate_en_filename_base == output_filename_base:
-                                    # Verificăm dacă link-ul RO din fișierul RO se potrivește cu numele fișierului RO
-                                    candidate_ro_link = extract_language_link(candidate_flags_content, 'ro')
-                                    candidate_ro_filename = None
-                                    if candidate_ro_link:
-                                        candidate_ro_filename = extract_filename_from_url(candidate_ro_link, 'ro')
-                                    
-                                    candidate_filename_base = os.path.splitext(candidate_ro_file['filename'])[0]
-                                    score = 0
-                                    if candidate_ro_filename:
-                                        candidate_ro_filename_base = os.path.splitext(candidate_ro_filename)[0]
-                                        # Dacă link-ul RO se potrivește cu numele fișierului RO, este mai probabil să fie corect
-                                        if candidate_ro_filename_base == candidate_filename_base:
-                                            score = 2
-                                        elif ro_filename_in_output and os.path.splitext(ro_filename_in_output)[0] == candidate_ro_filename_base:
-                                            score = 1
-                                    
-                                    candidates.append({
-                                        'file': candidate_ro_file,
-                                        'id': id_key,
-                                        'score': score,
-                                        'ro_filename': candidate_ro_filename
-                                    })
-            
+            for candidate_ro_file in en_candidates:
+                candidate_ro_filename_base = candidate_ro_file['flags_ro']
+                candidate_filename_base = os.path.splitext(candidate_ro_file['filename'])[0]
+                score = 0
+                if candidate_ro_filename_base:
+                    # Dacă link-ul RO se potrivește cu numele fișierului RO, este mai probabil să fie corect
+                    if candidate_ro_filename_base == candidate_filename_base:
+                        score = 2
+                    elif ro_filename_in_output_base == candidate_ro_filename_base:
+                        score = 1
+
+                candidates.append({
+                    'file': candidate_ro_file,
+                    'id': candidate_ro_file['item_id'],
+                    'score': score
+                })
+
             # Sortăm candidații după scor (cel mai mare scor este cel mai bun)
             if candidates:
                 candidates.sort(key=lambda x: x['score'], reverse=True)
                 ro_file = candidates[0]['file']
                 print(f"  [DEBUG] GĂSIT: Fișier RO prin sortare candidați: {ro_file['filename']} (ID: {candidates[0]['id']}, scor: {candidates[0]['score']})")
-        
+
         # FALLBACK FINAL: Dacă tot nu am găsit, eroare
         if not ro_file:
             print(f"  - EȘEC: Nu s-a găsit niciun fișier RO pentru OUTPUT {output_file['filename']}")
@@ -671,8 +708,8 @@ def process_files(ro_dir, output_dir):
 
 def main():
     # Definim directoarele
-    ro_dir = r'e:\Carte\BB\17 - Site Leadership\Principal\ro'
-    output_dir = r'e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python\output'
+    ro_dir = config.RO_DIR
+    output_dir = config.OUTPUT_DIR
 
     # Verificăm dacă directoarele există
     if not os.path.exists(ro_dir):
@@ -2,6 +2,9 @@ import os
 import re
 from pathlib import Path
 
+import config
+import corpus_index
+
 def translate_month(date_str):
     """Translate month from Romanian to English."""
     ro_to_en = {
@@ -254,10 +257,17 @@ def update_en_file_category(en_content, category_info):
 
     return updated_content
 
-def process_files():
-    """Process all files to update categories and dates."""
-    output_dir = r"e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python\output"
-    ro_dir = r"e:\Carte\BB\17 - Site Leadership\Principal\ro"
+def process_files(output_dir=config.OUTPUT_DIR, ro_dir=config.RO_DIR, changed_output=None, changed_ro=None):
+    """
+    Process all files to update categories and dates.
+
+    When changed_output/changed_ro are given (sets of filenames changed since the
+    last run), only output files that changed, or whose Romanian match changed,
+    are rewritten.
+    """
+    incremental = changed_output is not None or changed_ro is not None
+    changed_output = changed_output or set()
+    changed_ro = changed_ro or set()
 
     if not os.path.exists(output_dir):
         print(f"ERROR: Output directory does not exist: {output_dir}")
@@ -275,37 +285,23 @@ def process_files():
     ro_files_by_name = {}
     ro_files_count = 0
 
-# In the process_files function, modify the Romanian files indexing section:
+    # Romanian files come from the persistent corpus index: only files whose
+    # mtime/size changed are re-read, and content is loaded only for matches
     print(f"Indexing files from Romanian directory: {ro_dir}")
-    for filename in os.listdir(ro_dir):
-        if not filename.endswith('.html'):
-            continue
-
+    for page in corpus_index.load_folder(ro_dir, 'ro'):
         ro_files_count += 1
-        file_path = os.path.join(ro_dir, filename)
-        print(f"  [Debug] Indexing RO file: {filename}")
-        content = read_file_with_fallback_encoding(file_path)
+        filename = page['filename']
+        ro_file_data = {
+            'path': page['path'],
+            'filename': filename
+        }
 
-        if content:
-            # Index by ID
-            item_id = extract_item_id(content)
-            if item_id:
-                ro_files_by_id[item_id] = {
-                    'path': file_path,
-                    'filename': filename,
-                    'content': content
-                }
-                print(f"  [Debug] Indexed by ID: {item_id}")
-
-            # Index by filename without extension
-            base_filename = os.path.splitext(filename)[0]
-            ro_files_by_name[base_filename] = {
-                'path': file_path,
-                'filename': filename,
-                'content': content
-            }
-            print(f"  [Debug] Indexed by name: {base_filename}")
-        print("")  # Add an empty line between files for better readability
+        # Index by ID
+        if page['item_id'] is not None:
+            ro_files_by_id[str(page['item_id'])] = ro_file_data
+
+        # Index by filename without extension
+        ro_files_by_name[page['slug']] = ro_file_data
 
     print(f"Indexed {len(ro_files_by_id)} files by ID from {ro_files_count} Romanian files")
     print(f"Indexed {len(ro_files_by_name)} files by name from {ro_files_count} Romanian files\n")
@@ -314,6 +310,7 @@ def process_files():
     output_files_count = 0
     updated_files_count = 0
     error_files_count = 0
+    unchanged_files_count = 0
 
     for filename in os.listdir(output_dir):
         if not filename.endswith('.html'):
@@ -374,7 +371,15 @@ def process_files():
             error_files_count += 1
             continue
 
-        # Extract category info from Romanian file
+        # Incremental run: neither this file nor its Romanian match changed
+        if incremental and filename not in changed_output and ro_file['filename'] not in changed_ro:
+            print(f"  Unchanged since last run, skipping.")
+            unchanged_files_count += 1
+            continue
+
+        # Extract category info from Romanian file (read only now that it matched)
+        if 'content' not in ro_file:
+            ro_file['content'] = read_file_with_fallback_encoding(ro_file['path'])
         category_info = extract_category_info(ro_file['content'])
 
         if not category_info:
@@ -407,6 +412,8 @@ def process_files():
     print(f"- Total files in output directory: {output_files_count}")
     print(f"- Successfully updated files: {updated_files_count}")
     print(f"- Files with errors: {error_files_count}")
+    if incremental:
+        print(f"- Unchanged files skipped: {unchanged_files_count}")
     print("=" * 60)
     print("Processing complete!")
 
@@ -4,15 +4,17 @@ import shutil
 from bs4 import BeautifulSoup, Comment
 from datetime import datetime, timedelta
 
+import config
+
 # Track processing start time
 START_TIME = datetime.now()
 
 # Configuration
 DEBUG = True
-OUTPUT_DIR = r"e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python\output"
-EN_DIR = r"e:\Carte\BB\17 - Site Leadership\Principal\en"
-RO_DIR = r"e:\Carte\BB\17 - Site Leadership\Principal\ro"
-BACKUP_DIR = r"c:\Folder1\fisiere_html"
+OUTPUT_DIR = config.OUTPUT_DIR
+EN_DIR = config.EN_DIR
+RO_DIR = config.RO_DIR
+BACKUP_DIR = config.BACKUP_DIR
 
 def log(message):
     if DEBUG:
@@ -1,6 +1,41 @@
+import io
 import os
-from bs4 import BeautifulSoup, Comment
+import re
 import time
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup, Comment
+
+import config
+from script_pool import script_function, POOL_ERRORS
+
+# Procese pentru fișierele categorii (1 = în procesul curent, unul după altul)
+CATEGORY_WORKERS = os.cpu_count() or 1
+
+BASE_URL = "https://neculaifantanaru.com"
+HREF_PATTERN = re.compile(r'href="([^"]+)"')
+
+# Lista fișierelor categorii
+CATEGORY_FILES = [
+    "index.html", "leadership-and-attitude.html", "leadership-magic.html",
+    "successful-leadership.html", "hr-human-resources.html", "leadership-laws.html",
+    "total-leadership.html", "leadership-that-lasts.html", "leadership-principles.html",
+    "leadership-plus.html", "qualities-of-a-leader.html", "top-leadership.html",
+    "leadership-impact.html", "personal-development.html", "leadership-skills-and-abilities.html",
+    "real-leadership.html", "basic-leadership.html", "leadership-360.html",
+    "leadership-pro.html", "leadership-expert.html", "leadership-know-how.html",
+    "leadership-journal.html", "alpha-leadership.html", "leadership-on-off.html",
+    "leadership-deluxe.html", "leadership-xxl.html", "leadership-50-extra.html",
+    "leadership-fusion.html", "leadership-v8.html", "leadership-x3-silver.html",
+    "leadership-q2-sensitive.html", "leadership-t7-hybrid.html", "leadership-n6-celsius.html",
+    "leadership-s4-quartz.html", "leadership-gt-accent.html", "leadership-fx-intensive.html",
+    "leadership-iq-light.html", "leadership-7th-edition.html", "leadership-xs-analytics.html",
+    "leadership-z3-extended.html", "leadership-ex-elite.html", "leadership-w3-integra.html",
+    "leadership-sx-experience.html", "leadership-y5-superzoom.html", "performance-ex-flash.html",
+    "leadership-mindware.html", "leadership-r2-premiere.html", "leadership-y4-titanium.html",
+    "leadership-quantum-xx.html"
+]
 
 def get_local_file_path_from_url(url, base_local_path):
     """Convertește URL-ul într-o cale de fișier local"""
@@ -11,139 +46,139 @@ def get_local_file_path_from_url(url, base_local_path):
         return os.path.join(base_local_path, filename)
     return None
 
-def get_image_from_local_file(file_path):
-    """Extrage imaginea din fișierul HTML local cu debugging îmbunătățit"""
-    try:
-        if not os.path.exists(file_path):
-            print(f"    Fișierul nu există: {file_path}")
-            return None, None
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+# Rezultatele extragerii pe fișier, refolosite în toate fișierele categorii din aceeași rulare
+# (același articol apare în multe pagini de categorii)
+ARTICLE_INFO_CACHE = {}
 
-        print(f"    Citit fișier local: {file_path} ({len(content)} caractere)")
-        soup = BeautifulSoup(content, 'html.parser')
+def youtube_thumbnail(iframe):
+    """Thumbnail-ul și titlul pentru un iframe YouTube (sau None)"""
+    if iframe and 'youtube.com/embed/' in str(iframe.get('src', '')):
+        video_id = iframe.get('src').split('/embed/')[-1].split('?')[0]
+        return video_id, f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg", iframe.get('title', 'Video YouTube')
+    return None
 
-        # Caută imaginea în feature-img-wrap
-        feature_img = soup.find('div', class_='feature-img-wrap')
-        if feature_img:
-            print(f"    Găsit feature-img-wrap")
-
-            # Caută imagine directă
-            img = feature_img.find('img')
-            if img and img.get('src'):
-                img_src = img.get('src')
-                img_alt = img.get('alt', '')
-                print(f"    Găsită imagine directă: {img_src}")
-                return img_src, img_alt
-
-            # Caută iframe pentru video YouTube - direct
-            iframe = feature_img.find('iframe')
-            if iframe and 'youtube.com/embed/' in str(iframe.get('src', '')):
-                iframe_src = iframe.get('src')
-                video_id = iframe_src.split('/embed/')[-1].split('?')[0]
-                thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                title = iframe.get('title', 'Video YouTube')
-                print(f"    Găsit YouTube iframe direct: {video_id}")
-                return thumbnail_url, title
-
-            # Caută iframe înglobat în div embed-responsive
+def extract_image(soup):
+    """Imaginea articolului: (src, alt, id video YouTube sau None)"""
+    # Caută imaginea în feature-img-wrap
+    feature_img = soup.find('div', class_='feature-img-wrap')
+    if feature_img:
+        # Caută imagine directă
+        img = feature_img.find('img')
+        if img and img.get('src'):
+            return img.get('src'), img.get('alt', ''), None
+
+        # Caută iframe pentru video YouTube - direct, apoi înglobat în div embed-responsive
+        video = youtube_thumbnail(feature_img.find('iframe'))
+        if not video:
             embed_div = feature_img.find('div', class_='embed-responsive')
             if embed_div:
-                print(f"    Găsit embed-responsive div")
-                iframe = embed_div.find('iframe')
-                if iframe and 'youtube.com/embed/' in str(iframe.get('src', '')):
-                    iframe_src = iframe.get('src')
-                    video_id = iframe_src.split('/embed/')[-1].split('?')[0]
-                    thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                    title = iframe.get('title', 'Video YouTube')
-                    print(f"    Găsit YouTube iframe înglobat: {video_id}")
-                    return thumbnail_url, title
-
-        # Fallback - caută orice imagine cu 'images/'
-        print(f"    Caut fallback imagini...")
-        for img in soup.find_all('img'):
-            src = img.get('src', '')
-            if 'images/' in src and not src.endswith('.gif'):
-                print(f"    Găsită imagine fallback: {src}")
-                return src, img.get('alt', '')
-
-        print(f"    Nu s-a găsit nicio imagine validă")
-        return None, None
-
-    except Exception as e:
-        print(f"    Eroare la citirea fișierului local {file_path}: {e}")
-        return None, None
+                video = youtube_thumbnail(embed_div.find('iframe'))
+        if video:
+            video_id, thumbnail_url, title = video
+            return thumbnail_url, title, video_id
+
+    # Fallback - caută orice imagine cu 'images/'
+    for img in soup.find_all('img'):
+        src = img.get('src', '')
+        if 'images/' in src and not src.endswith('.gif'):
+            return src, img.get('alt', ''), None
+
+    return None, None, None
+
+def extract_lead(soup):
+    """Lead-ul articolului"""
+    # Caută lead-ul în <h2 class="text_obisnuit2">
+    lead_h2 = soup.find('h2', class_='text_obisnuit2')
+    if lead_h2:
+        return lead_h2.get_text(strip=True)
+
+    # Fallback: caută în div cu itemprop="articleBody"
+    article_body = soup.find('div', itemprop='articleBody')
+    if article_body:
+        for p in article_body.find_all(['p', 'h2']):
+            if p.get_text(strip=True) and len(p.get_text(strip=True)) > 20:
+                return p.get_text(strip=True)
+
+    return ""
+
+def extract_article_info(file_path):
+    """O singură citire și o singură parsare: imagine, alt, thumbnail YouTube și lead"""
+    info = {'image': None, 'alt': None, 'youtube': None, 'lead': ""}
+    if not os.path.exists(file_path):
+        print(f"    Fișierul nu există: {file_path}")
+        return info
 
-def get_lead_from_local_file(file_path):
-    """Extrage lead-ul din fișierul local"""
     try:
-        if not os.path.exists(file_path):
-            print(f"    Fișierul nu există pentru lead: {file_path}")
-            return ""
-
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-
         soup = BeautifulSoup(content, 'html.parser')
+    except Exception as e:
+        print(f"    Eroare la citirea fișierului local {file_path}: {e}")
+        return info
 
-        # Caută lead-ul în <h2 class="text_obisnuit2">
-        lead_h2 = soup.find('h2', class_='text_obisnuit2')
-        if lead_h2:
-            lead_text = lead_h2.get_text(strip=True)
-            print(f"    Lead găsit în h2: {lead_text[:100]}...")
-            return lead_text
-
-        # Fallback: caută în div cu itemprop="articleBody"
-        article_body = soup.find('div', itemprop='articleBody')
-        if article_body:
-            for p in article_body.find_all(['p', 'h2']):
-                if p.get_text(strip=True) and len(p.get_text(strip=True)) > 20:
-                    lead_text = p.get_text(strip=True)
-                    print(f"    Lead găsit în articleBody: {lead_text[:100]}...")
-                    return lead_text
-
-        print(f"    Nu s-a găsit lead în fișierul local")
-        return ""
+    try:
+        info['image'], info['alt'], info['youtube'] = extract_image(soup)
+    except Exception as e:
+        print(f"    Eroare la extragerea imaginii din {file_path}: {e}")
 
+    try:
+        info['lead'] = extract_lead(soup)
     except Exception as e:
         print(f"    Eroare la extragerea lead-ului: {e}")
-        return ""
+
+    return info
+
+def get_article_info(file_path):
+    """extract_article_info memoizat pe cale, pentru toată rularea"""
+    if file_path not in ARTICLE_INFO_CACHE:
+        ARTICLE_INFO_CACHE[file_path] = extract_article_info(file_path)
+    return ARTICLE_INFO_CACHE[file_path]
+
+def full_article_url(url, base_url=BASE_URL):
+    """URL-ul complet al unui link din fișierul categorii"""
+    if url.startswith('/'):
+        return base_url + url
+    elif not url.startswith('http'):
+        return base_url + '/' + url
+    return url
+
+def local_file_name(url):
+    """Numele fișierului local pentru un URL de articol (sau None dacă nu e de pe site)"""
+    if url.startswith('https://neculaifantanaru.com/en/'):
+        file_name = url.replace('https://neculaifantanaru.com/en/', '')
+    elif url.startswith('https://neculaifantanaru.com/'):
+        file_name = url.replace('https://neculaifantanaru.com/', '')
+    else:
+        return None
+
+    if not file_name.endswith('.html'):
+        file_name += '.html'
+    return file_name
 
 def get_image_and_lead_from_local_folders(url, priority_folder, individual_files_folder):
     """Extrage imaginea și lead-ul din fișiere locale - fără requests HTTP"""
     try:
         # Extrage numele fișierului din URL
-        if url.startswith('https://neculaifantanaru.com/en/'):
-            file_name = url.replace('https://neculaifantanaru.com/en/', '')
-        elif url.startswith('https://neculaifantanaru.com/'):
-            file_name = url.replace('https://neculaifantanaru.com/', '')
-        else:
+        file_name = local_file_name(url)
+        if file_name is None:
             return None, None, ""
 
-        if not file_name.endswith('.html'):
-            file_name += '.html'
-
         # Caută mai întâi în folderul prioritar
-        priority_path = os.path.join(priority_folder, file_name)
-        print(f"    Caut în folder prioritar: {priority_path}")
-        img_src, img_alt = get_image_from_local_file(priority_path)
-        lead = get_lead_from_local_file(priority_path)
+        info = get_article_info(os.path.join(priority_folder, file_name))
+        lead = info['lead']
 
-        if img_src:
-            print(f"    Găsit în folder prioritar: imagine={img_src}, lead={lead[:50]}...")
-            return img_src, img_alt, lead
+        if info['image']:
+            print(f"    Găsit în folder prioritar: imagine={info['image']}, lead={lead[:50]}...")
+            return info['image'], info['alt'], lead
 
         # Caută în folderul cu fișiere individuale
-        individual_path = os.path.join(individual_files_folder, file_name)
-        print(f"    Caut în folder individual: {individual_path}")
-        img_src, img_alt = get_image_from_local_file(individual_path)
+        info = get_article_info(os.path.join(individual_files_folder, file_name))
         if not lead:  # Doar dacă nu am găsit lead în priority
-            lead = get_lead_from_local_file(individual_path)
+            lead = info['lead']
 
-        if img_src:
-            print(f"    Găsit în folder individual: imagine={img_src}, lead={lead[:50]}...")
-            return img_src, img_alt, lead
+        if info['image']:
+            print(f"    Găsit în folder individual: imagine={info['image']}, lead={lead[:50]}...")
+            return info['image'], info['alt'], lead
 
         print(f"    Nu s-a găsit în niciun folder local")
         return None, None, lead  # Returnează lead-ul chiar dacă nu găsim imaginea
@@ -152,7 +187,7 @@ def get_image_and_lead_from_local_folders(url, priority_folder, individual_files
         print(f"Eroare la căutarea în foldere locale pentru {url}: {e}")
         return None, None, ""
 
-def process_html_file(file_path, priority_folder, individual_files_folder, base_url="https://neculaifantanaru.com"):
+def process_html_file(file_path, priority_folder, individual_files_folder, base_url=BASE_URL):
     """Procesează fișierul HTML cu căutare în două foldere locale"""
 
     print(f"Procesez: {file_path}")
@@ -265,12 +300,7 @@ def process_html_file(file_path, priority_folder, individual_files_folder, base_
                 current_description = desc_p.get_text(strip=True) if desc_p else ""
 
                 # URL complet
-                if url.startswith('/'):
-                    full_url = base_url + url
-                elif not url.startswith('http'):
-                    full_url = base_url + '/' + url
-                else:
-                    full_url = url
+                full_url = full_article_url(url, base_url)
 
                 # Extrage imaginea și lead-ul din fișiere locale
                 img_src, img_alt, lead_description = get_image_and_lead_from_local_folders(
@@ -354,7 +384,6 @@ def process_html_file(file_path, priority_folder, individual_files_folder, base_
 </article>'''
 
                 new_articles.append(new_article_html)
-                time.sleep(0.1)  # Pauză mică pentru fișiere locale
 
             except Exception as e:
                 print(f"    Eroare la procesarea articolului: {e}")
@@ -386,49 +415,143 @@ def process_html_file(file_path, priority_folder, individual_files_folder, base_
     except Exception as e:
         print(f"✗ Eroare la procesarea {file_path}: {e}")
 
-def main():
-    # Lista fișierelor categorii
-    category_files = [
-        "index.html", "leadership-and-attitude.html", "leadership-magic.html",
-        "successful-leadership.html", "hr-human-resources.html", "leadership-laws.html",
-        "total-leadership.html", "leadership-that-lasts.html", "leadership-principles.html",
-        "leadership-plus.html", "qualities-of-a-leader.html", "top-leadership.html",
-        "leadership-impact.html", "personal-development.html", "leadership-skills-and-abilities.html",
-        "real-leadership.html", "basic-leadership.html", "leadership-360.html",
-        "leadership-pro.html", "leadership-expert.html", "leadership-know-how.html",
-        "leadership-journal.html", "alpha-leadership.html", "leadership-on-off.html",
-        "leadership-deluxe.html", "leadership-xxl.html", "leadership-50-extra.html",
-        "leadership-fusion.html", "leadership-v8.html", "leadership-x3-silver.html",
-        "leadership-q2-sensitive.html", "leadership-t7-hybrid.html", "leadership-n6-celsius.html",
-        "leadership-s4-quartz.html", "leadership-gt-accent.html", "leadership-fx-intensive.html",
-        "leadership-iq-light.html", "leadership-7th-edition.html", "leadership-xs-analytics.html",
-        "leadership-z3-extended.html", "leadership-ex-elite.html", "leadership-w3-integra.html",
-        "leadership-sx-experience.html", "leadership-y5-superzoom.html", "performance-ex-flash.html",
-        "leadership-mindware.html", "leadership-r2-premiere.html", "leadership-y4-titanium.html",
-        "leadership-quantum-xx.html"
-    ]
-
+def categories_to_process(priority_folder, changed_names):
+    """Fișierele categorii care s-au schimbat sau care au link spre un articol schimbat"""
+    affected = set()
+    for file_name in CATEGORY_FILES:
+        if file_name in changed_names:
+            affected.add(file_name)
+            continue
+        file_path = os.path.join(priority_folder, file_name)
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        if any(f'/en/{name}' in content for name in changed_names):
+            affected.add(file_name)
+    return affected
+
+def linked_article_paths(category_paths, priority_folder, individual_files_folder):
+    """Căile fișierelor articol spre care trimit fișierele categorii (din regiunea ARTICOL)"""
+    paths = []
+    seen = set()
+    for category_path in category_paths:
+        with open(category_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        if 'article-card-new' in content:
+            continue
+        start_pos = content.find('<!-- ARTICOL START -->')
+        end_pos = content.find('<!-- ARTICOL FINAL -->')
+        if start_pos == -1 or end_pos == -1:
+            continue
+        for url in HREF_PATTERN.findall(content, start_pos, end_pos):
+            file_name = local_file_name(full_article_url(url))
+            if file_name is None:
+                continue
+            for folder in (priority_folder, individual_files_folder):
+                path = os.path.join(folder, file_name)
+                if path not in seen:
+                    seen.add(path)
+                    paths.append(path)
+    return paths
+
+def build_article_table(article_paths, workers):
+    """Tabelul imagine/lead pentru toate articolele, construit o dată (în paralel dacă se poate)"""
+    existing = [path for path in article_paths if os.path.exists(path)]
+    infos = None
+    if workers > 1 and len(existing) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(existing) // (workers * 4))
+                infos = list(pool.map(script_function(extract_article_info), existing, chunksize=chunksize))
+        except POOL_ERRORS as e:
+            print(f"Procese indisponibile ({e}), construim tabelul în procesul curent.")
+    if infos is None:
+        infos = [extract_article_info(path) for path in existing]
+    table = dict(zip(existing, infos))
+    # Și fișierele lipsă intră în tabel, ca niciun proces să nu le mai caute
+    for path in article_paths:
+        if path not in table:
+            table[path] = extract_article_info(path)
+    return table
+
+def _init_category_worker(article_table):
+    """Fiecare proces primește tabelul gata construit (doar pentru citire)"""
+    ARTICLE_INFO_CACHE.update(article_table)
+
+def _process_category_file(args):
+    """Procesează un fișier categorii și returnează tot ce a afișat, ca ordinea să fie fixă"""
+    file_path, priority_folder, individual_files_folder = args
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        process_html_file(file_path, priority_folder, individual_files_folder)
+    return buffer.getvalue()
+
+def process_category_files(category_paths, priority_folder, individual_files_folder, article_table, workers):
+    """Rulează fișierele categorii pe un pool de procese; returnează jurnalele în ordinea listei"""
+    tasks = [(path, priority_folder, individual_files_folder) for path in category_paths]
+    if workers > 1 and len(tasks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=script_function(_init_category_worker),
+                                     initargs=(article_table,)) as pool:
+                return list(pool.map(script_function(_process_category_file), tasks))
+        except POOL_ERRORS as e:
+            print(f"Procese indisponibile ({e}), continuăm în procesul curent.")
+    _init_category_worker(article_table)
+    return [_process_category_file(task) for task in tasks]
+
+def main(priority_folder=config.PRINCIPAL_2022_EN_DIR, individual_files_folder=config.PRINCIPAL_2022_EN_DIR, only=None, workers=None):
+    """only: mulțimea fișierelor categorii de procesat (None = toate)"""
     # Căile folderelor - FOLDERUL PRINCIPAL EN
-    priority_folder = r"e:\Carte\BB\17 - Site Leadership\Principal 2022\en"          # Fișierele categorii + individuale
-    individual_files_folder = r"e:\Carte\BB\17 - Site Leadership\Principal 2022\en"  # Același folder pentru imagini/lead
+    # priority_folder: fișierele categorii + individuale
+    # individual_files_folder: același folder pentru imagini/lead
+    workers = CATEGORY_WORKERS if workers is None else workers
 
     print("Începe procesarea cu căutare DOAR în foldere locale...")
     print(f"Folder prioritar (categorii): {priority_folder}")
     print(f"Folder fișiere individuale: {individual_files_folder}")
     print("=" * 60)
+    start_time = time.perf_counter()
 
     # Procesez doar fișierele din lista categorii care există în folderul prioritar
+    skipped_files = 0
+    selected = []
+    for file_name in CATEGORY_FILES:
+        if only is not None and file_name not in only:
+            skipped_files += 1
+            continue
+        selected.append(file_name)
+    category_paths = [os.path.join(priority_folder, file_name) for file_name in selected
+                      if os.path.exists(os.path.join(priority_folder, file_name))]
+
+    # Tabelul imagine/lead se construiește o singură dată și e partajat de toate procesele
+    article_paths = linked_article_paths(category_paths, priority_folder, individual_files_folder)
+    article_table = build_article_table(article_paths, workers)
+    table_time = time.perf_counter() - start_time
+    print(f"Tabel articole: {len(article_table)} fișiere în {table_time:.2f}s")
+    print("=" * 60)
+
+    logs = dict(zip(category_paths, process_category_files(
+        category_paths, priority_folder, individual_files_folder, article_table, workers)))
+
+    # Afișăm jurnalele în ordinea listei, indiferent de ordinea în care au terminat procesele
     processed_files = 0
-    for file_name in category_files:
+    for file_name in selected:
         file_path = os.path.join(priority_folder, file_name)
-        if os.path.exists(file_path):
-            process_html_file(file_path, priority_folder, individual_files_folder)
+        if file_path in logs:
+            print(logs[file_path], end='')
             processed_files += 1
         else:
             print(f"- Nu există în folder prioritar: {file_name}")
         print("-" * 30)
 
+    elapsed = time.perf_counter() - start_time
+    rate = processed_files / elapsed if elapsed > 0 else 0.0
     print(f"Finalizat! Procesate {processed_files} fișiere folosind doar resurse locale.")
+    print(f"Articole distincte: {len(article_table)}")
+    print(f"Timp total: {elapsed:.2f}s ({rate:.1f} fișiere/s, {workers} procese)")
+    if skipped_files:
+        print(f"Sărite {skipped_files} fișiere categorii neschimbate de la ultima rulare.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,6 +5,15 @@ from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from datetime import datetime
 
+from article_template import ArticleTemplate
+
+# Anchors used by the substitutions in fill_article; articles whose values contain
+# one of them are rendered with the full substitution chain instead of the compiled template
+ARTICLE_MARKERS = (
+    '<h1 class="den_articol" itemprop="name">', '</h1>', 'zzz.html', '<meta name="description" content="',
+    '<!-- SASA-1 -->', '<!-- SASA-2 -->',
+)
+
 def make_links_clickable(text):
     return re.sub(r'(https?://[^\s]+)', r'<a href="\1">\1</a>', text)
 
@@ -225,50 +234,68 @@ def update_flags_section(html_content, ro_link, en_filename):
 
     return modified_html
 
-def update_html_content(html_content, title, body, filename, article_id, date, category, ro_link):
-    """Update all necessary parts of the HTML content."""
-    print(f"\nUpdating HTML for article: {title}")
-    print(f"ID: {article_id}, Filename: {filename}")
+def article_values(title, body, filename, article_id):
+    """Values of one article for fill_article."""
+    title_without_diacritics = remove_diacritics(title)
+    return {
+        'article_id': article_id,
+        'capitalized_title': capitalize_title(title_without_diacritics),
+        'capitalized_h1': capitalize_title(title),
+        'filename': filename,
+        'bold_text': extract_bold_from_body(body),
+        'formatted_body': format_body(body),
+    }
 
+def fill_article(html_content, values):
+    """Put the article values (article_values) into the template. The FLAGS section is updated afterwards, in update_html_content."""
     # 1. Update article ID
-    if article_id:
-        id_comment = f'<!-- $item_id = {article_id}; // ID-ul din fisierul limba romana -->\n'
+    if values['article_id']:
+        id_comment = f'<!-- $item_id = {values["article_id"]}; // ID-ul din fisierul limba romana -->\n'
         if '<!-- $item_id =' not in html_content:
             html_content = id_comment + html_content
         else:
             html_content = re.sub(r'<!-- \$item_id = \d+;.*?-->\n?', id_comment, html_content)
-        print(f"Updated article ID to: {article_id}")
 
-    # 2. Update title and capitalize
-    title_without_diacritics = remove_diacritics(title)
-    capitalized_title = capitalize_title(title_without_diacritics)
-
-    # Update <title> tag
-    html_content = re.sub(r'<title>.*?</title>', f'<title>{capitalized_title} | Neculai Fantanaru (en)</title>', html_content)
-    print(f"Updated page title to: {capitalized_title} | Neculai Fantanaru (en)")
-
-    # Update article title (h1)
-    html_content = re.sub(r'<h1 class="den_articol" itemprop="name">.*?</h1>', f'<h1 class="den_articol" itemprop="name">{capitalize_title(title)}</h1>', html_content)
-    print(f"Updated article title to: {capitalize_title(title)}")
+    # 2. Update <title> tag and article title (h1)
+    html_content = re.sub(r'<title>.*?</title>', f'<title>{values["capitalized_title"]} | Neculai Fantanaru (en)</title>', html_content)
+    html_content = re.sub(r'<h1 class="den_articol" itemprop="name">.*?</h1>', f'<h1 class="den_articol" itemprop="name">{values["capitalized_h1"]}</h1>', html_content)
 
     # 3. Update filename references
-    html_content = html_content.replace('zzz.html', filename)
-    print(f"Updated filename references to: {filename}")
+    html_content = html_content.replace('zzz.html', values['filename'])
 
     # 4. Update meta description
-    bold_text = extract_bold_from_body(body)
-    html_content = re.sub(r'<meta name="description" content=".*?">', f'<meta name="description" content="{bold_text}">', html_content)
-    print("Updated meta description with bold text from article")
+    html_content = re.sub(r'<meta name="description" content=".*?">', f'<meta name="description" content="{values["bold_text"]}">', html_content)
 
     # 5. Update article body
-    formatted_body = format_body(body)
-    html_content = re.sub(r'<!-- SASA-1 -->.*?<!-- SASA-2 -->', f'<!-- SASA-1 -->\n{formatted_body}\n<!-- SASA-2 -->', html_content, flags=re.DOTALL)
+    html_content = re.sub(r'<!-- SASA-1 -->.*?<!-- SASA-2 -->', f'<!-- SASA-1 -->\n{values["formatted_body"]}\n<!-- SASA-2 -->', html_content, flags=re.DOTALL)
+
+    return html_content
+
+def update_html_content(html_content, title, body, filename, article_id, date, category, ro_link, template=None):
+    """
+    Update all necessary parts of the HTML content. With a template compiled from
+    html_content (ArticleTemplate), the page is a single join on it; the FLAGS
+    section is then updated for every article, with its diagnostics.
+    """
+    print(f"\nUpdating HTML for article: {title}")
+    print(f"ID: {article_id}, Filename: {filename}")
+
+    values = article_values(title, body, filename, article_id)
+    if article_id:
+        print(f"Updated article ID to: {article_id}")
+    print(f"Updated page title to: {values['capitalized_title']} | Neculai Fantanaru (en)")
+    print(f"Updated article title to: {values['capitalized_h1']}")
+    print(f"Updated filename references to: {filename}")
+    print("Updated meta description with bold text from article")
     print("Updated article body content")
 
-    # 6. Update flags section
-    html_content = update_flags_section(html_content, ro_link, filename)
+    if template is not None:
+        html_content = template.render(values)
+    else:
+        html_content = fill_article(html_content, values)
 
-    return html_content
+    # 6. Update flags section
+    return update_flags_section(html_content, ro_link, filename)
 
 def post_process_html(html_content):
     replacements = {
@@ -390,22 +417,24 @@ def main():
         print("No articles found in the document.")
         return
 
+    with open(html_path, 'r', encoding='utf-8') as file:
+        html_content = file.read()
+    # Compiled once; each article is then a join on it
+    template = ArticleTemplate(html_content, fill_article, ARTICLE_MARKERS)
+
     for title, body, article_id, date, category, ro_link in articles:
         filename = generate_filename(title)
         print(f"Processing article: {title}")
         print(f"Article ID: {article_id}")
         print(f"Generated filename: {filename}")
 
-        with open(html_path, 'r', encoding='utf-8') as file:
-            html_content = file.read()
-
         if not body:
             print(f"Warning: Empty body for article '{title}'. Skipping.")
             continue
 
         updated_html = update_html_content(
             html_content, title, body, filename,
-            article_id, date, category, ro_link
+            article_id, date, category, ro_link, template
         )
         updated_html = post_process_html(updated_html)
 
@@ -420,6 +449,7 @@ def main():
         print(f"Saved and updated meta description for: {filename}")
 
     print("All articles have been processed successfully.")
+    print(template.report())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Template de articol compilat o singură dată: bucăți de text fix și goluri cu nume.
+
+Pasul 2, TESTAREA.py și parserul txt Eisenstein randau fiecare articol rulând
+lanțul lor de re.sub (titlu, h1, canonical, meta description, SASA, data,
+FLAGS, $item_id) pe tot index.html. Aici lanțul scriptului (fill) rulează o
+singură dată pe template, cu santinele în locul valorilor; textul rezultat se
+taie la santinele în bucăți fixe și goluri, iar un articol e apoi un singur
+join. Pașii care depind de valori doar prin "e goală sau nu" (ex. `if
+article_id:`) dau forme diferite ale template-ului, compilate fiecare la prima
+folosire.
+
+Join-ul dă exact textul lanțului cât timp valorile nu schimbă ce găsesc
+pattern-urile. Pentru un articol cu o valoare care conține un backslash (re.sub
+l-ar interpreta), unul dintre marcajele pe care se ancorează pattern-urile
+(markers), un rând nou într-un gol care nu stă între rânduri sau pe care
+scriptul o respinge (unsafe, ex. o cifră imediat după o referință \\1 din
+șablonul de înlocuire), render() rulează lanțul vechi, ca până acum.
+
+    template = ArticleTemplate(html_content, fill_article, markers=ARTICLE_MARKERS)
+    page = template.render(article_values(title, body, filename, article_id))
+    print(template.report())
+
+Verificarea față de lanțul de înlocuiri: benchmark_article_template.py
+"""
+
+import io
+import re
+import contextlib
+
+# Caractere din zona de uz privat Unicode, care nu apar în pagini
+SENTINEL_START = '\ue000'
+SENTINEL_END = '\ue001'
+SENTINEL_PATTERN = re.compile(f'{SENTINEL_START}(\\w+){SENTINEL_END}')
+
+def sentinel(name):
+    return f'{SENTINEL_START}{name}{SENTINEL_END}'
+
+class CompiledTemplate:
+    """O formă a template-ului: bucăți fixe și goluri, în ordine"""
+
+    __slots__ = ('shape', 'parts', 'slots', 'line_holes')
+
+    def __init__(self, shape, parts, slots):
+        self.shape = shape  # valorile puse ca santinele (toate contează pentru lanț, chiar dacă golul dispare)
+        self.parts = parts  # textul fix, cu None în locul golurilor
+        self.slots = slots  # (poziție în parts, nume gol)
+        # Golurile care stau numai între două rânduri (pot primi valori pe mai multe rânduri)
+        names = {name for _, name in slots}
+        self.line_holes = {name for name in names if all(self._between_lines(i) for i, n in slots if n == name)}
+
+    @classmethod
+    def from_text(cls, shape, text):
+        """Taie textul produs cu santinele în bucăți fixe și goluri"""
+        parts = []
+        slots = []
+        for index, piece in enumerate(SENTINEL_PATTERN.split(text)):
+            if index % 2:
+                slots.append((len(parts), piece))
+                parts.append(None)
+            elif piece:
+                parts.append(piece)
+        return cls(shape, parts, slots)
+
+    def _between_lines(self, position):
+        before = self.parts[position - 1] if position > 0 else '\n'
+        after = self.parts[position + 1] if position + 1 < len(self.parts) else '\n'
+        return before is not None and before.endswith('\n') and after is not None and after.startswith('\n')
+
+    def render(self, values):
+        parts = self.parts[:]
+        for position, name in self.slots:
+            parts[position] = values[name]
+        return ''.join(parts)
+
+class ArticleTemplate:
+    """
+    Template-ul unui script: sursa (index.html), lanțul de înlocuiri
+    fill(html, values) -> html, marcajele pe care se ancorează pattern-urile lui
+    și, opțional, unsafe(nume, valoare) -> True pentru alte valori pe care
+    lanțul nu le pune literal.
+    """
+
+    def __init__(self, source, fill, markers=(), unsafe=None):
+        self.source = source
+        self.fill = fill
+        self.unsafe = unsafe
+        self.markers = ('\\', SENTINEL_START) + tuple(markers)
+        self._usable = SENTINEL_START not in source
+        self._compiled = {}  # forma (valorile nevide) -> CompiledTemplate
+        self.rendered = 0
+        self.fallbacks = 0
+
+    def compile(self, values):
+        """Forma template-ului pentru valorile date (compilată o singură dată)"""
+        shape = frozenset(name for name, value in values.items() if value)
+        compiled = self._compiled.get(shape)
+        if compiled is None:
+            probe = {name: (sentinel(name) if name in shape else value) for name, value in values.items()}
+            # Mesajele lanțului (cu santinele în loc de valori) nu au sens aici
+            with contextlib.redirect_stdout(io.StringIO()):
+                compiled = CompiledTemplate.from_text(shape, self.fill(self.source, probe))
+            self._compiled[shape] = compiled
+        return compiled
+
+    def accepts(self, compiled, values):
+        """True dacă join-ul dă același text ca lanțul pentru aceste valori"""
+        if not self._usable:
+            return False
+        for name in compiled.shape:
+            value = values[name]
+            if any(marker in value for marker in self.markers):
+                return False
+            if '\n' in value and name not in compiled.line_holes:
+                return False
+            if self.unsafe is not None and self.unsafe(name, value):
+                return False
+        return True
+
+    def render(self, values):
+        """Pagina unui articol: join pe template sau, dacă valorile nu permit, lanțul complet"""
+        compiled = self.compile(values)
+        if self.accepts(compiled, values):
+            self.rendered += 1
+            return compiled.render(values)
+        self.fallbacks += 1
+        return self.fill(self.source, values)
+
+    def report(self):
+        return (f"Template: {self.rendered} articole randate prin join, "
+                f"{self.fallbacks} prin lanțul complet de înlocuiri")
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Verificare și benchmark pentru article_template: pagina randată prin template-ul
+compilat față de lanțul de înlocuiri de până acum (fill_article), pentru
+Pasul 2, TESTAREA.py și parserul txt Eisenstein.
+
+Pentru fiecare script se generează articole sintetice (titluri cu diacritice,
+ghilimele, cifre la început, paragrafe cu <strong>/<em>, linkuri, paragrafe
+numerotate și, rar, backslash-uri sau marcaje din template), la Eisenstein și
+articolele reale din Eisenstein2.txt / bebe.txt. Fiecare articol se randează de
+ambele ori; rezultatele (inclusiv eventualele erori ale lanțului) trebuie să fie
+identice. Timpii și numărul de articole care au mers pe lanțul complet se
+adaugă într-un JSON (o listă de rulări).
+
+    python benchmark_article_template.py --articles 500
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import argparse
+import platform
+import contextlib
+import importlib.util
+from datetime import datetime
+
+from article_template import ArticleTemplate
+from benchmark_docx_writer import append_results
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+EISENSTEIN_DIR = os.path.join(SCRIPTS_DIR, 'Parsing data from txt to html (texte cu Eisenstein +++ )')
+SCRIPTS = {
+    'pasul_2': os.path.join(SCRIPTS_DIR, 'Pasul 2 - Converteste bebe.docx in fisiere html (dupa ce ai tradus in engleza cu Google).py'),
+    'testarea': os.path.join(SCRIPTS_DIR, 'TESTAREA.py'),
+    'eisenstein': os.path.join(EISENSTEIN_DIR, 'Parsing data from txt to html (lasa diacriticile BUN FINAL).py'),
+}
+TEMPLATES = {
+    'pasul_2': os.path.join(SCRIPTS_DIR, 'index.html'),
+    'testarea': os.path.join(SCRIPTS_DIR, 'index.html'),
+    'eisenstein': os.path.join(EISENSTEIN_DIR, 'index.html'),
+}
+EISENSTEIN_TEXTS = ('Eisenstein2.txt', 'bebe.txt')
+
+WORDS = ('leadership', 'sufletul', 'înțelepciune', 'adevăr', 'calea', 'lumina', 'șansa', 'the', 'master',
+         'touch', 'R&D', 'a > b', '"citat"', "l'esprit", 'timp:', '2025', 'ţară')
+RARE = ('\\', '\\n', '</h1>', '<title>', 'zzz.html', '<!-- SASA-2 -->', '</div>')
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(f'benchmark_{name}', SCRIPTS[name])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def random_text(rnd, words):
+    text = ' '.join(rnd.choice(WORDS) for _ in range(words))
+    if rnd.random() < 0.001:
+        text += ' ' + rnd.choice(RARE)
+    return text
+
+def random_title(rnd):
+    title = random_text(rnd, rnd.randint(2, 7)).capitalize()
+    return f'{rnd.randint(1, 99)} {title}' if rnd.random() < 0.05 else title
+
+def random_body(rnd, paragraphs):
+    body = []
+    for _ in range(rnd.randint(paragraphs // 2, paragraphs * 3 // 2) or 1):
+        roll = rnd.random()
+        text = random_text(rnd, rnd.randint(5, 60))
+        if roll < 0.1:
+            text = f'<strong>{random_text(rnd, 4)}</strong> {text}'
+        elif roll < 0.15:
+            text = f'<em>{text}</em>'
+        elif roll < 0.2:
+            text = f'{rnd.randint(1, 9)}. {text}'
+        elif roll < 0.23:
+            text = f'{text} <a href="https://neculaifantanaru.com/en/x.html">https://neculaifantanaru.com/en/x.html</a>'
+        body.append(text)
+    return body
+
+def docx_articles(module, rnd, count, paragraphs):
+    """Valorile articolelor (article_values) pentru Pasul 2 / TESTAREA"""
+    articles = []
+    for i in range(count):
+        title = random_title(rnd)
+        body = random_body(rnd, paragraphs)
+        article_id = str(i + 1) if rnd.random() < 0.95 else None
+        filename = module.generate_filename(title)
+        articles.append(module.article_values(title, body, filename, article_id))
+    return articles
+
+def eisenstein_articles(module, rnd, count, paragraphs):
+    texts = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in EISENSTEIN_TEXTS:
+            texts.extend(module.read_articles(os.path.join(EISENSTEIN_DIR, name)))
+    for _ in range(max(0, count - len(texts))):
+        lines = [random_title(rnd), '', random_text(rnd, 20)]
+        lines += [random_text(rnd, rnd.randint(5, 60)) for _ in range(rnd.randint(paragraphs // 2, paragraphs * 3 // 2))]
+        texts.append('\n' + '\n'.join(lines) + '\n')
+    return [module.article_values(text)[1] for text in texts]
+
+def render_all(render, articles):
+    """Randează toate articolele; returnează (pagini sau ('eroare', tip), secunde)"""
+    pages = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for values in articles:
+            try:
+                pages.append(render(values))
+            except Exception as e:  # lanțul vechi poate ridica re.error; template-ul trebuie să facă la fel
+                pages.append(('eroare', type(e).__name__))
+        seconds = time.perf_counter() - start
+    return pages, seconds
+
+def run_script(name, count, paragraphs, seed):
+    module = load_script(name)
+    rnd = random.Random(seed)
+    with open(TEMPLATES[name], 'r', encoding='utf-8') as f:
+        source = f.read()
+    if name == 'eisenstein':
+        articles = eisenstein_articles(module, rnd, count, paragraphs)
+    else:
+        articles = docx_articles(module, rnd, count, paragraphs)
+    template = ArticleTemplate(source, module.fill_article, module.ARTICLE_MARKERS, getattr(module, 'unsafe_value', None))
+    reference, chain_s = render_all(lambda values: module.fill_article(source, values), articles)
+    candidate, template_s = render_all(template.render, articles)
+    differences = sum(1 for a, b in zip(reference, candidate) if a != b)
+    return {
+        'articles': len(articles),
+        'chain_s': round(chain_s, 4),
+        'template_s': round(template_s, 4),
+        'speedup': round(chain_s / template_s, 2) if template_s else None,
+        'fallbacks': template.fallbacks,
+        'chain_errors': sum(1 for page in reference if isinstance(page, tuple)),
+        'differences': differences,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Template compilat față de lanțul de înlocuiri (Pasul 2, TESTAREA, Eisenstein).")
+    parser.add_argument('--articles', type=int, default=300, help="articole pe script (implicit 300)")
+    parser.add_argument('--paragraphs', type=int, default=30, help="paragrafe medii pe articol (implicit 30)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='benchmark_article_template.json', help="fișierul JSON cu rulările")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in SCRIPTS:
+        result = results[name] = run_script(name, args.articles, args.paragraphs, args.seed)
+        print(f"  {name:<11} lanț: {result['chain_s']:>6.2f}s  template: {result['template_s']:>6.2f}s  "
+              f"accelerare: {result['speedup']}x  pe lanț: {result['fallbacks']}/{result['articles']}  "
+              f"diferențe: {result['differences']}")
+    differences = sum(result['differences'] for result in results.values())
+    if differences:
+        print(f"ATENȚIE: {differences} articole diferă față de lanțul de înlocuiri")
+    else:
+        print("Paginile sunt identice cu cele produse de lanțul de înlocuiri")
+
+    append_results(args.output, {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'articles': args.articles,
+        'paragraphs': args.paragraphs,
+        'seed': args.seed,
+        'results': results,
+        'identical': not differences,
+    })
+    print(f"Rezultate adăugate în {args.output}")
+    return 1 if differences else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
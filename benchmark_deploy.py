@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark pentru publicarea pe FTP (FTP.py / ftp_deploy.py), fără serverul real.
+
+Pornește un server FTP local (pyftpdlib) într-un folder temporar, generează un
+folder fisiere_gata sintetic și rulează funcțiile din FTP.py pe el, în mai multe
+moduri:
+- per_fisier: upload_to_ftp, o conectare + autentificare pentru fiecare fișier;
+- pool:       open_deploy_queue fără delta, sesiuni persistente în paralel;
+- delta:      open_deploy_queue cu manifest, după o sincronizare completă și
+              modificarea unei părți din fișiere (--changed).
+
+Pentru fiecare mod: fișiere/s, MB/s, câte conexiuni (autentificări) a văzut
+serverul și p95 pe fișier (MB/s = dimensiunea întregului folder / durata,
+adică debitul efectiv al publicării, inclusiv fișierele sărite la delta). Rezultatele se adaugă într-un JSON (o listă de
+rulări), ca rulările să poată fi comparate în timp.
+
+    python benchmark_deploy.py --files 1000 --sessions 4
+    python benchmark_deploy.py --files 300 --latency 20 --modes pool,delta
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import logging
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import contextlib
+from datetime import datetime
+
+try:
+    from pyftpdlib.authorizers import DummyAuthorizer
+    from pyftpdlib.handlers import FTPHandler
+    from pyftpdlib.servers import ThreadedFTPServer
+    from pyftpdlib.ioloop import IOLoop
+except ImportError:
+    print("Benchmark-ul are nevoie de pyftpdlib: pip install pyftpdlib")
+    sys.exit(1)
+
+import FTP
+
+MODES = ('per_fisier', 'pool', 'delta')
+BENCH_USER = 'bench'
+BENCH_PASSWORD = 'bench'
+
+def start_server(root, latency_ms=0):
+    """Server FTP local pe un port liber; returnează (server, port, handler, fir)"""
+    # Fără jurnalul INFO al pyftpdlib (o linie per comandă)
+    pyftpdlib_logger = logging.getLogger('pyftpdlib')
+    if not pyftpdlib_logger.handlers:
+        pyftpdlib_logger.addHandler(logging.NullHandler())
+    pyftpdlib_logger.setLevel(logging.WARNING)
+    authorizer = DummyAuthorizer()
+    authorizer.add_user(BENCH_USER, BENCH_PASSWORD, root, perm='elradfmwMT')
+
+    class BenchHandler(FTPHandler):
+        logins = 0
+        _lock = threading.Lock()
+
+        def on_login(self, username):
+            with BenchHandler._lock:
+                BenchHandler.logins += 1
+
+        def pre_process_command(self, line, cmd, arg):
+            # Întârziere per comandă, ca un server aflat la distanță (RTT)
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            return super().pre_process_command(line, cmd, arg)
+
+    BenchHandler.authorizer = authorizer
+    BenchHandler.banner = "benchmark_deploy"
+    # IOLoop propriu: cel implicit e comun tuturor serverelor, iar oprirea unui
+    # server ar închide și conexiunile serverului următor
+    server = ThreadedFTPServer(('127.0.0.1', 0), BenchHandler, ioloop=IOLoop())
+    thread = threading.Thread(target=server.serve_forever, kwargs={'timeout': 0.5}, daemon=True)
+    thread.start()
+    return server, server.socket.getsockname()[1], BenchHandler, thread
+
+def generate_tree(folder, count, average_kb, seed):
+    """count fișiere .html cu dimensiuni în jurul lui average_kb; returnează totalul de octeți"""
+    rnd = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    total = 0
+    for i in range(count):
+        size = max(1, int(rnd.uniform(0.5, 1.5) * average_kb * 1024))
+        body = ''.join(rnd.choice('abcdefghij klmnopqrstuvwxyz') for _ in range(min(size, 4096)))
+        content = (f'<html><head><title>Articol {i}</title></head><body>\n'
+                   + (body * (size // len(body) + 1))[:size] + '\n</body></html>\n')
+        with open(os.path.join(folder, f'articol-{i:05}.html'), 'w', encoding='utf-8') as f:
+            f.write(content)
+        total += len(content.encode('utf-8'))
+    return total
+
+def touch_fraction(folder, fraction, seed):
+    """Modifică o parte din fișiere (ca o rulare obișnuită); returnează câte"""
+    names = sorted(os.listdir(folder))
+    changed = random.Random(seed).sample(names, max(1, int(len(names) * fraction)))
+    for name in changed:
+        with open(os.path.join(folder, name), 'a', encoding='utf-8') as f:
+            f.write(f'<!-- modificat {time.time()} -->\n')
+    return len(changed)
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def configure_ftp_module(port, manifest_path):
+    """Îndreaptă FTP.py către serverul local"""
+    FTP.FTP_SERVER = '127.0.0.1'
+    FTP.FTP_PORT = port
+    FTP.FTP_USER = BENCH_USER
+    FTP.FTP_PASSWORD = BENCH_PASSWORD
+    FTP.FTP_REMOTE_DIR = '/public_html/en/'
+    FTP.FTP_MANIFEST = manifest_path
+
+def items_of(folder):
+    return [(os.path.join(folder, name), name) for name in sorted(os.listdir(folder))]
+
+def run_per_file(folder):
+    latencies = []
+    ok = 0
+    for local_path, name in items_of(folder):
+        start = time.perf_counter()
+        ok += FTP.upload_to_ftp(local_path, name)
+        latencies.append(time.perf_counter() - start)
+    return ok, latencies
+
+def run_queue(folder, sessions, delta):
+    deploy = FTP.open_deploy_queue(sessions=sessions, delta=delta)
+    for local_path, name in items_of(folder):
+        deploy.push(local_path, name)
+    report = deploy.finish()
+    return report['uploaded_files'], deploy.upload_latencies
+
+def measure(mode, folder, sessions, handler, changed_fraction, seed):
+    """Rulează un mod; returnează măsurătorile lui"""
+    files = len(os.listdir(folder))
+    changed = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'delta':
+            # Manifestul e la zi după o sincronizare completă, apoi se schimbă câteva fișiere
+            run_queue(folder, sessions, delta=True)
+            changed = touch_fraction(folder, changed_fraction, seed)
+        logins_before = handler.logins
+        start = time.perf_counter()
+        if mode == 'per_fisier':
+            uploaded, latencies = run_per_file(folder)
+        else:
+            uploaded, latencies = run_queue(folder, sessions, delta=(mode == 'delta'))
+        seconds = time.perf_counter() - start
+    total_bytes = sum(os.path.getsize(path) for path, _ in items_of(folder))
+    return {
+        'files': files,
+        'uploaded_files': uploaded,
+        'changed_files': changed,
+        'seconds': round(seconds, 4),
+        'files_per_s': round(files / seconds, 2) if seconds else None,
+        'mb_per_s': round(total_bytes / 1024 / 1024 / seconds, 3) if seconds else None,
+        'connections': handler.logins - logins_before,
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+    }
+
+def append_results(output_path, run):
+    """Adaugă rularea la lista din JSON (scriere atomică)"""
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            runs = json.load(f)
+    except (OSError, ValueError):
+        runs = []
+    runs.append(run)
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(runs, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, output_path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pentru publicarea pe FTP cu un server local.")
+    parser.add_argument('--files', type=int, default=500, help="câte fișiere are folderul sintetic (implicit 500)")
+    parser.add_argument('--size-kb', type=float, default=40, help="dimensiunea medie a unui fișier, KB (implicit 40)")
+    parser.add_argument('--sessions', type=int, default=FTP.FTP_SESSIONS, help="sesiuni FTP pentru pool/delta")
+    parser.add_argument('--changed', type=float, default=0.02, help="ce parte din fișiere se schimbă la delta (implicit 0.02)")
+    parser.add_argument('--latency', type=float, default=0, help="întârziere simulată per comandă FTP, ms")
+    parser.add_argument('--modes', default=','.join(MODES), help=f"modurile comparate (implicit {','.join(MODES)})")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='benchmark_deploy.json', help="fișierul JSON cu rulările")
+    args = parser.parse_args(argv)
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"moduri necunoscute: {', '.join(unknown)} (disponibile: {', '.join(MODES)})")
+
+    work_dir = tempfile.mkdtemp(prefix='benchmark_deploy_')
+    try:
+        source = os.path.join(work_dir, 'fisiere_gata')
+        total_bytes = generate_tree(source, args.files, args.size_kb, args.seed)
+        print(f"Folder sintetic: {args.files} fișiere, {total_bytes / 1024 / 1024:.2f} MB")
+
+        results = {}
+        for mode in modes:
+            # Fiecare mod pornește de la un server gol și fără manifest
+            server_root = os.path.join(work_dir, f'server_{mode}')
+            os.makedirs(server_root)
+            server, port, handler, thread = start_server(server_root, args.latency)
+            configure_ftp_module(port, os.path.join(work_dir, f'manifest_{mode}.json'))
+            try:
+                results[mode] = measure(mode, source, args.sessions, handler, args.changed, args.seed)
+            finally:
+                server.close_all()
+                thread.join()
+            r = results[mode]
+            print(f"  {mode:<11} {r['seconds']:>8.2f}s {r['files_per_s']:>9.1f} fișiere/s {r['mb_per_s']:>8.2f} MB/s "
+                  f"conexiuni: {r['connections']:<5} p95: {r['p95_ms']:.1f} ms "
+                  f"(încărcate: {r['uploaded_files']})")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'files': args.files,
+        'total_bytes': total_bytes,
+        'size_kb': args.size_kb,
+        'sessions': args.sessions,
+        'latency_ms': args.latency,
+        'changed_fraction': args.changed,
+        'results': results,
+    }
+    append_results(args.output, run)
+    print(f"Rezultate adăugate în {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
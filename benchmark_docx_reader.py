@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark pentru citirea bebe.docx în Pasul 2: iter_articles (docx_reader,
+iterparse în flux) față de extract_data_from_docx cu python-docx (calea de
+până acum, păstrată aici ca referință).
+
+Generează un .docx sintetic ca cel tradus (titluri centrate, linii "ID: N",
+paragrafe cu run-uri bold/italic/ambele, w:b w:val="0", tab-uri, rânduri noi,
+salturi de pagină, linkuri în text și în <w:hyperlink>, tabele, paragrafe goale)
+și verifică faptul că ambele citiri dau exact aceleași tupluri (titlu, corp, id).
+Fiecare citire rulează apoi într-un proces separat, ca memoria maximă (RSS) să
+fie a ei; timpii și memoria se adaugă într-un JSON (o listă de rulări).
+
+    python benchmark_docx_reader.py --articles 500 --paragraphs 40
+    python benchmark_docx_reader.py --articles 5000 --paragraphs 60
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+import importlib.util
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+
+from docx_writer import DocxWriter, ALIGN_CENTER
+from benchmark_docx_writer import append_results
+
+try:
+    import resource
+except ImportError:  # Windows: memoria nu se măsoară
+    resource = None
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PASUL_2 = 'Pasul 2 - Converteste bebe.docx in fisiere html (dupa ce ai tradus in engleza cu Google).py'
+
+def load_pasul_2():
+    spec = importlib.util.spec_from_file_location('pasul_2', os.path.join(SCRIPTS_DIR, PASUL_2))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['pasul_2'] = module
+    spec.loader.exec_module(module)
+    return module
+
+def extract_data_python_docx(file_path, make_links_clickable):
+    """extract_data_from_docx de dinainte de docx_reader (tot documentul în python-docx)"""
+    doc = Document(file_path)
+    articles = []
+    current_title = None
+    current_body = []
+    current_id = None
+    is_id_line = False
+
+    for para in doc.paragraphs:
+        text = para.text.strip()
+        if para.alignment == WD_PARAGRAPH_ALIGNMENT.CENTER and text and not text.startswith("ID:"):
+            if current_title:
+                articles.append((current_title, current_body, current_id))
+                current_body = []
+                current_id = None
+            current_title = text
+            is_id_line = True
+        elif is_id_line and text.startswith("ID:"):
+            current_id = text.replace("ID:", "").strip()
+            is_id_line = False
+        elif current_title and text:
+            is_id_line = False
+            formatted_text = []
+            for run in para.runs:
+                if run.bold and run.italic:
+                    formatted_text.append(f'<strong><em>{run.text}</em></strong>')
+                elif run.bold:
+                    formatted_text.append(f'<strong>{run.text}</strong>')
+                elif run.italic:
+                    formatted_text.append(f'<em>{run.text}</em>')
+                else:
+                    formatted_text.append(run.text)
+            current_body.append(make_links_clickable(''.join(formatted_text)))
+
+    if current_title:
+        articles.append((current_title, current_body, current_id))
+    return articles
+
+WORDS = ('leadership', 'the soul', 'wisdom', 'truth', 'the path', 'light', 'chance', 'courage',
+         'R&D', '<tag>', 'a > b', 'spirit', 'country', 'book', 'time', 'șansa', 'ţară')
+URL = 'https://neculaifantanaru.com/en/x.html'
+HYPERLINK = '<w:hyperlink xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" r:id="rId1">'
+# Proprietăți de run: bold/italic setate, nesetate sau dezactivate explicit
+RUN_PROPERTIES = ('', '', '', '<w:b/>', '<w:i/>', '<w:b/><w:i/>', '<w:b w:val="0"/>', '<w:i w:val="false"/>',
+                  '<w:b w:val="1"/><w:i w:val="off"/>', '<w:b w:val="true"/><w:i w:val="on"/>', '<w:color w:val="808080"/>')
+# Ce poate apărea într-un run între bucățile de text
+RUN_EXTRAS = ('<w:tab/>', '<w:br/>', '<w:br w:type="page"/>', '<w:cr/>', '<w:noBreakHyphen/>', '<w:t/>',
+              '<w:lastRenderedPageBreak/>')
+
+def random_words(rnd, count):
+    return ' '.join(rnd.choice(WORDS) for _ in range(count))
+
+def text_xml(text):
+    return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+
+def random_run(rnd):
+    roll = rnd.random()
+    if roll < 0.05:
+        content = text_xml(URL + ' ')
+    else:
+        content = text_xml(random_words(rnd, rnd.randint(1, 12)))
+        if roll < 0.2:
+            content += rnd.choice(RUN_EXTRAS) + text_xml(random_words(rnd, 2))
+    return f'<w:r><w:rPr>{rnd.choice(RUN_PROPERTIES)}</w:rPr>{content}</w:r>'
+
+def random_paragraph(rnd):
+    roll = rnd.random()
+    if roll < 0.03:
+        return '<w:p/>'
+    if roll < 0.05:
+        return '<w:p><w:r><w:t xml:space="preserve">   </w:t></w:r></w:p>'
+    if roll < 0.06:
+        cell = f'<w:tc><w:p>{random_run(rnd)}</w:p></w:tc>'
+        return f'<w:tbl><w:tr>{cell}{cell}</w:tr></w:tbl>'
+    runs = ''.join(random_run(rnd) for _ in range(rnd.randint(1, 6)))
+    if rnd.random() < 0.05:
+        runs += f'{HYPERLINK}<w:r><w:t>{escape(random_words(rnd, 2))}</w:t></w:r></w:hyperlink>'
+    properties = '<w:pPr><w:jc w:val="both"/></w:pPr>' if rnd.random() < 0.1 else ''
+    return f'<w:p>{properties}{runs}</w:p>'
+
+def generate_docx(path, articles, paragraphs, seed):
+    """Un bebe.docx sintetic, cu articole de aproximativ paragraphs paragrafe"""
+    rnd = random.Random(seed)
+    document = DocxWriter()
+    # Paragrafe înainte de primul titlu (se ignoră la citire)
+    document.add_paragraph(random_words(rnd, 5))
+    for i in range(articles):
+        title = random_words(rnd, rnd.randint(2, 6)).capitalize()
+        if rnd.random() < 0.05:
+            title = '  ' + title + ' '
+        document.add_paragraph(alignment=ALIGN_CENTER).add_run(title, bold=True, color='FF0000')
+        if rnd.random() < 0.95:
+            document.add_paragraph().add_run(f"ID: {i + 1}", color='808080', size=8)
+        if rnd.random() < 0.02:
+            document.add_paragraph("ID: 999")  # a doua linie ID: corp, ca în python-docx
+        for _ in range(rnd.randint(paragraphs // 2, paragraphs * 3 // 2)):
+            document.append_body(random_paragraph(rnd))
+    document.save(path)
+
+def read_articles(mode, docx_path):
+    """Citirea cerută: 'docx_reader' (iter_articles din Pasul 2) sau 'python_docx' (referința)"""
+    module = load_pasul_2()
+    if mode == 'docx_reader':
+        return list(module.iter_articles(docx_path))
+    return extract_data_python_docx(docx_path, module.make_links_clickable)
+
+def peak_memory_kb():
+    """
+    Memoria maximă (KB) a procesului curent sau None. Pe Linux VmHWM, fiindcă
+    ru_maxrss păstrează după exec maximul procesului părinte.
+    """
+    try:
+        with open('/proc/self/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return None
+
+def measure(mode, docx_path):
+    """Rulat în procesul copil: timpul citirii și memoria maximă a procesului, ca JSON pe stdout"""
+    module = load_pasul_2()
+    baseline_kb = peak_memory_kb()
+    start = time.perf_counter()
+    if mode == 'docx_reader':
+        articles = sum(1 for _ in module.iter_articles(docx_path))
+    else:
+        articles = len(extract_data_python_docx(docx_path, module.make_links_clickable))
+    seconds = time.perf_counter() - start
+    result = {'seconds': round(seconds, 4), 'articles': articles,
+              'peak_rss_kb': peak_memory_kb(), 'baseline_rss_kb': baseline_kb}
+    print(json.dumps(result))
+
+def measure_in_child(mode, docx_path):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--measure', mode, '--docx', docx_path],
+                            capture_output=True, text=True, check=True, cwd=SCRIPTS_DIR)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark docx_reader față de python-docx pentru Pasul 2.")
+    parser.add_argument('--articles', type=int, default=500, help="câte articole sintetice (implicit 500)")
+    parser.add_argument('--paragraphs', type=int, default=30, help="paragrafe medii pe articol (implicit 30)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='benchmark_docx_reader.json', help="fișierul JSON cu rulările")
+    parser.add_argument('--measure', choices=('docx_reader', 'python_docx'), help=argparse.SUPPRESS)
+    parser.add_argument('--docx', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        measure(args.measure, args.docx)
+        return 0
+
+    work_dir = tempfile.mkdtemp(prefix='benchmark_docx_reader_')
+    try:
+        docx_path = os.path.join(work_dir, 'bebe.docx')
+        generate_docx(docx_path, args.articles, args.paragraphs, args.seed)
+        size = os.path.getsize(docx_path)
+        identical = read_articles('docx_reader', docx_path) == read_articles('python_docx', docx_path)
+        results = {mode: measure_in_child(mode, docx_path) for mode in ('python_docx', 'docx_reader')}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for name, result in results.items():
+        memory = (f"  memorie maximă: {result['peak_rss_kb'] / 1024:>6.0f} MB "
+                  f"(+{(result['peak_rss_kb'] - result['baseline_rss_kb']) / 1024:.0f} MB la citire)"
+                  if result['peak_rss_kb'] is not None else '')
+        print(f"  {name:<12} citire: {result['seconds']:>7.2f}s  articole: {result['articles']}{memory}")
+    speedup = (results['python_docx']['seconds'] / results['docx_reader']['seconds']
+               if results['docx_reader']['seconds'] else None)
+    if speedup:
+        print(f"Accelerare: {speedup:.1f}x ({args.articles} articole, {size / 1024:.0f} KB)")
+    if identical:
+        print("Citirile sunt identice (aceleași titluri, corpuri și ID-uri)")
+    else:
+        print("ATENȚIE: citirile diferă")
+
+    append_results(args.output, {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'articles': args.articles,
+        'paragraphs': args.paragraphs,
+        'docx_kb': round(size / 1024),
+        'seed': args.seed,
+        'results': results,
+        'speedup': round(speedup, 2) if speedup else None,
+        'identical': identical,
+    })
+    print(f"Rezultate adăugate în {args.output}")
+    return 0 if identical else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark pentru scrierea articole_compilate.docx din Pasul 1 A: docx_writer
+(XML scris direct) față de modelul de obiecte python-docx (calea de până acum).
+
+Generează articole HTML sintetice (titlu, ID, paragrafe text_obisnuit /
+text_obisnuit2 cu <em> și <span class="text_obisnuit2">, tab-uri, rânduri noi,
+caractere de escape și, rar, caractere de control) și rulează pe ele
+process_html_file din Pasul 1 A de două ori: o dată cu DocxWriter și o dată cu
+PythonDocxDocument, care face aceleași apeluri python-docx ca înainte
+(add_paragraph, add_run, apoi bold/italic/culoare/mărime pe run). Verifică
+faptul că cele două .docx au exact aceleași părți (word/document.xml inclus)
+și adaugă timpii într-un JSON (o listă de rulări).
+
+A treia variantă e build_document din Pasul 1 A, cu extragerea pe un pool de
+--processes procese (asamblarea rămâne în ordine); și ea trebuie să dea exact
+același document.
+
+    python benchmark_docx_writer.py --articles 300 --paragraphs 40
+    python benchmark_docx_writer.py --articles 1000 --processes 8
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import zipfile
+import argparse
+import platform
+import tempfile
+import contextlib
+import importlib.util
+from datetime import datetime
+
+from docx import Document
+from docx.shared import Pt, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from docx_writer import DocxWriter, ALIGN_CENTER
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PASUL_1A = 'Pasul 1 A - Copiaza fisiere html in docx BEBE website.py'
+
+class PythonDocxParagraph:
+    """Paragraful python-docx cu interfața din docx_writer.Paragraph"""
+
+    def __init__(self, paragraph):
+        self._paragraph = paragraph
+
+    def add_run(self, text=None, bold=None, italic=None, color=None, size=None):
+        run = self._paragraph.add_run(text)
+        if italic is not None:
+            run.italic = italic
+        if bold is not None:
+            run.bold = bold
+        if color is not None:
+            run.font.color.rgb = RGBColor.from_string(color)
+        if size is not None:
+            run.font.size = Pt(size)
+        return run
+
+class PythonDocxDocument:
+    """Calea de până acum: un document python-docx, cu interfața din DocxWriter"""
+
+    def __init__(self):
+        self._document = Document()
+
+    def add_paragraph(self, text=None, alignment=None):
+        paragraph = self._document.add_paragraph()
+        if alignment == ALIGN_CENTER:
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        wrapper = PythonDocxParagraph(paragraph)
+        if text:
+            wrapper.add_run(text)
+        return wrapper
+
+    def save(self, path):
+        self._document.save(path)
+
+WORDS = ('leadership', 'sufletul', 'înțelepciune', 'adevăr', 'calea', 'lumina', 'șansa', 'îndrăzneala',
+         'R&D', '<tag>', 'a > b', 'spirit', 'ţară', 'carte', 'timp')
+
+def random_text(rnd, words):
+    text = ' '.join(rnd.choice(WORDS) for _ in range(words))
+    roll = rnd.random()
+    if roll < 0.05:
+        text = '  ' + text + ' '
+    elif roll < 0.08:
+        text = text.replace(' ', '\n', 1)
+    elif roll < 0.10:
+        text = text.replace(' ', '\t', 1)
+    elif roll < 0.101:
+        text = text + '\x0b'
+    return text
+
+def random_paragraph(rnd):
+    css = 'text_obisnuit2' if rnd.random() < 0.2 else 'text_obisnuit'
+    parts = []
+    for _ in range(rnd.randint(1, 5)):
+        kind = rnd.random()
+        if kind < 0.5:
+            parts.append(random_text(rnd, rnd.randint(3, 25)))
+        elif kind < 0.7:
+            parts.append(f'<em>{random_text(rnd, rnd.randint(1, 6))}</em>')
+        elif kind < 0.85:
+            parts.append(f'<span class="text_obisnuit2">{random_text(rnd, rnd.randint(1, 6))}</span>')
+        else:
+            parts.append(f'<a href="https://neculaifantanaru.com/x.html">{random_text(rnd, 2)}</a>')
+    body = ''.join(parts).replace('&', '&amp;').replace('<tag>', '&lt;tag&gt;').replace('a > b', 'a &gt; b')
+    return f'<p class="{css}">{body}</p>'
+
+def generate_articles(folder, count, paragraphs, seed):
+    rnd = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for i in range(count):
+        title = random_text(rnd, rnd.randint(2, 6)).replace('&', '&amp;').replace('<tag>', '&lt;tag&gt;')
+        item_id = f'<!-- $item_id = {i + 1}; // Replace that with your rating id -->' if rnd.random() < 0.95 else ''
+        body = '\n'.join(random_paragraph(rnd) for _ in range(rnd.randint(paragraphs // 2, paragraphs * 3 // 2)))
+        content = (f'<html>\n{item_id}\n<head><title>x</title></head><body>\n'
+                   f'<h1 class="den_articol" itemprop="name">{title}</h1>\n'
+                   f'<!-- ARTICOL START -->\n{body}\n<!-- ARTICOL FINAL -->\n</body></html>\n')
+        path = os.path.join(folder, f'articol-{i:04}.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        paths.append(path)
+    return paths
+
+def load_pasul_1a():
+    spec = importlib.util.spec_from_file_location('pasul_1a', os.path.join(SCRIPTS_DIR, PASUL_1A))
+    module = importlib.util.module_from_spec(spec)
+    # Înregistrat în sys.modules: procesele copil pornite cu fork îl refolosesc (vezi script_pool)
+    sys.modules['pasul_1a'] = module
+    spec.loader.exec_module(module)
+    return module
+
+def build(module, document, paths, output_path):
+    """Rulează Pasul 1 A pe fișiere cu documentul dat; returnează (secunde construire, secunde salvare)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for path in paths:
+            module.process_html_file(path, document)
+        built = time.perf_counter()
+        document.save(output_path)
+        saved = time.perf_counter()
+    return built - start, saved - built
+
+def build_parallel(module, paths, output_path, processes):
+    """build_document din Pasul 1 A (extragere pe procese); returnează (secunde construire, secunde salvare)"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        document = module.build_document(paths, processes=processes)
+        built = time.perf_counter()
+        document.save(output_path)
+        saved = time.perf_counter()
+    if 'Extragere în procese indisponibilă' in output.getvalue():
+        print("ATENȚIE: procesele copil nu au putut fi folosite; extragerea a rulat în procesul curent")
+    return built - start, saved - built
+
+def docx_parts(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+def compare(reference_path, candidate_path):
+    """Părțile care diferă între cele două .docx (listă goală = identice)"""
+    reference, candidate = docx_parts(reference_path), docx_parts(candidate_path)
+    names = sorted(set(reference) | set(candidate))
+    return [name for name in names if reference.get(name) != candidate.get(name)]
+
+def append_results(output_path, run):
+    """Adaugă rularea la lista din JSON (scriere atomică)"""
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            runs = json.load(f)
+    except (OSError, ValueError):
+        runs = []
+    runs.append(run)
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(runs, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, output_path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark docx_writer față de python-docx pentru Pasul 1 A.")
+    parser.add_argument('--articles', type=int, default=200, help="câte articole sintetice (implicit 200)")
+    parser.add_argument('--paragraphs', type=int, default=30, help="paragrafe medii pe articol (implicit 30)")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help="procese pentru varianta cu extragere în paralel (implicit toate nucleele)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='benchmark_docx_writer.json', help="fișierul JSON cu rulările")
+    args = parser.parse_args(argv)
+
+    module = load_pasul_1a()
+    work_dir = tempfile.mkdtemp(prefix='benchmark_docx_writer_')
+    try:
+        paths = generate_articles(os.path.join(work_dir, 'ro'), args.articles, args.paragraphs, args.seed)
+        reference_path = os.path.join(work_dir, 'python_docx.docx')
+        candidate_path = os.path.join(work_dir, 'docx_writer.docx')
+        parallel_path = os.path.join(work_dir, 'docx_writer_procese.docx')
+        reference = build(module, PythonDocxDocument(), paths, reference_path)
+        candidate = build(module, DocxWriter(), paths, candidate_path)
+        parallel = build_parallel(module, paths, parallel_path, args.processes)
+        differences = compare(reference_path, candidate_path)
+        differences += [f'{name} (procese)' for name in compare(reference_path, parallel_path)]
+        size = os.path.getsize(candidate_path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {}
+    for name, (build_s, save_s) in (('python_docx', reference), ('docx_writer', candidate),
+                                    ('docx_writer_procese', parallel)):
+        results[name] = {'build_s': round(build_s, 4), 'save_s': round(save_s, 4), 'total_s': round(build_s + save_s, 4)}
+        print(f"  {name:<20} construire: {build_s:>7.2f}s  salvare: {save_s:>6.2f}s  total: {build_s + save_s:>7.2f}s")
+    speedup = results['python_docx']['total_s'] / results['docx_writer']['total_s'] if results['docx_writer']['total_s'] else None
+    parallel_speedup = (results['python_docx']['total_s'] / results['docx_writer_procese']['total_s']
+                        if results['docx_writer_procese']['total_s'] else None)
+    if speedup:
+        print(f"Accelerare: {speedup:.1f}x, cu {args.processes} procese: {parallel_speedup:.1f}x "
+              f"({args.articles} articole, {size / 1024:.0f} KB)")
+    if differences:
+        print(f"ATENȚIE: documentele diferă în: {', '.join(differences)}")
+    else:
+        print("Documentele sunt identice (toate părțile, inclusiv word/document.xml)")
+
+    append_results(args.output, {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'articles': args.articles,
+        'paragraphs': args.paragraphs,
+        'processes': args.processes,
+        'seed': args.seed,
+        'results': results,
+        'speedup': round(speedup, 2) if speedup else None,
+        'parallel_speedup': round(parallel_speedup, 2) if parallel_speedup else None,
+        'identical': not differences,
+    })
+    print(f"Rezultate adăugate în {args.output}")
+    return 1 if differences else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Căile folosite de scripturile Pasul X și de pipeline.py, într-un singur loc.
+
+Valorile implicite sunt căile de pe calculatorul de lucru (Windows). Oricare
+poate fi suprascrisă printr-o variabilă de mediu cu același nume prefixat cu
+SITE_, de exemplu pe Linux:
+
+    export SITE_RO_DIR=/srv/site/Principal/ro
+    export SITE_OUTPUT_DIR=/srv/site/lucru/output
+"""
+
+import os
+
+def _path(name, default):
+    """Calea din variabila de mediu SITE_<name>, altfel valoarea implicită"""
+    return os.environ.get(f'SITE_{name}', default)
+
+# Site-ul principal (RO + EN)
+RO_DIR = _path('RO_DIR', r'e:\Carte\BB\17 - Site Leadership\Principal\ro')
+EN_DIR = _path('EN_DIR', r'e:\Carte\BB\17 - Site Leadership\Principal\en')
+
+# Copia Principal 2022 (fișierele categorii EN cu imagini minimalizate)
+PRINCIPAL_2022_RO_DIR = _path('PRINCIPAL_2022_RO_DIR', r'e:\Carte\BB\17 - Site Leadership\Principal 2022\ro')
+PRINCIPAL_2022_EN_DIR = _path('PRINCIPAL_2022_EN_DIR', r'e:\Carte\BB\17 - Site Leadership\Principal 2022\en')
+
+# Folderul de lucru (bebe.docx, index.html, output)
+WORK_DIR = _path('WORK_DIR', r'e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python')
+OUTPUT_DIR = _path('OUTPUT_DIR', r'e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python\output')
+
+# Foldere temporare
+BACKUP_DIR = _path('BACKUP_DIR', r'c:\Folder1\fisiere_html')
+FISIERE_GATA_DIR = _path('FISIERE_GATA_DIR', r'c:\Folder1\fisiere_gata')
+
+# Rapoartele pipeline-ului (înlocuiesc errors_TIMESTAMP.log din fișierele .bat)
+LOG_DIR = _path('LOG_DIR', r'c:\Folder1\fisiere_gata')
+
+# Amprentele intrărilor fiecărui pas (pipeline.py / stage_state.py)
+PIPELINE_STATE = _path('PIPELINE_STATE', r'e:\Carte\BB\17 - Site Leadership\alte\Ionel Balauta\Aryeht\Task 1 - Traduce tot site-ul\Doar Google Web\Andreea\Meditatii\2023\Iulia Python\pipeline_state.json')
+
+# Indexul SQLite al paginilor (corpus_index.py)
+INDEX_DB = _path('INDEX_DB', r'e:\Carte\BB\17 - Site Leadership\Principal\corpus_index.sqlite')
+
+# Registrul ID-urilor: item_id -> fișier RO / EN (id_registry.py)
+ID_REGISTRY = _path('ID_REGISTRY', r'e:\Carte\BB\17 - Site Leadership\Principal\id_registry.json')
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Index persistent (SQLite) al paginilor HTML din Principal\\ro și Principal\\en.
+
+Pentru fiecare fișier se păstrează: item_id, titlu, slug, link-urile ro/en din
+FLAGS, categoria, data, imaginea, lead-ul, encoding-ul, mtime/size și hash-ul
+conținutului. La fiecare rulare se recitesc doar fișierele al căror mtime sau
+size s-a schimbat, așa că scripturile Pasul X pot interoga indexul în loc să
+scaneze din nou tot arborele.
+
+Rulare directă: python corpus_index.py  (reîmprospătează folderele implicite)
+"""
+
+import os
+import re
+import html
+import sqlite3
+import hashlib
+
+import config
+
+INDEX_DB = config.INDEX_DB
+
+CORPUS_FOLDERS = [
+    (config.RO_DIR, 'ro'),
+    (os.path.join(config.RO_DIR, 'Python Files'), 'ro'),
+    (config.EN_DIR, 'en'),
+]
+
+# Versiunea câmpurilor extrase; la schimbare, paginile se reindexează de la zero
+INDEX_VERSION = 2
+
+# Conexiuni și foldere încărcate, partajate în același proces (ex. pipeline.py)
+_shared_connections = {}
+_loaded_folders = {}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS pages (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    lang TEXT,
+    item_id INTEGER,
+    title TEXT,
+    slug TEXT,
+    flags_ro TEXT,
+    flags_en TEXT,
+    category TEXT,
+    category_title TEXT,
+    date TEXT,
+    image_url TEXT,
+    lead TEXT,
+    encoding TEXT,
+    mtime REAL,
+    size INTEGER,
+    sha1 TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_folder ON pages (folder);
+CREATE INDEX IF NOT EXISTS pages_item_id ON pages (item_id);
+CREATE INDEX IF NOT EXISTS pages_slug ON pages (slug);
+CREATE INDEX IF NOT EXISTS pages_flags_en ON pages (flags_en);
+CREATE INDEX IF NOT EXISTS pages_flags_ro ON pages (flags_ro);
+'''
+
+COLUMNS = ('path', 'folder', 'filename', 'lang', 'item_id', 'title', 'slug',
+           'flags_ro', 'flags_en', 'category', 'category_title', 'date',
+           'image_url', 'lead', 'encoding', 'mtime', 'size', 'sha1')
+
+# Pattern-urile sunt compilate o singură dată, pentru tot indexul
+ID_PATTERNS = [
+    re.compile(r'<!-- \s*\$item_id\s*=\s*(\d+);'),
+    re.compile(r'<!-- item_id = (\d+); -->'),
+    re.compile(r'<!-- id: (\d+) -->'),
+    re.compile(r'\$item_id = (\d+);'),
+]
+# h1.den_articol oricum ar fi ordonate atributele (ca find('h1', class_='den_articol') din BeautifulSoup)
+H1_PATTERN = re.compile(r'<h1\b[^>]*?\sclass\s*=\s*(["\'])(?:[^"\']*\s)?den_articol(?:\s[^"\']*)?\1[^>]*>(.*?)</h1>',
+                        re.DOTALL)
+FLAGS_PATTERN = re.compile(r'<!-- FLAGS_1 -->(.*?)<!-- FLAGS -->', re.DOTALL)
+FLAG_LINK_PATTERNS = {
+    'ro': [
+        re.compile(r'<a href="https://neculaifantanaru\.com/([^"]+)"[^>]*?><img[^>]*?title="ro"[^>]*?></a>'),
+        re.compile(r'<a href="https://neculaifantanaru\.com/([^"]+)"[^>]*?title="ro"[^>]*?><img[^>]*?></a>'),
+        re.compile(r'<a href="https://neculaifantanaru\.com/([^"]+)"[^>]*?><img[^>]*?alt="ro"[^>]*?></a>'),
+        re.compile(r'<a [^>]*?href="https://neculaifantanaru\.com/([^"]*?)"[^>]*?>(?:(?!</a>).)*?flag_lang_ro\.jpg', re.DOTALL),
+    ],
+    'en': [
+        re.compile(r'<a href="https://neculaifantanaru\.com/en/([^"]+)"[^>]*?><img[^>]*?title="en"[^>]*?></a>'),
+        re.compile(r'<a href="https://neculaifantanaru\.com/en/([^"]+)"[^>]*?title="en"[^>]*?><img[^>]*?></a>'),
+        re.compile(r'<a href="https://neculaifantanaru\.com/en/([^"]+)"[^>]*?><img[^>]*?alt="en"[^>]*?></a>'),
+        re.compile(r'<a [^>]*?href="https://neculaifantanaru\.com/en/([^"]*?)"[^>]*?>(?:(?!</a>).)*?flag_lang_en\.jpg', re.DOTALL),
+    ],
+}
+ARTICOL_PATTERN = re.compile(r'<!-- ARTICOL START -->(.*?)<!-- ARTICOL FINAL -->', re.DOTALL)
+TEXT_DREAPTA_PATTERN = re.compile(r'<td class="text_dreapta">(.*?)</td>', re.DOTALL)
+DATE_PATTERN = re.compile(r'On (.*?), in')
+CATEGORY_PATTERN = re.compile(r'<a href="https://neculaifantanaru\.com/(?:en/)?([^"]+?)(?:\.html)?"[^>]*>(.*?)</a>')
+FEATURE_IMG_PATTERN = re.compile(r'<div class="feature-img-wrap"[^>]*>\s*(?:<[^>]*>\s*)*?<img[^>]*?src="([^"]+)"', re.DOTALL)
+IMAGE_PATTERN = re.compile(r'<img[^>]*?src="([^"]*images/[^"]+?\.(?:jpg|jpeg|png|webp))"', re.IGNORECASE)
+LEAD_PATTERNS = [
+    re.compile(r'<h2 class="text_obisnuit2"[^>]*>(.*?)</h2>', re.DOTALL),
+    re.compile(r'<p class="text_obisnuit2"[^>]*>(.*?)</p>', re.DOTALL),
+]
+TAG_PATTERN = re.compile(r'<[^>]+>')
+SPACES_PATTERN = re.compile(r'\s+')
+
+def clean_text(fragment):
+    """Elimină tag-urile și entitățile HTML dintr-un fragment"""
+    text = html.unescape(TAG_PATTERN.sub('', fragment))
+    return SPACES_PATTERN.sub(' ', text).strip()
+
+def decode_content(raw):
+    """Decodează conținutul (utf-8, apoi latin-1, ca în Pasul 0)"""
+    try:
+        return raw.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        return raw.decode('latin-1'), 'latin-1'
+
+def extract_item_id(content):
+    """Extrage $item_id din comentariul HTML"""
+    for pattern in ID_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            return int(match.group(1))
+    return None
+
+def extract_flag_link(flags_content, language):
+    """Extrage slug-ul link-ului ro/en din secțiunea FLAGS"""
+    for pattern in FLAG_LINK_PATTERNS[language]:
+        match = pattern.search(flags_content)
+        if match:
+            return os.path.splitext(match.group(1))[0]
+    return None
+
+def extract_page_fields(content):
+    """Extrage toate câmpurile indexate dintr-o pagină, într-o singură trecere pe regiuni"""
+    fields = {'item_id': extract_item_id(content)}
+
+    # Doar titlul din h1: Pasul 1 B potrivește articolele după el, iar paginile fără h1 se sar
+    h1_match = H1_PATTERN.search(content)
+    fields['title'] = clean_text(h1_match.group(2)) if h1_match else None
+
+    flags_match = FLAGS_PATTERN.search(content)
+    flags_content = flags_match.group(1) if flags_match else ''
+    fields['flags_ro'] = extract_flag_link(flags_content, 'ro') if flags_content else None
+    fields['flags_en'] = extract_flag_link(flags_content, 'en') if flags_content else None
+
+    fields['date'] = fields['category'] = fields['category_title'] = None
+    dreapta_match = TEXT_DREAPTA_PATTERN.search(content)
+    if dreapta_match:
+        dreapta = dreapta_match.group(1)
+        date_match = DATE_PATTERN.search(dreapta)
+        if date_match:
+            fields['date'] = date_match.group(1).strip()
+        category_match = CATEGORY_PATTERN.search(dreapta)
+        if category_match:
+            fields['category'] = category_match.group(1)
+            fields['category_title'] = clean_text(category_match.group(2))
+
+    image_match = FEATURE_IMG_PATTERN.search(content) or IMAGE_PATTERN.search(content)
+    fields['image_url'] = image_match.group(1) if image_match else None
+
+    # Lead-ul se caută doar în articol, nu în coloanele laterale
+    articol_match = ARTICOL_PATTERN.search(content)
+    articol = articol_match.group(1) if articol_match else content
+    fields['lead'] = None
+    for pattern in LEAD_PATTERNS:
+        lead_match = pattern.search(articol)
+        if lead_match:
+            fields['lead'] = clean_text(lead_match.group(1))
+            break
+
+    return fields
+
+def open_index(db_path=INDEX_DB):
+    """Deschide (sau creează) baza de date a indexului"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    if conn.execute('PRAGMA user_version').fetchone()[0] != INDEX_VERSION:
+        conn.execute('DROP TABLE IF EXISTS pages')
+        conn.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+    conn.executescript(SCHEMA)
+    return conn
+
+def refresh_folder(conn, folder, lang=None, verbose=False):
+    """Actualizează indexul pentru un folder, recitind doar fișierele modificate"""
+    stats = {'nou': 0, 'actualizat': 0, 'neschimbat': 0, 'sters': 0}
+    if not os.path.isdir(folder):
+        print(f"ATENȚIE: Folderul nu există: {folder}")
+        return stats
+
+    known = {row['path']: row for row in conn.execute(
+        'SELECT path, mtime, size, sha1 FROM pages WHERE folder = ?', (folder,))}
+    seen = set()
+
+    for entry in os.scandir(folder):
+        if not entry.is_file() or not entry.name.lower().endswith('.html'):
+            continue
+        path = entry.path
+        seen.add(path)
+        st = entry.stat()
+        old = known.get(path)
+
+        if old is not None and old['mtime'] == st.st_mtime and old['size'] == st.st_size:
+            stats['neschimbat'] += 1
+            continue
+
+        with open(path, 'rb') as f:
+            raw = f.read()
+        sha1 = hashlib.sha1(raw).hexdigest()
+
+        if old is not None and old['sha1'] == sha1:
+            # Doar mtime s-a schimbat (ex. copiere) - nu mai extragem din nou
+            conn.execute('UPDATE pages SET mtime = ?, size = ? WHERE path = ?',
+                         (st.st_mtime, st.st_size, path))
+            stats['neschimbat'] += 1
+            continue
+
+        content, encoding = decode_content(raw)
+        fields = extract_page_fields(content)
+        fields.update({
+            'path': path,
+            'folder': folder,
+            'filename': entry.name,
+            'lang': lang,
+            'slug': os.path.splitext(entry.name)[0],
+            'encoding': encoding,
+            'mtime': st.st_mtime,
+            'size': st.st_size,
+            'sha1': sha1,
+        })
+        conn.execute(
+            f'INSERT OR REPLACE INTO pages ({", ".join(COLUMNS)}) VALUES ({", ".join("?" * len(COLUMNS))})',
+            [fields[column] for column in COLUMNS])
+
+        stats['actualizat' if old is not None else 'nou'] += 1
+        if verbose:
+            print(f"  Indexat: {entry.name} (ID: {fields['item_id']})")
+
+    removed = [path for path in known if path not in seen]
+    if removed:
+        conn.executemany('DELETE FROM pages WHERE path = ?', [(path,) for path in removed])
+        stats['sters'] = len(removed)
+
+    conn.commit()
+    return stats
+
+def refresh(conn, folders=CORPUS_FOLDERS, verbose=False):
+    """Actualizează indexul pentru toate folderele (folder, limbă)"""
+    totals = {}
+    for folder, lang in folders:
+        stats = refresh_folder(conn, folder, lang, verbose)
+        print(f"Index {folder}: {stats['nou']} noi, {stats['actualizat']} actualizate, "
+              f"{stats['neschimbat']} neschimbate, {stats['sters']} șterse")
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+    return totals
+
+def pages_in_folder(conn, folder):
+    """Returnează toate paginile indexate dintr-un folder, ordonate după nume"""
+    return conn.execute('SELECT * FROM pages WHERE folder = ? ORDER BY filename', (folder,)).fetchall()
+
+def find_by_item_id(conn, item_id, lang=None):
+    """Găsește paginile cu un anumit item_id"""
+    if lang:
+        return conn.execute('SELECT * FROM pages WHERE item_id = ? AND lang = ?', (int(item_id), lang)).fetchall()
+    return conn.execute('SELECT * FROM pages WHERE item_id = ?', (int(item_id),)).fetchall()
+
+def find_by_slug(conn, slug, lang=None):
+    """Găsește paginile după numele fișierului (fără .html)"""
+    slug = os.path.splitext(slug)[0]
+    if lang:
+        return conn.execute('SELECT * FROM pages WHERE slug = ? AND lang = ?', (slug, lang)).fetchall()
+    return conn.execute('SELECT * FROM pages WHERE slug = ?', (slug,)).fetchall()
+
+def find_by_flags_link(conn, language, slug):
+    """Găsește paginile al căror link ro/en din FLAGS indică spre slug"""
+    column = 'flags_ro' if language == 'ro' else 'flags_en'
+    return conn.execute(f'SELECT * FROM pages WHERE {column} = ?', (os.path.splitext(slug)[0],)).fetchall()
+
+def shared_connection(db_path=INDEX_DB):
+    """Conexiunea la index deschisă o singură dată per proces"""
+    if db_path not in _shared_connections:
+        _shared_connections[db_path] = open_index(db_path)
+    return _shared_connections[db_path]
+
+def close_shared():
+    """Închide conexiunile partajate și golește folderele încărcate"""
+    for conn in _shared_connections.values():
+        conn.close()
+    _shared_connections.clear()
+    _loaded_folders.clear()
+
+def load_folder(folder, lang=None, db_path=INDEX_DB):
+    """Reîmprospătează un folder și returnează paginile lui (scurtătură pentru scripturi)"""
+    conn = shared_connection(db_path)
+    stats = refresh_folder(conn, folder, lang)
+    key = (db_path, folder)
+    # Dacă niciun fișier nu s-a schimbat de la ultima încărcare, refolosim rândurile deja citite
+    if key not in _loaded_folders or stats['nou'] or stats['actualizat'] or stats['sters']:
+        _loaded_folders[key] = [dict(row) for row in pages_in_folder(conn, folder)]
+    return [dict(page) for page in _loaded_folders[key]]
+
+if __name__ == "__main__":
+    connection = open_index()
+    try:
+        totals = refresh(connection, verbose=True)
+        print(f"\nTotal: {totals}")
+    finally:
+        connection.close()
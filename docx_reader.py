@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Citire în flux a unui .docx pentru Pasul 2, fără modelul de obiecte python-docx.
+
+word/document.xml se citește direct din arhivă cu lxml.iterparse: fiecare
+paragraf din corpul documentului (<w:p> copil direct al <w:body>) se dă mai
+departe imediat ce s-a terminat, apoi se șterge din arbore împreună cu tot ce
+era înaintea lui (tabele etc.), așa că memoria rămâne aceeași indiferent cât de
+mare e documentul tradus. Ce se citește e exact ce dădea python-docx:
+
+- alignment: w:pPr/w:jc/@w:val ('center', 'both'...) sau None
+- text: ca paragraph.text (run-urile directe și cele din <w:hyperlink>)
+- runs: (text, bold, italic) ca paragraph.runs (doar run-urile directe);
+  bold/italic sunt None (nesetat), True sau False, ca run.bold/run.italic
+
+    for paragraph in iter_paragraphs('bebe.docx'):
+        if paragraph.alignment == ALIGN_CENTER:
+            print(paragraph.text)
+
+Benchmark și verificarea identității cu python-docx: benchmark_docx_reader.py
+"""
+
+import zipfile
+import posixpath
+
+from lxml import etree
+
+from docx_writer import ALIGN_CENTER
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_BODY = W + 'body'
+W_P = W + 'p'
+W_PPR = W + 'pPr'
+W_JC = W + 'jc'
+W_R = W + 'r'
+W_RPR = W + 'rPr'
+W_B = W + 'b'
+W_I = W + 'i'
+W_T = W + 't'
+W_HYPERLINK = W + 'hyperlink'
+W_VAL = W + 'val'
+W_TYPE = W + 'type'
+
+RELS_PART = '_rels/.rels'
+RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+DEFAULT_DOCUMENT_PART = 'word/document.xml'
+
+# Textul elementelor dintr-un run, ca în python-docx (w:br contează doar dacă e rând nou, nu pagină/coloană)
+RUN_CHARACTERS = {
+    W + 'tab': '\t',
+    W + 'ptab': '\t',
+    W + 'cr': '\n',
+    W + 'noBreakHyphen': '-',
+}
+BREAK_TYPES = (None, 'textWrapping')
+OFF_VALUES = ('0', 'false', 'off')
+
+class DocxParagraph:
+    """Un paragraf citit: aliniere, text și run-uri (text, bold, italic)"""
+
+    __slots__ = ('alignment', 'text', 'runs')
+
+    def __init__(self, alignment, text, runs):
+        self.alignment = alignment
+        self.text = text
+        self.runs = runs
+
+def run_text(run):
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or '')
+        elif tag in RUN_CHARACTERS:
+            parts.append(RUN_CHARACTERS[tag])
+        elif tag == W + 'br' and child.get(W_TYPE) in BREAK_TYPES:
+            parts.append('\n')
+    return ''.join(parts)
+
+def _on_off(properties, tag):
+    """None dacă proprietatea lipsește, altfel valoarea ei (w:val lipsă = True)"""
+    element = properties.find(tag) if properties is not None else None
+    if element is None:
+        return None
+    return element.get(W_VAL) not in OFF_VALUES
+
+def read_paragraph(p):
+    """DocxParagraph pentru un element <w:p>"""
+    properties = p.find(W_PPR)
+    jc = properties.find(W_JC) if properties is not None else None
+    alignment = jc.get(W_VAL) if jc is not None else None
+    text_parts = []
+    runs = []
+    for child in p:
+        if child.tag == W_R:
+            text = run_text(child)
+            run_properties = child.find(W_RPR)
+            runs.append((text, _on_off(run_properties, W_B), _on_off(run_properties, W_I)))
+            text_parts.append(text)
+        elif child.tag == W_HYPERLINK:
+            text_parts.extend(run_text(run) for run in child.iterchildren(W_R))
+    return DocxParagraph(alignment, ''.join(text_parts), runs)
+
+def document_part_name(archive):
+    """Partea principală a documentului, după _rels/.rels (de obicei word/document.xml)"""
+    try:
+        relationships = etree.fromstring(archive.read(RELS_PART))
+    except (KeyError, etree.XMLSyntaxError):
+        return DEFAULT_DOCUMENT_PART
+    for relationship in relationships.iter(RELS_NS + 'Relationship'):
+        if relationship.get('Type') == OFFICE_DOCUMENT:
+            return posixpath.normpath(relationship.get('Target', '').lstrip('/'))
+    return DEFAULT_DOCUMENT_PART
+
+def iter_paragraphs(file_path):
+    """Paragrafele din corpul documentului, în ordine, citite în flux"""
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open(document_part_name(archive)) as stream:
+            for _, element in etree.iterparse(stream, events=('end',), tag=W_P):
+                parent = element.getparent()
+                if parent is None or parent.tag != W_BODY:
+                    continue  # paragraf dintr-un tabel etc.; python-docx nu îl dă în doc.paragraphs
+                yield read_paragraph(element)
+                # Paragraful și tot ce era înaintea lui nu mai trebuie
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
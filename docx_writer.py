@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Scriere rapidă de .docx pentru Pasul 1 A, fără modelul de obiecte python-docx.
+
+Paragrafele și run-urile se scriu direct ca text WordprocessingML (<w:p>,
+<w:r>, <w:t>); la salvare corpul se parsează o singură dată cu lxml și se pune
+în documentul gol din șablonul python-docx, deci stilurile, setările și
+celelalte părți ale pachetului sunt exact cele de până acum. XML-ul rezultat
+e identic cu cel produs de add_paragraph/add_run + bold/italic/culoare/mărime:
+tab -> <w:tab/>, \\n și \\r -> <w:br/>, xml:space="preserve" pe textele cu
+spații la capete, iar un text cu caractere de control ridică aceeași eroare
+ca lxml, după ce partea de run deja scrisă rămâne în paragraf.
+
+    document = DocxWriter()
+    paragraph = document.add_paragraph(alignment=ALIGN_CENTER)
+    paragraph.add_run("Titlu", bold=True, color='FF0000')
+    document.add_paragraph().add_run("ID: 12", color='808080', size=8)
+    document.save('articole_compilate.docx')
+
+Benchmark și verificarea identității cu python-docx: benchmark_docx_writer.py
+"""
+
+import re
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+ALIGN_CENTER = 'center'
+
+XML_ERROR = "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"
+
+# Caracterele pe care lxml nu le acceptă în text
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+# Ce desparte textul unui run în <w:t>, <w:tab/> și <w:br/>
+RUN_SEPARATORS = re.compile(r'([\t\r\n])')
+
+def _text_xml(text):
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+def run_content(text):
+    """
+    Conținutul unui run pentru text: (xml, eroare). La un text invalid, xml e
+    partea scrisă până la el (ca la python-docx) și eroarea e un ValueError.
+    """
+    parts = []
+    for piece in RUN_SEPARATORS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            parts.append('<w:br/>')
+        elif piece:
+            if INVALID_XML_CHARS.search(piece):
+                return ''.join(parts), ValueError(XML_ERROR)
+            parts.append(_text_xml(piece))
+    return ''.join(parts), None
+
+def run_properties(bold=None, italic=None, color=None, size=None):
+    """<w:rPr> în ordinea din schemă (b, i, color, sz); None = proprietate nesetată"""
+    props = []
+    if bold is not None:
+        props.append('<w:b/>' if bold else '<w:b w:val="0"/>')
+    if italic is not None:
+        props.append('<w:i/>' if italic else '<w:i w:val="0"/>')
+    if color is not None:
+        props.append(f'<w:color w:val="{color}"/>')
+    if size is not None:
+        props.append(f'<w:sz w:val="{int(size * 2)}"/>')
+    return f'<w:rPr>{"".join(props)}</w:rPr>' if props else ''
+
+class Paragraph:
+    """Un <w:p>: aliniere și lista de run-uri deja scrise ca XML"""
+
+    __slots__ = ('alignment', '_runs')
+
+    def __init__(self, alignment=None):
+        self.alignment = alignment
+        self._runs = []
+
+    def add_run(self, text=None, bold=None, italic=None, color=None, size=None):
+        """
+        Adaugă un run; color e hex ('FF0000'), size e în puncte.
+        Ridică ValueError pentru text cu caractere de control (partea de dinainte rămâne).
+        """
+        content, error = run_content(text) if text else ('', None)
+        if error is not None:
+            self._runs.append(f'<w:r>{content}</w:r>' if content else '<w:r/>')
+            raise error
+        properties = run_properties(bold, italic, color, size)
+        self._runs.append(f'<w:r>{properties}{content}</w:r>' if properties or content else '<w:r/>')
+
+    def xml(self):
+        properties = f'<w:pPr><w:jc w:val="{self.alignment}"/></w:pPr>' if self.alignment else ''
+        if not properties and not self._runs:
+            return '<w:p/>'
+        return f'<w:p>{properties}{"".join(self._runs)}</w:p>'
+
+class DocxWriter:
+    """Corpul documentului ca listă de paragrafe; XML-ul se asamblează la salvare"""
+
+    def __init__(self):
+        self._parts = []  # Paragraph sau XML gata scris (append_body)
+
+    def add_paragraph(self, text=None, alignment=None):
+        paragraph = Paragraph(alignment)
+        self._parts.append(paragraph)
+        if text:
+            paragraph.add_run(text)
+        return paragraph
+
+    def append_body(self, body_xml):
+        """Adaugă paragrafe deja scrise ca XML (ex. body_xml() al altui DocxWriter, dintr-un proces copil)"""
+        self._parts.append(body_xml)
+
+    def body_xml(self):
+        return ''.join(part if isinstance(part, str) else part.xml() for part in self._parts)
+
+    def save(self, path):
+        """Pune corpul în documentul gol din șablonul python-docx și salvează"""
+        document = Document()
+        body = document.element.body
+        section = body.sectPr
+        fragment = parse_xml(f'<w:body {nsdecls("w")}>{self.body_xml()}</w:body>')
+        for element in list(fragment):
+            if section is not None:
+                section.addprevious(element)
+            else:
+                body.append(element)
+        document.save(path)
@@ -0,0 +1,643 @@
+# -*- coding: utf-8 -*-
+"""
+Încărcare pe FTP cu sesiuni persistente.
+
+FTPSessionPool ține deschise până la N sesiuni autentificate, deja mutate în
+directorul de pe server (ex. /public_html/en/), și împarte fișierele între
+ele. O sesiune căzută (timeout, 421, conexiune închisă) se închide și se
+redeschide automat, iar fișierul se reîncearcă de câteva ori.
+
+    with FTPSessionPool(FTP_SERVER, FTP_USER, FTP_PASSWORD, FTP_REMOTE_DIR, size=4) as pool:
+        results = pool.upload_many([(cale_locala, nume_pe_server), ...])
+
+Sincronizare delta (sync): un manifest local ține pentru fiecare fișier urcat
+dimensiunea, mtime și sha1. Se urcă doar fișierele noi sau schimbate; dacă
+serverul știe MLSD, se verifică și lista de pe server (un fișier șters sau cu
+altă dimensiune pe server se urcă din nou chiar dacă manifestul spune că e la zi).
+
+    with FTPSessionPool(...) as pool:
+        report = sync(pool, [(cale_locala, nume_pe_server), ...], manifest_path)
+
+Publicare suprapusă cu procesarea (DeployQueue): un pas pune fiecare fișier
+în coadă imediat ce l-a scris, firele din fundal îl urcă pe FTP și îl copiază
+local, iar la final finish() așteaptă ambele cozi și dă un raport comun.
+
+Reluare după o întrerupere: fiecare încărcare e verificată cu SIZE, iar un
+jurnal (manifest + '.journal', o linie JSON per eveniment) ține fișierele deja
+încărcate. Dacă o rulare moare la fișierul 900 din 1000, rularea următoare
+trece jurnalul în manifest și urcă doar ce a rămas; un fișier mare început și
+neterminat continuă de unde a rămas (REST), nu de la zero.
+
+Serverul, portul și directorul sunt parametri, deci totul se poate testa cu un
+server local pyftpdlib.
+"""
+
+import os
+import json
+import hashlib
+import time
+import queue
+import ftplib
+import threading
+
+from local_copy import CopyStats, copy_file
+
+# Erori după care merită redeschisă sesiunea și reîncercat fișierul
+RETRYABLE_ERRORS = (ftplib.error_temp, ftplib.error_reply, ftplib.error_proto, OSError, EOFError)
+
+# De la ce dimensiune un fișier întrerupt se continuă cu REST în loc să se urce de la zero
+RESUME_MIN_BYTES = 1024 * 1024
+
+def change_to_remote_dir(ftp, remote_dir, verbose=False):
+    """Intră în directorul de pe server, creând nivelurile care lipsesc"""
+    try:
+        ftp.cwd(remote_dir)
+        return
+    except ftplib.error_perm:
+        pass
+
+    current_dir = "/"
+    for part in remote_dir.strip('/').split('/'):
+        if not part:
+            continue
+        current_dir = current_dir + part + "/"
+        try:
+            ftp.cwd(current_dir)
+        except ftplib.error_perm:
+            try:
+                ftp.mkd(current_dir)
+                if verbose:
+                    print(f"Creat director pe FTP: {current_dir}")
+            except ftplib.error_perm:
+                # Altă sesiune din pool l-a creat între timp
+                pass
+            ftp.cwd(current_dir)
+
+def connect(host, user, password, remote_dir, port=21, timeout=30):
+    """O sesiune nouă: conectare, autentificare și intrare în directorul de lucru"""
+    ftp = ftplib.FTP()
+    ftp.connect(host, port, timeout=timeout)
+    ftp.login(user, password)
+    change_to_remote_dir(ftp, remote_dir)
+    return ftp
+
+def remote_file_size(ftp, remote_name, set_binary=True):
+    """Dimensiunea unui fișier de pe server (SIZE), None dacă lipsește sau serverul nu știe SIZE"""
+    try:
+        if set_binary:
+            ftp.voidcmd('TYPE I')  # unele servere refuză SIZE în modul ASCII
+        return ftp.size(remote_name)
+    except ftplib.error_perm:
+        return None
+
+def close_quietly(ftp):
+    """Închide o sesiune fără să ridice erori (sesiunea poate fi deja căzută)"""
+    try:
+        ftp.quit()
+    except Exception:
+        try:
+            ftp.close()
+        except Exception:
+            pass
+
+class FTPSessionPool:
+    """Până la `size` sesiuni FTP autentificate, refolosite pentru toate fișierele"""
+
+    def __init__(self, host, user, password, remote_dir, size=4, port=21,
+                 retries=3, retry_delay=1.0, timeout=30, verbose=True):
+        self.host = host
+        self.user = user
+        self.password = password
+        self.remote_dir = remote_dir
+        self.size = max(1, size)
+        self.port = port
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.verbose = verbose
+
+        self.connections = 0   # câte autentificări s-au făcut (inclusiv reconectări)
+        self.reconnects = 0
+        self.errors = []       # "nume: eroare" pentru fișierele care nu s-au putut încărca
+        self._idle = queue.LifoQueue()
+        self._open = 0
+        self._lock = threading.Lock()
+        self._all = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    def _acquire(self):
+        """O sesiune liberă; se deschide una nouă doar dacă nu s-a atins limita"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._open < self.size
+            if can_open:
+                self._open += 1
+        if not can_open:
+            return self._idle.get()
+        try:
+            ftp = connect(self.host, self.user, self.password, self.remote_dir, self.port, self.timeout)
+        except Exception:
+            with self._lock:
+                self._open -= 1
+            raise
+        with self._lock:
+            self.connections += 1
+            self._all.append(ftp)
+        self._log(f"Sesiune FTP deschisă către {self.host} ({self.connections} în total)")
+        return ftp
+
+    def _release(self, ftp):
+        self._idle.put(ftp)
+
+    def _discard(self, ftp):
+        """Închide o sesiune căzută; locul ei poate fi ocupat de o sesiune nouă"""
+        close_quietly(ftp)
+        with self._lock:
+            self._open -= 1
+            if ftp in self._all:
+                self._all.remove(ftp)
+
+    def run(self, action, description):
+        """
+        Rulează action(ftp) pe o sesiune din pool, cu reconectare și reîncercare
+        la erori temporare. Erorile permanente (5xx) nu se reîncearcă.
+        """
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.reconnects += 1
+                time.sleep(self.retry_delay * attempt)
+                self._log(f"  Reîncercare {attempt}/{self.retries}: {description}")
+            try:
+                ftp = self._acquire()
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+                continue
+            try:
+                result = action(ftp)
+            except ftplib.error_perm:
+                self._release(ftp)
+                raise
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+                self._discard(ftp)
+                continue
+            self._release(ftp)
+            return result
+        raise last_error
+
+    def upload(self, local_path, remote_name, resume=False, verify=True, on_start=None):
+        """
+        Încarcă un fișier; returnează True/False.
+        resume: pe server poate exista un început al aceluiași fișier (din jurnal), care
+        se continuă cu REST dacă fișierul e mare. La o reîncercare se continuă doar
+        dacă tot ce e pe server a fost trimis de această încărcare; altfel (ex. STOR
+        căzut înainte de transfer, cu versiunea veche încă pe server) se urcă de la zero.
+        verify: după încărcare, dimensiunea de pe server (SIZE) trebuie să fie cea locală.
+        on_start: apelat o singură dată, după primul bloc trimis pe conexiunea de date;
+        abia atunci STOR a înlocuit versiunea veche de pe server cu acest fișier.
+        """
+        attempts = []
+        sent = [0]  # până unde a ajuns, cel mult, fișierul pe server în încercările de până acum
+        started = [on_start is None]
+
+        def count_sent(block):
+            sent[0] += len(block)
+            if not started[0]:
+                started[0] = True
+                on_start()
+
+        def store(ftp):
+            size = os.path.getsize(local_path)
+            offset = 0
+            if (resume or attempts) and size >= RESUME_MIN_BYTES:
+                # Octeții de pe server care sigur sunt din acest fișier
+                known = size if resume and not attempts else sent[0]
+                remote_size = remote_file_size(ftp, remote_name)
+                if remote_size and remote_size < size and remote_size <= known:
+                    offset = remote_size
+                    self._log(f"  Continuare {remote_name} de la {offset} octeți (REST)")
+            attempts.append(offset)
+            sent[0] = offset
+            with open(local_path, 'rb') as file:
+                file.seek(offset)
+                ftp.storbinary(f'STOR {remote_name}', file, callback=count_sent, rest=offset or None)
+            if verify:
+                # storbinary a lăsat sesiunea în TYPE I
+                remote_size = remote_file_size(ftp, remote_name, set_binary=False)
+                if remote_size is not None and remote_size != size:
+                    raise ftplib.error_temp(f"451 {remote_name} are {remote_size} octeți pe server, nu {size}")
+
+        try:
+            self.run(store, remote_name)
+            self._log(f"Fișier încărcat cu succes pe FTP: {remote_name}")
+            return True
+        except Exception as e:
+            with self._lock:
+                self.errors.append(f"{remote_name}: {str(e)}")
+            self._log(f"Eroare la încărcarea pe FTP a fișierului {remote_name}: {str(e)}")
+            return False
+
+    def listing(self):
+        """Lista de pe server {nume: dimensiune} prin MLSD, sau None dacă serverul nu o suportă"""
+        try:
+            return self.run(remote_listing, 'MLSD')
+        except ftplib.error_perm:
+            return None
+
+    def upload_many(self, items):
+        """
+        Încarcă o listă de (cale locală, nume pe server) pe toate sesiunile în paralel.
+        Returnează rezultatele în ordinea listei: {'name', 'ok', 'seconds', 'bytes'}.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        work = queue.Queue()
+        for index, item in enumerate(items):
+            work.put((index, item))
+
+        def worker():
+            while True:
+                try:
+                    index, (local_path, remote_name) = work.get_nowait()
+                except queue.Empty:
+                    return
+                start = time.perf_counter()
+                ok = self.upload(local_path, remote_name)
+                results[index] = {
+                    'name': remote_name,
+                    'ok': ok,
+                    'seconds': time.perf_counter() - start,
+                    'bytes': os.path.getsize(local_path) if ok else 0,
+                }
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(self.size, len(items)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def close(self):
+        """Închide toate sesiunile deschise"""
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            sessions, self._all = self._all, []
+            self._open = 0
+        for ftp in sessions:
+            close_quietly(ftp)
+
+def remote_listing(ftp):
+    """{nume: dimensiune} pentru fișierele din directorul curent (MLSD)"""
+    listing = {}
+    for name, facts in ftp.mlsd(facts=['type', 'size']):
+        if facts.get('type', 'file') == 'file' and 'size' in facts:
+            listing[name] = int(facts['size'])
+    return listing
+
+# ---------------------------------------------------------------------------
+# Sincronizare delta
+# ---------------------------------------------------------------------------
+
+MANIFEST_VERSION = 1
+
+def load_manifest(manifest_path, server):
+    """Manifestul ultimei sincronizări (gol dacă lipsește, e din altă versiune sau pentru alt server)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if not manifest or manifest.get('version') != MANIFEST_VERSION or manifest.get('server') != server:
+        manifest = {'version': MANIFEST_VERSION, 'server': server, 'files': {}}
+    return manifest
+
+def save_manifest(manifest_path, manifest):
+    """Scrie manifestul atomic (fișier temporar + os.replace)"""
+    folder = os.path.dirname(os.path.abspath(manifest_path))
+    os.makedirs(folder, exist_ok=True)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+def local_signature(local_path, previous=None):
+    """
+    {'size', 'mtime', 'sha1'} pentru un fișier local. Dacă size și mtime sunt
+    aceleași ca în manifest, sha1 se refolosește fără a reciti fișierul.
+    """
+    stat = os.stat(local_path)
+    if previous and previous.get('size') == stat.st_size and previous.get('mtime') == stat.st_mtime:
+        return {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': previous['sha1']}
+    digest = hashlib.sha1()
+    with open(local_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': digest.hexdigest()}
+
+class DeployJournal:
+    """
+    Jurnalul unei sincronizări în curs: o linie JSON per eveniment, scrisă imediat.
+    'start' = serverul a primit primul bloc al unui fișier mare (poate rămâne parțial pe server),
+    'done'  = fișier încărcat și verificat cu SIZE.
+    La finalul reușit al sincronizării, jurnalul se șterge (totul e deja în manifest).
+    """
+
+    def __init__(self, journal_path):
+        self.journal_path = journal_path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Ce a rămas de la o rulare întreruptă: (încărcate {nume: semnătură}, începute {nume: sha1})"""
+        done, started = {}, {}
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # ultima linie scrisă pe jumătate la întrerupere
+                    if entry['event'] == 'done':
+                        done[entry['name']] = entry['signature']
+                        started.pop(entry['name'], None)
+                    elif entry['event'] == 'start':
+                        started[entry['name']] = entry['signature']['sha1']
+        except OSError:
+            pass
+        return done, started
+
+    def record(self, event, name, signature):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self._file.write(json.dumps({'event': event, 'name': name, 'signature': signature},
+                                        ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def remove(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+
+def needs_upload(signature, previous, remote_size=None, listing=False):
+    """
+    Un fișier se urcă dacă e nou sau schimbat față de manifest, ori (când avem
+    lista MLSD) dacă lipsește de pe server sau are acolo altă dimensiune.
+    """
+    if previous is None or previous.get('sha1') != signature['sha1']:
+        return True
+    return listing and remote_size != signature['size']
+
+class DeployQueue:
+    """
+    Coadă de fișiere de publicat, golită în fundal în timp ce pașii încă lucrează:
+    - firele de upload (câte unul pe sesiune din pool) urcă fișierele pe FTP,
+      sărind peste cele neschimbate dacă există manifest;
+    - un fir separat copiază fișierele în copy_dir (dacă e dat), prin
+      local_copy.copy_file: fișierele identice nu se rescriu, iar copy_mode
+      poate fi 'copy', 'hardlink' sau 'reflink'.
+
+    Un pas apelează push(cale) imediat ce a terminat de scris fișierul; finish()
+    este bariera: așteaptă ambele cozi și returnează raportul comun.
+
+        queue = DeployQueue(pool, copy_dir=..., manifest_path=...)
+        queue.start()
+        ... queue.push(cale) ...
+        report = queue.finish()
+    """
+
+    def __init__(self, pool, copy_dir=None, manifest_path=None, use_listing=True, owns_pool=False, copy_mode='copy'):
+        self.pool = pool
+        self.copy_dir = copy_dir
+        self.copy_mode = copy_mode
+        self.manifest_path = manifest_path
+        self.use_listing = use_listing
+        self.owns_pool = owns_pool
+
+        self.manifest = None
+        self.journal = None
+        self.resumable = {}      # nume -> sha1 pentru încărcările începute și neterminate data trecută
+        self.journal_files = 0   # fișiere deja încărcate de rularea întreruptă (din jurnal)
+        self.remote = None
+        self.pushed = set()
+        self.status = {}         # nume pe server -> 'incarcat' | 'neschimbat' | 'eroare'
+        self.copy_stats = CopyStats()
+        self.copy_errors = []
+        self.uploaded_bytes = 0
+        self.skipped_bytes = 0
+        self.upload_seconds = 0.0
+        self.upload_latencies = []   # durata fiecărei încărcări (secunde)
+
+        self._uploads = queue.Queue()
+        self._copies = queue.Queue()
+        self._lock = threading.Lock()
+        self._upload_threads = []
+        self._copy_thread = None
+        self._started = None
+        self._finished = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._finished is None:
+            self.finish()
+
+    def start(self):
+        """Pornește firele din fundal (și citește manifestul și lista de pe server)"""
+        self._started = time.perf_counter()
+        if self.manifest_path:
+            self.manifest = load_manifest(self.manifest_path,
+                                          f'{self.pool.host}:{self.pool.port}{self.pool.remote_dir}')
+            self.journal = DeployJournal(self.manifest_path + '.journal')
+            done, self.resumable = self.journal.load()
+            if done or self.resumable:
+                # Rularea trecută s-a întrerupt: ce s-a încărcat deja trece în manifest
+                self.manifest['files'].update(done)
+                self.journal_files = len(done)
+                print(f"Reluare sincronizare întreruptă: {len(done)} fișiere deja încărcate, "
+                      f"{len(self.resumable)} încărcări de continuat")
+            if self.use_listing:
+                try:
+                    self.remote = self.pool.listing()
+                except Exception as e:
+                    print(f"Lista de pe server nu a putut fi citită: {str(e)}")
+        self._upload_threads = [threading.Thread(target=self._upload_worker, daemon=True)
+                                for _ in range(self.pool.size)]
+        for thread in self._upload_threads:
+            thread.start()
+        if self.copy_dir:
+            self._copy_thread = threading.Thread(target=self._copy_worker, daemon=True)
+            self._copy_thread.start()
+        return self
+
+    def push(self, local_path, remote_name=None):
+        """Pune un fișier terminat în ambele cozi (upload și copiere locală)"""
+        remote_name = remote_name or os.path.basename(local_path)
+        self.pushed.add(os.path.abspath(local_path))
+        self._uploads.put((local_path, remote_name))
+        if self.copy_dir:
+            self._copies.put((local_path, remote_name))
+
+    def _upload_worker(self):
+        while True:
+            item = self._uploads.get()
+            if item is None:
+                return
+            self._upload_one(*item)
+
+    def _upload_one(self, local_path, remote_name):
+        signature = None
+        if self.manifest is not None:
+            with self._lock:
+                previous = self.manifest['files'].get(remote_name)
+            try:
+                signature = local_signature(local_path, previous)
+            except OSError as e:
+                print(f"Eroare la citirea fișierului {remote_name}: {str(e)}")
+                with self._lock:
+                    self.status[remote_name] = 'eroare'
+                return
+            remote_size = self.remote.get(remote_name) if self.remote is not None else None
+            if not needs_upload(signature, previous, remote_size, self.remote is not None):
+                with self._lock:
+                    self.status[remote_name] = 'neschimbat'
+                    self.skipped_bytes += signature['size']
+                return
+
+        resume = False
+        on_start = None
+        if self.journal is not None:
+            resume = self.resumable.get(remote_name) == signature['sha1']
+            if signature['size'] >= RESUME_MIN_BYTES:
+                # 'start' abia după primul bloc: dacă STOR cade înainte de transfer, pe server
+                # e încă versiunea veche, pe care rularea următoare nu trebuie s-o continue
+                on_start = lambda: self.journal.record('start', remote_name, signature)
+
+        start = time.perf_counter()
+        ok = self.pool.upload(local_path, remote_name, resume=resume, on_start=on_start)
+        seconds = time.perf_counter() - start
+        if ok and self.journal is not None:
+            self.journal.record('done', remote_name, signature)
+        with self._lock:
+            self.upload_seconds += seconds
+            self.upload_latencies.append(seconds)
+            self.status[remote_name] = 'incarcat' if ok else 'eroare'
+            if ok:
+                self.uploaded_bytes += signature['size'] if signature else os.path.getsize(local_path)
+            if self.manifest is not None:
+                if ok:
+                    self.manifest['files'][remote_name] = signature
+                else:
+                    self.manifest['files'].pop(remote_name, None)
+
+    def _copy_worker(self):
+        while True:
+            item = self._copies.get()
+            if item is None:
+                self._copies.task_done()
+                return
+            local_path, name = item
+            try:
+                copy_file(local_path, os.path.join(self.copy_dir, name), self.copy_mode, self.copy_stats)
+            except Exception as e:
+                self.copy_errors.append(f"{name}: {str(e)}")
+            self._copies.task_done()
+
+    def drain_copies(self):
+        """Așteaptă doar copierile locale (ex. înainte de un pas care citește copy_dir)"""
+        if self._copy_thread is not None:
+            self._copies.join()
+
+    def finish(self):
+        """Bariera: așteaptă golirea ambelor cozi, salvează manifestul și returnează raportul"""
+        for _ in self._upload_threads:
+            self._uploads.put(None)
+        if self._copy_thread is not None:
+            self._copies.put(None)
+        for thread in self._upload_threads:
+            thread.join()
+        if self._copy_thread is not None:
+            self._copy_thread.join()
+        if self.manifest is not None:
+            save_manifest(self.manifest_path, self.manifest)
+            # Manifestul conține acum tot ce era în jurnal
+            self.journal.remove()
+        if self.owns_pool:
+            self.pool.close()
+        self._finished = time.perf_counter()
+        return self.report()
+
+    def report(self):
+        """Raportul comun al celor două cozi"""
+        statuses = list(self.status.values())
+        return {
+            'status': dict(self.status),
+            'uploaded_files': statuses.count('incarcat'),
+            'uploaded_bytes': self.uploaded_bytes,
+            'skipped_files': statuses.count('neschimbat'),
+            'skipped_bytes': self.skipped_bytes,
+            'upload_errors': statuses.count('eroare'),
+            'upload_error_messages': list(self.pool.errors),
+            'copied_files': self.copy_stats.copied + self.copy_stats.linked,
+            'identical_files': self.copy_stats.identical,
+            'copy_summary': self.copy_stats.summary() if self.copy_dir else None,
+            'copy_errors': list(self.copy_errors),
+            'listing': self.remote is not None,
+            'journal_files': self.journal_files,
+            'connections': self.pool.connections,
+            'reconnects': self.pool.reconnects,
+            'seconds': (self._finished or time.perf_counter()) - (self._started or time.perf_counter()),
+        }
+
+def format_deploy_report(report):
+    """Liniile raportului de publicare (FTP + copiere locală)"""
+    mb = 1024 * 1024
+    lines = [
+        f"Publicare: {report['uploaded_files']} fișiere încărcate pe FTP ({report['uploaded_bytes'] / mb:.2f} MB), "
+        f"{report['skipped_files']} neschimbate sărite ({report['skipped_bytes'] / mb:.2f} MB), "
+        f"{report['upload_errors']} erori FTP",
+        f"Sesiuni FTP: {report['connections']} (reconectări: {report['reconnects']})"
+        + ("" if report['listing'] else ", fără listă MLSD"),
+    ]
+    lines.extend(f"  ✗ {error}" for error in report['upload_error_messages'])
+    if report['journal_files']:
+        lines.append(f"Reluare: {report['journal_files']} fișiere erau deja încărcate de rularea întreruptă")
+    if report['copy_summary']:
+        lines.append(f"Copiere locală: {report['copy_summary']}")
+        lines.extend(f"  ✗ {error}" for error in report['copy_errors'])
+    lines.append(f"Durata publicării: {report['seconds']:.2f}s")
+    return lines
+
+def sync(pool, items, manifest_path, use_listing=True):
+    """
+    Urcă doar fișierele noi sau schimbate față de manifest (și față de lista MLSD).
+    Returnează raportul DeployQueue: 'status' ({nume: 'incarcat' | 'neschimbat' | 'eroare'}),
+    'uploaded_bytes', 'skipped_files', 'skipped_bytes', 'listing' etc.
+    """
+    deploy_queue = DeployQueue(pool, manifest_path=manifest_path, use_listing=use_listing)
+    deploy_queue.start()
+    for local_path, remote_name in items:
+        deploy_queue.push(local_path, remote_name)
+    return deploy_queue.finish()
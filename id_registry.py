@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Registrul persistent al ID-urilor ($item_id) - înlocuiește fișierul de tracking
+"4------am ajuns la N", care ținea doar ultimul ID în numele unui fișier.
+
+Pentru fiecare item_id se păstrează fișierul RO, fișierul EN și momentul
+alocării; pe limbă se păstrează ultimul ID folosit. Fișierele sunt ținute după
+calea relativă la folderul limbii (config.RO_DIR / config.EN_DIR, cu '/'), ca
+ro\\articol.html și ro\\Python Files\\articol.html să nu se suprapună. Registrul
+e un JSON scris atomic (fișier temporar + os.replace), ca stage_state.py.
+Scanarea care atribuie ID-urile (id_scanner.py, din Pasul 0 și incrementerul EN)
+îl aduce la zi după fiecare rulare (sync), iar la încărcare se construiește
+indexul invers (limbă, fișier) -> item_id; Pasul 1 B ia de aici ID-urile
+paginilor RO (din pagini folosește doar titlurile).
+
+    registry = IdRegistry.load(config.ID_REGISTRY)
+    path = os.path.join(config.RO_DIR, 'articol.html')
+    registry.sync('ro', {path: 12, ...}, last_id=4999)   # cheia: 'articol.html'
+    registry.save()
+    item_id = registry.id_for_file('ro', path)
+"""
+
+import os
+import json
+from datetime import datetime
+
+import config
+
+# 2: fișierele sunt ținute după calea relativă la folderul limbii, nu doar după nume
+REGISTRY_VERSION = 2
+LANGUAGES = ('ro', 'en')
+LANGUAGE_ROOTS = {'ro': config.RO_DIR, 'en': config.EN_DIR}
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+class IdRegistry:
+    """item_id -> {'ro': fișier, 'en': fișier, 'allocated': dată}, plus indexul invers pe limbă"""
+
+    def __init__(self, path, entries=None, last_id=None, roots=None):
+        self.path = path
+        self.roots = dict(roots or LANGUAGE_ROOTS)
+        self.entries = {}
+        self.last_id = dict(last_id or {})
+        self._by_file = {lang: {} for lang in LANGUAGES}
+        for item_id, entry in (entries or {}).items():
+            self.entries[int(item_id)] = dict(entry)
+            for lang in LANGUAGES:
+                if entry.get(lang):
+                    self._by_file[lang][entry[lang]] = int(item_id)
+
+    @classmethod
+    def load(cls, path, roots=None):
+        """Citește registrul (sau unul gol dacă lipsește ori e din altă versiune)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path, roots=roots)
+        if data.get('version') != REGISTRY_VERSION:
+            return cls(path, roots=roots)
+        return cls(path, data.get('ids'), data.get('last_id'), roots)
+
+    def save(self):
+        """Scrie registrul atomic, ca o rulare întreruptă să nu lase un JSON incomplet"""
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        data = {
+            'version': REGISTRY_VERSION,
+            'last_id': self.last_id,
+            'ids': {str(item_id): self.entries[item_id] for item_id in sorted(self.entries)},
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.path)
+
+    def file_key(self, lang, file_path):
+        """Cheia fișierului în registru: calea relativă la folderul limbii, cu '/'"""
+        relative = os.path.relpath(os.path.abspath(file_path), os.path.abspath(self.roots[lang]))
+        return relative.replace(os.sep, '/')
+
+    def id_for_file(self, lang, file_path):
+        """ID-ul fișierului (calea lui) sau None"""
+        return self._by_file[lang].get(self.file_key(lang, file_path))
+
+    def assign(self, lang, file_path, item_id):
+        """Înregistrează că fișierul are ID-ul dat (mutându-l de pe ID-ul vechi, dacă avea altul)"""
+        key = self.file_key(lang, file_path)
+        item_id = int(item_id)
+        old_id = self._by_file[lang].get(key)
+        if old_id == item_id:
+            return
+        if old_id is not None:
+            self._clear(lang, old_id)
+        entry = self.entries.setdefault(item_id, {'allocated': _now()})
+        previous = entry.get(lang)
+        if previous and previous != key:
+            # ID-ul trece la alt fișier; cel vechi nu mai are ID în registru
+            del self._by_file[lang][previous]
+        entry[lang] = key
+        self._by_file[lang][key] = item_id
+
+    def _clear(self, lang, item_id):
+        entry = self.entries.get(item_id)
+        if entry is None:
+            return
+        entry.pop(lang, None)
+        if not any(entry.get(other) for other in LANGUAGES):
+            del self.entries[item_id]
+
+    def prune(self, lang, present_paths):
+        """Scoate fișierele dintr-o limbă care nu mai există; returnează câte s-au scos"""
+        present = {self.file_key(lang, path) for path in present_paths}
+        missing = [name for name in self._by_file[lang] if name not in present]
+        for name in missing:
+            self._clear(lang, self._by_file[lang].pop(name))
+        return len(missing)
+
+    def sync(self, lang, file_ids, last_id):
+        """
+        Aduce registrul unei limbi la zi după o scanare completă: file_ids e
+        {cale fișier: item_id} pentru toate fișierele găsite.
+        Returnează (câte ID-uri noi/mutate, câte fișiere scoase).
+        """
+        changed = 0
+        for file_path, item_id in file_ids.items():
+            if self.id_for_file(lang, file_path) != item_id:
+                self.assign(lang, file_path, item_id)
+                changed += 1
+        removed = self.prune(lang, file_ids)
+        self.last_id[lang] = last_id
+        return changed, removed
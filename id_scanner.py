@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Scanare comună a ID-urilor ($item_id) din Principal\\ro, ro\\Python Files,
+Principal\\en și en\\FISIERE PYTHON HTML - în locul celor două scripturi aproape
+identice (Pasul 0 pentru RO, "Incrementare ... 2025 EN (NOU)" pentru EN),
+fiecare pe câte un arbore. Amândouă rulează acum această scanare (run_scan),
+așa că nu mai există două numerotări care să se strice una pe alta: RO și EN
+folosesc același interval, 1..MAX_ID.
+
+Link-urile din FLAGS vin din indexul paginilor (corpus_index, se recitesc doar
+fișierele schimbate), iar ID-urile se citesc din nou din începutul fiecărei
+pagini, pe un pool de fire. Perechile RO/EN se găsesc după link-urile din FLAGS
+(link-ul en din pagina RO și link-ul ro din pagina EN). Raportul comun arată,
+pe limbă, fișierele fără ID, ID-urile duplicate, cele peste limită și golurile,
+plus perechile RO/EN cu ID-uri diferite (același articol trebuie să aibă același
+ID în ambele limbi).
+
+Cu --aplica, fiecare articol (pereche sau pagină fără pereche) primește un
+singur ID, păstrat din pagini unde se poate (întâi perechile deja consecvente,
+apoi ID-ul RO, apoi cel EN), iar articolele rămase fără ID primesc cel mai mic
+ID liber din ambele limbi. Scrierea e o singură tranzacție: toate fișierele
+noi se pregătesc întâi ca fișiere temporare și abia apoi înlocuiesc paginile;
+dacă o pagină nu se poate înlocui (ex. deschisă în editor pe Windows), cele deja
+înlocuite se refac din conținutul original. Doar după o scriere reușită se
+actualizează registrul ID-urilor (id_registry.py).
+
+    python id_scanner.py            # doar raportul
+    python id_scanner.py --aplica   # corectează ID-urile în ambele limbi
+"""
+
+import os
+import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+import corpus_index
+from id_registry import IdRegistry
+from item_ids import IdAllocator, read_item_id, set_item_id
+
+SCAN_FOLDERS = corpus_index.CORPUS_FOLDERS + [
+    (os.path.join(config.EN_DIR, 'FISIERE PYTHON HTML'), 'en'),
+]
+LANGUAGES = ('ro', 'en')
+
+# Un singur interval pentru ambele limbi (RO a fost numerotat 1..5000, EN 5000..10000)
+MAX_ID = 10000
+# De unde pornea numerotarea fiecărei limbi; golurile se caută de aici
+# (sau de la cel mai mic ID folosit, dacă e mai mic)
+ID_START = {'ro': 1, 'en': 5000}
+SCAN_THREADS = min(32, (os.cpu_count() or 1) * 4)
+MAX_LISTED = 50  # câte intrări se afișează dintr-o listă lungă din raport
+
+def _read_id_or_error(path):
+    try:
+        return read_item_id(path), None
+    except Exception as e:
+        return None, e
+
+def scan_tree(folders=SCAN_FOLDERS, threads=None):
+    """
+    Toate folderele; returnează (pagini, erori).
+    O pagină e {'path', 'folder', 'filename', 'slug', 'lang', 'item_id', 'flags_ro', 'flags_en'}.
+    """
+    pages = []
+    for folder, lang in folders:
+        if not os.path.isdir(folder):
+            print(f"ATENȚIE: Folderul nu există: {folder}")
+            continue
+        indexed = corpus_index.load_folder(folder, lang)
+        for row in sorted(indexed, key=lambda row: row['filename'].lower()):
+            pages.append({'path': row['path'], 'folder': folder, 'filename': row['filename'],
+                          'slug': row['slug'], 'lang': lang,
+                          'flags_ro': row['flags_ro'], 'flags_en': row['flags_en']})
+
+    # ID-ul se citește din pagină (pattern-ul pe care îl rescrie set_item_id), nu din index
+    with ThreadPoolExecutor(max_workers=threads or SCAN_THREADS) as pool:
+        results = list(pool.map(_read_id_or_error, [page['path'] for page in pages]))
+
+    scanned, errors = [], []
+    for page, (item_id, error) in zip(pages, results):
+        if error is not None:
+            errors.append((page['path'], error))
+            continue
+        page['item_id'] = item_id
+        scanned.append(page)
+    return scanned, errors
+
+def pair_pages(pages):
+    """Perechile (pagină RO, pagină EN) ale aceluiași articol, după link-urile din FLAGS"""
+    en_by_slug = {}
+    for page in pages:
+        if page['lang'] == 'en':
+            en_by_slug.setdefault(page['slug'], page)
+    ro_by_slug = {}
+    for page in pages:
+        if page['lang'] == 'ro':
+            ro_by_slug.setdefault(page['slug'], page)
+
+    pairs = []
+    paired = set()
+    # Întâi link-ul en din pagina RO (dacă pagina EN nu indică spre alt fișier RO)
+    for ro_page in ro_by_slug.values():
+        en_page = en_by_slug.get(ro_page['flags_en'])
+        if (en_page is not None and en_page['path'] not in paired
+                and en_page['flags_ro'] in (None, ro_page['slug'])):
+            pairs.append((ro_page, en_page))
+            paired.update((ro_page['path'], en_page['path']))
+    # Apoi link-ul ro din paginile EN rămase
+    for en_page in en_by_slug.values():
+        ro_page = ro_by_slug.get(en_page['flags_ro'])
+        if (ro_page is not None and en_page['path'] not in paired and ro_page['path'] not in paired
+                and ro_page['flags_en'] is None):
+            pairs.append((ro_page, en_page))
+            paired.update((ro_page['path'], en_page['path']))
+    return pairs
+
+def _ranges(numbers):
+    """[1, 2, 3, 7, 9, 10] -> ['1-3', '7', '9-10']"""
+    result = []
+    numbers = sorted(numbers)
+    start = previous = None
+    for n in numbers + [None]:
+        if start is not None and (n is None or n != previous + 1):
+            result.append(str(start) if start == previous else f"{start}-{previous}")
+            start = None
+        if n is not None and start is None:
+            start = n
+        previous = n
+    return result
+
+def analyze(pages, pairs, max_id=MAX_ID):
+    """Raportul comun: pe limbă (fără ID, duplicate, peste limită, goluri) și perechile cu ID-uri diferite"""
+    report = {'pairs': len(pairs), 'languages': {}}
+    for lang in LANGUAGES:
+        lang_pages = [page for page in pages if page['lang'] == lang]
+        by_id = {}
+        for page in lang_pages:
+            if page['item_id'] is not None:
+                by_id.setdefault(page['item_id'], []).append(page['filename'])
+        in_range = [item_id for item_id in by_id if 1 <= item_id <= max_id]
+        highest = max(in_range) if in_range else 0
+        start = min([ID_START[lang]] + in_range)
+        report['languages'][lang] = {
+            'files': len(lang_pages),
+            'without_id': [page['filename'] for page in lang_pages if page['item_id'] is None],
+            'duplicates': {item_id: files for item_id, files in sorted(by_id.items()) if len(files) > 1},
+            'out_of_range': [(files[0], item_id) for item_id, files in sorted(by_id.items())
+                             if not 1 <= item_id <= max_id],
+            'gaps': _ranges(set(range(start, highest + 1)) - set(in_range)),
+            'last_id': highest,
+        }
+    report['mismatched_pairs'] = [(ro['filename'], ro['item_id'], en['filename'], en['item_id'])
+                                  for ro, en in pairs if ro['item_id'] != en['item_id']]
+    return report
+
+def plan_assignments(pages, pairs, max_id=MAX_ID):
+    """
+    ID-ul final al fiecărui articol; returnează {cale: (pagină, ID nou)} doar pentru
+    paginile al căror ID se schimbă.
+    """
+    paired = {page['path'] for pair in pairs for page in pair}
+    singles = [(page,) for page in pages if page['path'] not in paired]
+    consistent = [pair for pair in pairs if pair[0]['item_id'] == pair[1]['item_id']]
+    inconsistent = [pair for pair in pairs if pair[0]['item_id'] != pair[1]['item_id']]
+    # Ordinea în care articolele își revendică ID-urile existente
+    articles = (consistent + inconsistent
+                + [s for s in singles if s[0]['lang'] == 'ro']
+                + [s for s in singles if s[0]['lang'] == 'en'])
+
+    claimed = set()
+    article_ids = []
+    for article in articles:
+        chosen = None
+        for page in article:
+            item_id = page['item_id']
+            if item_id is not None and 1 <= item_id <= max_id and item_id not in claimed:
+                chosen = item_id
+                break
+        if chosen is not None:
+            claimed.add(chosen)
+        article_ids.append(chosen)
+
+    allocator = IdAllocator(max_id, claimed)
+    plan = {}
+    for article, chosen in zip(articles, article_ids):
+        if chosen is None:
+            chosen = allocator.allocate()
+        for page in article:
+            if page['item_id'] != chosen:
+                plan[page['path']] = (page, chosen)
+    return plan
+
+def read_page(path):
+    """Textul paginii (utf-8, apoi latin-1, ca în Pasul 0)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except UnicodeDecodeError:
+        with open(path, 'r', encoding='latin-1') as f:
+            return f.read()
+
+def apply_plan(plan):
+    """
+    Scrie ID-urile noi ca o singură tranzacție: toate paginile se pregătesc în
+    fișiere temporare, apoi înlocuiesc originalele. Dacă o pagină nu se poate
+    pregăti sau înlocui, paginile deja înlocuite primesc înapoi conținutul
+    original, fișierele temporare se șterg și eroarea se propagă.
+    """
+    prepared = []  # (fișier temporar, pagină, conținutul original)
+    replaced = []
+    try:
+        for path, (page, new_id) in sorted(plan.items()):
+            with open(path, 'rb') as f:
+                original = f.read()
+            temp_path = path + '.id.tmp'
+            prepared.append((temp_path, path, original))
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(set_item_id(read_page(path), new_id))
+        for temp_path, path, original in prepared:
+            os.replace(temp_path, path)
+            replaced.append((path, original))
+    except Exception:
+        not_restored = []
+        for path, original in replaced:
+            try:
+                with open(path, 'wb') as f:
+                    f.write(original)
+            except OSError:
+                not_restored.append(path)
+        if not_restored:
+            print("ATENȚIE: aceste pagini nu s-au putut reface și au rămas cu ID-ul nou:")
+            for path in not_restored:
+                print(f"   {path}")
+        raise
+    finally:
+        for temp_path, _, _ in prepared:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    return len(prepared)
+
+def update_registry(pages, plan, registry_path=config.ID_REGISTRY):
+    """Aduce registrul ID-urilor la zi pentru ambele limbi, cu ID-urile finale"""
+    registry = IdRegistry.load(registry_path)
+    for lang in LANGUAGES:
+        file_ids = {}
+        for page in pages:
+            if page['lang'] != lang:
+                continue
+            item_id = plan[page['path']][1] if page['path'] in plan else page['item_id']
+            if item_id is not None:
+                file_ids[page['path']] = item_id
+        registry.sync(lang, file_ids, max(file_ids.values(), default=0))
+    registry.save()
+
+def _listed(items):
+    items = list(items)
+    shown = items[:MAX_LISTED]
+    more = len(items) - len(shown)
+    return shown, (f"   ... încă {more}" if more > 0 else None)
+
+def format_report(report, errors=()):
+    """Liniile raportului comun RO + EN"""
+    lines = ["=" * 50, "RAPORT ID-URI RO + EN", "=" * 50]
+    for lang in LANGUAGES:
+        r = report['languages'][lang]
+        lines.append(f"[{lang.upper()}] fișiere: {r['files']}, fără ID: {len(r['without_id'])}, "
+                     f"duplicate: {len(r['duplicates'])}, peste limită: {len(r['out_of_range'])}, "
+                     f"ultimul ID: {r['last_id']}, goluri: {len(r['gaps'])}")
+    lines.append(f"Perechi RO/EN găsite după FLAGS: {report['pairs']}, "
+                 f"cu ID-uri diferite: {len(report['mismatched_pairs'])}")
+
+    for lang in LANGUAGES:
+        r = report['languages'][lang]
+        if r['without_id']:
+            lines.append(f"\nFĂRĂ ID ({lang.upper()}):")
+            shown, more = _listed(sorted(r['without_id']))
+            lines += [f"   {name}" for name in shown] + ([more] if more else [])
+        if r['duplicates']:
+            lines.append(f"\nID-URI DUPLICATE ({lang.upper()}):")
+            shown, more = _listed(r['duplicates'].items())
+            lines += [f"   ID {item_id}: {', '.join(sorted(files))}" for item_id, files in shown] + ([more] if more else [])
+        if r['out_of_range']:
+            lines.append(f"\nID-URI PESTE LIMITĂ ({lang.upper()}):")
+            shown, more = _listed(r['out_of_range'])
+            lines += [f"   {name}: {item_id}" for name, item_id in shown] + ([more] if more else [])
+        if r['gaps']:
+            shown, more = _listed(r['gaps'])
+            lines.append(f"\nGOLURI ({lang.upper()}): {', '.join(shown)}")
+            lines += [more] if more else []
+
+    if report['mismatched_pairs']:
+        lines.append("\nPERECHI RO/EN CU ID-URI DIFERITE:")
+        shown, more = _listed(report['mismatched_pairs'])
+        lines += [f"   {ro_name} ({ro_id}) <-> {en_name} ({en_id})" for ro_name, ro_id, en_name, en_id in shown]
+        lines += [more] if more else []
+
+    if errors:
+        lines.append("\nERORI LA CITIRE:")
+        lines += [f"   {path}: {error}" for path, error in errors]
+    return lines
+
+def run_scan(apply=False, max_id=MAX_ID, threads=None, folders=SCAN_FOLDERS):
+    """Raportul comun și, cu apply=True, corectarea ID-urilor; returnează codul de ieșire"""
+    pages, errors = scan_tree(folders, threads)
+    pairs = pair_pages(pages)
+    report = analyze(pages, pairs, max_id)
+    for line in format_report(report, errors):
+        print(line)
+
+    plan = plan_assignments(pages, pairs, max_id)
+    print(f"\nPagini de corectat: {len(plan)}")
+    if not apply:
+        if plan:
+            print("Rulați cu --aplica pentru a le corecta.")
+        return 1 if errors else 0
+
+    if errors:
+        print("Corectarea nu se face cât timp unele pagini nu se pot citi.")
+        return 1
+    for path, (page, new_id) in sorted(plan.items(), key=lambda item: (item[1][0]['lang'], item[1][0]['filename'])):
+        old = page['item_id'] if page['item_id'] is not None else '-'
+        print(f"  [{page['lang'].upper()}] {page['filename']}: {old} -> {new_id}")
+    try:
+        written = apply_plan(plan)
+    except OSError as e:
+        print(f"Scrierea a eșuat: {e}. Paginile înlocuite până atunci s-au refăcut; registrul ID-urilor nu s-a schimbat.")
+        return 1
+    update_registry(pages, plan)
+    print(f"Pagini scrise: {written}; registrul ID-urilor actualizat: {config.ID_REGISTRY}")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scanare comună a ID-urilor din RO și EN.")
+    parser.add_argument('--aplica', action='store_true', help="corectează ID-urile (altfel doar raportul)")
+    parser.add_argument('--max-id', type=int, default=MAX_ID, help=f"cel mai mare ID permis (implicit {MAX_ID})")
+    parser.add_argument('--fire', type=int, default=SCAN_THREADS, help="câte fire citesc fișierele")
+    args = parser.parse_args(argv)
+    return run_scan(args.aplica, args.max_id, args.fire)
+
+if __name__ == "__main__":
+    sys.exit(main())
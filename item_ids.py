@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+ID-urile articolelor ($item_id din comentariul <!-- $item_id = N; ... -->).
+
+IdAllocator dă ID-urile libere din 1..MAX_ID în ordine crescătoare (cel mai mic
+ID liber întâi), fără bucla `while current_id in used_ids` care pornea de la 1
+la fiecare alocare: un bytearray marchează ID-urile ocupate, iar cursorul doar
+avansează, deci toate alocările unei rulări costă împreună O(MAX_ID), adică
+O(1) amortizat pe ID.
+
+    allocator = IdAllocator(MAX_ID, used_ids)
+    new_id = allocator.allocate()
+
+read_item_id citește doar ID-ul unui fișier: comentariul stă în primii KB ai
+paginii, așa că se citesc HEADER_BYTES octeți și se caută cu un regex pe bytes
+(fără decodare). Tot fișierul (prin mmap) se caută doar dacă ID-ul nu e în prefix.
+
+    item_id = read_item_id(file_path)  # int sau None
+"""
+
+import re
+import mmap
+
+# Cât se citește din începutul paginii pentru ID (comentariul e în <head>)
+HEADER_BYTES = 16 * 1024
+
+# Pattern-ul din Pasul 0 (primul comentariu $item_id din pagină)
+ITEM_ID_PATTERN = re.compile(rb'<!-- \s*\$item_id\s*=\s*(\d+);.*?-->')
+# Același comentariu, pe text, pentru înlocuire (set_item_id)
+ITEM_ID_TEXT_PATTERN = re.compile(r'<!-- \s*\$item_id\s*=\s*\d+;.*?-->')
+HTML_TAG_PATTERN = re.compile(r'(<html[^>]*>)', re.IGNORECASE)
+
+class IdsExhaustedError(RuntimeError):
+    """Nu mai există ID-uri libere până la MAX_ID"""
+
+class IdAllocator:
+    """ID-urile libere din 1..max_id, date în ordine crescătoare"""
+
+    def __init__(self, max_id, used=()):
+        self.max_id = max_id
+        self._used = bytearray(max_id + 1)
+        self._cursor = 1
+        self._free = max_id
+        for item_id in used:
+            self.mark_used(item_id)
+
+    def mark_used(self, item_id):
+        """Marchează un ID ca ocupat (ID-urile în afara 1..max_id se ignoră)"""
+        if 1 <= item_id <= self.max_id and not self._used[item_id]:
+            self._used[item_id] = 1
+            self._free -= 1
+
+    def is_used(self, item_id):
+        return 1 <= item_id <= self.max_id and bool(self._used[item_id])
+
+    @property
+    def free_count(self):
+        return self._free
+
+    def allocate(self):
+        """Cel mai mic ID liber; ridică IdsExhaustedError dacă s-a ajuns la max_id"""
+        used = self._used
+        cursor = self._cursor
+        while cursor <= self.max_id and used[cursor]:
+            cursor += 1
+        if cursor > self.max_id:
+            self._cursor = cursor
+            raise IdsExhaustedError(f"Nu mai există ID-uri libere până la {self.max_id}")
+        used[cursor] = 1
+        self._free -= 1
+        self._cursor = cursor + 1
+        return cursor
+
+def find_item_id(patterns, data):
+    """ID-ul (int) primului pattern, în ordinea listei, care se potrivește oriunde în data (bytes)"""
+    for pattern in patterns:
+        match = pattern.search(data)
+        if match:
+            return int(match.group(1))
+    return None
+
+def read_item_id(file_path, patterns=(ITEM_ID_PATTERN,), header_bytes=HEADER_BYTES):
+    """
+    $item_id-ul unui fișier (int sau None), cu pattern-uri compilate pe bytes.
+    Rezultatul e același ca la căutarea pattern-urilor, în ordine, în tot
+    fișierul: prefixul ajunge dacă primul pattern se găsește în el (sau dacă
+    fișierul a încăput întreg în prefix); altfel se caută în tot fișierul.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(header_bytes)
+        if len(head) < header_bytes:
+            return find_item_id(patterns, head)
+        match = patterns[0].search(head)
+        if match:
+            return int(match.group(1))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return find_item_id(patterns, data)
+
+def set_item_id(content, item_id):
+    """
+    Pune ID-ul în pagină, ca Pasul 0: înlocuiește comentariile $item_id existente
+    sau, dacă nu există, adaugă comentariul după <html> (ori la începutul paginii).
+    """
+    id_comment = f'<!-- $item_id = {item_id}; // Replace that with your rating id -->'
+    if ITEM_ID_TEXT_PATTERN.search(content):
+        return ITEM_ID_TEXT_PATTERN.sub(id_comment, content)
+    html_match = HTML_TAG_PATTERN.search(content)
+    if html_match:
+        insert_pos = html_match.end()
+        return content[:insert_pos] + '\n' + id_comment + content[insert_pos:]
+    return id_comment + '\n' + content
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Copiere locală care nu rescrie fișierele deja identice.
+
+Înainte de copiere se compară sursa cu destinația:
+- același fișier (hardlink) -> identic;
+- dimensiuni diferite -> se copiază;
+- aceeași dimensiune și același mtime (shutil.copy2 păstrează mtime) -> identic;
+- altfel se compară conținutul; dacă e identic, destinația primește doar
+  mtime-ul sursei (ca data viitoare să ajungă comparația rapidă).
+
+Moduri de scriere:
+- 'copy'     shutil.copy2 (implicit);
+- 'hardlink' destinația devine un hardlink către sursă (același disc). Atenție:
+             o modificare ulterioară a sursei se vede imediat și în destinație;
+- 'reflink'  clonare copy-on-write (Linux, btrfs/XFS prin FICLONE).
+Dacă linkul nu se poate face (alt disc, sistem de fișiere fără suport), se
+copiază normal.
+
+    stats = CopyStats()
+    copy_file(sursa, destinatia, mode='copy', stats=stats)
+    print(stats.summary())
+"""
+
+import os
+import shutil
+import filecmp
+import threading
+
+COPY_MODES = ('copy', 'hardlink', 'reflink')
+
+# ioctl-ul Linux pentru clonarea unui fișier (copy-on-write)
+FICLONE = 0x40049409
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+class CopyStats:
+    """Contoare pentru o serie de copieri (sigure pentru mai multe fire)"""
+
+    def __init__(self):
+        self.copied = 0
+        self.linked = 0
+        self.identical = 0
+        self.errors = 0
+        self.bytes_written = 0
+        self.bytes_avoided = 0
+        self._lock = threading.Lock()
+
+    def add(self, result, size):
+        with self._lock:
+            if result == 'identic':
+                self.identical += 1
+                self.bytes_avoided += size
+            elif result == 'legat':
+                self.linked += 1
+                self.bytes_avoided += size
+            elif result == 'copiat':
+                self.copied += 1
+                self.bytes_written += size
+            else:
+                self.errors += 1
+
+    def summary(self):
+        mb = 1024 * 1024
+        return (f"{self.copied} copiate ({self.bytes_written / mb:.2f} MB scriși), "
+                f"{self.identical} identice sărite, {self.linked} legate (hardlink/reflink), "
+                f"{self.errors} erori; {self.bytes_avoided / mb:.2f} MB nescriși")
+
+def is_identical(source_path, target_path, source_stat=None):
+    """True dacă destinația există și are exact conținutul sursei"""
+    try:
+        target_stat = os.stat(target_path)
+    except OSError:
+        return False
+    source_stat = source_stat or os.stat(source_path)
+    if os.path.samestat(source_stat, target_stat):
+        return True
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return True
+    if not filecmp.cmp(source_path, target_path, shallow=False):
+        return False
+    # Conținut identic, alt mtime: aliniem mtime-ul în loc să rescriem fișierul
+    os.utime(target_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+def _replace_with_hardlink(source_path, target_path):
+    temp_path = target_path + '.link.tmp'
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    os.link(source_path, temp_path)
+    os.replace(temp_path, target_path)
+
+def _replace_with_reflink(source_path, target_path):
+    if fcntl is None:
+        raise OSError("reflink indisponibil pe acest sistem")
+    temp_path = target_path + '.link.tmp'
+    try:
+        with open(source_path, 'rb') as source, open(temp_path, 'wb') as target:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        shutil.copystat(source_path, temp_path)
+        os.replace(temp_path, target_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def copy_file(source_path, target_path, mode='copy', stats=None):
+    """
+    Copiază source_path în target_path doar dacă diferă.
+    Returnează 'identic', 'legat' (hardlink/reflink) sau 'copiat'; erorile se ridică mai departe.
+    """
+    if mode not in COPY_MODES:
+        raise ValueError(f"Mod de copiere necunoscut: {mode} (disponibile: {', '.join(COPY_MODES)})")
+    source_stat = os.stat(source_path)
+    size = source_stat.st_size
+    try:
+        if is_identical(source_path, target_path, source_stat):
+            result = 'identic'
+        else:
+            result = None
+            if mode != 'copy':
+                try:
+                    if mode == 'hardlink':
+                        _replace_with_hardlink(source_path, target_path)
+                    else:
+                        _replace_with_reflink(source_path, target_path)
+                    result = 'legat'
+                except OSError:
+                    # Alt disc sau sistem de fișiere fără suport: copiere normală
+                    result = None
+            if result is None:
+                shutil.copy2(source_path, target_path)
+                result = 'copiat'
+    except Exception:
+        if stats is not None:
+            stats.add('eroare', size)
+        raise
+    if stats is not None:
+        stats.add(result, size)
+    return result
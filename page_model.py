@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Model de pagină scanat o singură dată.
+
+La încărcare se caută, într-o singură trecere regex, marcajele regiunilor
+cunoscute (FLAGS, ARTICOL, SASA, ARTICOL CATEGORIE, text_dreapta, <title>,
+h1, meta description, canonical, $item_id) și se rețin offset-urile lor.
+Modificările se înregistrează pe regiuni și se lipesc (splice) abia la
+generarea textului final, deci o rescriere costă cât octeții schimbați, nu
+(număr de pattern-uri x dimensiunea fișierului).
+
+    page = Page(content)
+    flags = page.get('flags')
+    page.set('flags', flags.replace(old_link, new_link))
+    page.sub('articol', r'<p class="text_obisnuit"></p>\\s*', '')
+    content = page.text
+"""
+
+import re
+
+# nume regiune -> (pattern deschidere, marcaj închidere, include marcajele, pe un singur rând)
+REGIONS = {
+    'flags': (r'<!-- FLAGS_1 -->', '<!-- FLAGS -->', False, False),
+    'articol': (r'<!-- ARTICOL START -->', '<!-- ARTICOL FINAL -->', False, False),
+    'sasa': (r'<!-- SASA-1 -->', '<!-- SASA-2 -->', False, False),
+    'articol_categorie': (r'<!-- ARTICOL CATEGORIE START -->', '<!-- ARTICOL CATEGORIE FINAL -->', False, False),
+    'text_dreapta': (r'<td class="text_dreapta">', '</td>', False, False),
+    'title': (r'<title>', '</title>', False, True),
+    'h1': (r'<h1 class="den_articol" itemprop="name">', '</h1>', False, True),
+    'meta_description': (r'<meta name="description" content="', '">', False, True),
+    'canonical': (r'<link rel="canonical" href="', '"', False, True),
+    'item_id': (r'<!-- \s*\$item_id\s*=\s*', ';', False, True),
+}
+
+_OPENERS = re.compile('|'.join(f'(?P<{name}>{opener})' for name, (opener, _, _, _) in REGIONS.items()))
+
+# Comentariul complet <!-- $item_id = N; // ... --> (derivat din regiunea item_id)
+ITEM_ID_COMMENT = 'item_id_comment'
+
+def scan_regions(content):
+    """Găsește offset-urile (start, end) ale primei apariții a fiecărei regiuni"""
+    regions = {}
+    for match in _OPENERS.finditer(content):
+        name = match.lastgroup
+        if name in regions:
+            continue
+        _, closer, outer, single_line = REGIONS[name]
+        end = content.find(closer, match.end())
+        if end == -1:
+            continue
+        if single_line and '\n' in content[match.end():end]:
+            continue
+        if outer:
+            regions[name] = (match.start(), end + len(closer))
+        else:
+            regions[name] = (match.end(), end)
+        if name == 'item_id':
+            comment_end = content.find('-->', end)
+            if comment_end != -1 and '\n' not in content[end:comment_end]:
+                regions[ITEM_ID_COMMENT] = (match.start(), comment_end + 3)
+        if len(regions) == len(REGIONS) + 1:
+            break
+    return regions
+
+class Page:
+    """Pagină HTML cu regiuni indexate după offset și editări lipite la final"""
+
+    def __init__(self, content):
+        self._original = content
+        self._load(content)
+
+    @classmethod
+    def from_file(cls, path, encoding='utf-8'):
+        with open(path, 'r', encoding=encoding) as f:
+            return cls(f.read())
+
+    def _load(self, content):
+        self._source = content
+        self._regions = scan_regions(content)
+        self._edits = {}  # (start, end) în sursă -> text nou
+        self._stale = set()  # regiuni aflate în interiorul unei regiuni rescrise
+        self._text = content
+
+    def _fresh(self, name):
+        """Rescanează dacă regiunea a fost acoperită de o editare mai largă"""
+        if name in self._stale:
+            self._materialize()
+
+    def _materialize(self):
+        """Aplică editările în sursă și rescanează (doar când regiunile se suprapun)"""
+        self._load(self.text)
+
+    def has(self, name):
+        self._fresh(name)
+        return name in self._regions
+
+    def span(self, name):
+        """Offset-urile regiunii în textul curent (sau None)"""
+        self._fresh(name)
+        if name not in self._regions:
+            return None
+        start, end = self._regions[name]
+        shift = sum(len(new) - (e - s) for (s, e), new in self._edits.items() if e <= start)
+        inner = sum(len(new) - (e - s) for (s, e), new in self._edits.items() if start <= s and e <= end)
+        return start + shift, end + shift + inner
+
+    def _piece(self, start, end):
+        """Textul dintre două offset-uri din sursă, cu editările din interior aplicate"""
+        inner = sorted(span for span in self._edits if start <= span[0] and span[1] <= end)
+        if not inner:
+            return self._source[start:end]
+        parts = []
+        pos = start
+        for s, e in inner:
+            parts.append(self._source[pos:s])
+            parts.append(self._edits[(s, e)])
+            pos = e
+        parts.append(self._source[pos:end])
+        return ''.join(parts)
+
+    def get(self, name, default=None):
+        """Conținutul curent al unei regiuni"""
+        self._fresh(name)
+        if name not in self._regions:
+            return default
+        start, end = self._regions[name]
+        if (start, end) in self._edits:
+            return self._edits[(start, end)]
+        return self._piece(start, end)
+
+    def set(self, name, value):
+        """Înlocuiește conținutul unei regiuni; returnează True dacă regiunea există"""
+        self._fresh(name)
+        if name not in self._regions:
+            return False
+        start, end = self._regions[name]
+        for s, e in self._edits:
+            # O editare anterioară înglobează sau taie regiunea - offset-urile nu mai sunt valabile
+            if (s < start < e or s < end < e or (s <= start and end <= e)) and (s, e) != (start, end):
+                self._materialize()
+                return self.set(name, value)
+        for span in [span for span in self._edits if start <= span[0] and span[1] <= end]:
+            del self._edits[span]
+        self._edits[(start, end)] = value
+        for other, (s, e) in self._regions.items():
+            if start <= s and e <= end and (s, e) != (start, end):
+                self._stale.add(other)
+        self._text = None
+        return True
+
+    def sub(self, name, pattern, repl, count=0, flags=0):
+        """Aplică un re.subn doar pe regiune; returnează numărul de înlocuiri"""
+        current = self.get(name)
+        if current is None:
+            return 0
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, flags)
+        updated, n = pattern.subn(repl, current, count=count)
+        if n and updated != current:
+            self.set(name, updated)
+        return n
+
+    @property
+    def text(self):
+        """Textul complet al paginii, cu toate editările lipite într-un singur join"""
+        if self._text is None:
+            parts = []
+            pos = 0
+            for s, e in sorted(self._edits):
+                parts.append(self._source[pos:s])
+                parts.append(self._edits[(s, e)])
+                pos = e
+            parts.append(self._source[pos:])
+            self._text = ''.join(parts)
+        return self._text
+
+    @property
+    def modified(self):
+        return self.text != self._original
+
+    def __str__(self):
+        return self.text
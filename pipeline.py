@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Rulează pașii site-ului într-un singur proces Python, în locul fișierelor .bat.
+
+Pașii sunt declarați ca un graf (fiecare pas știe după ce pași trebuie să
+ruleze): Pasul 2 -> Pasul 3 -> Pasul 4 -> Pasul 5 etc. Modulele (bs4, docx,
+corpus_index) se importă o singură dată, iar indexul paginilor se păstrează în
+memorie între pași. Nu mai există pauze fixe între scripturi; la final se
+scrie un raport cu durata și eroarea fiecărui pas (pipeline_TIMESTAMP.log, în
+locul errors_TIMESTAMP.log).
+
+Fiecare pas își declară intrările; amprenta lor (hash-urile fișierelor +
+configurația pasului) se salvează în config.PIPELINE_STATE. Un pas cu aceleași
+intrări ca la ultima rulare reușită este sărit, iar pașii care știu să lucreze
+incremental (Pasul 4, Pasul 7, Pasul 8) primesc doar fișierele schimbate.
+
+Cu --deploy, fișierele din fisiere_gata intră într-o coadă de publicare (FTP.py /
+ftp_deploy.DeployQueue) imediat ce un pas le-a scris: încărcarea pe FTP și
+copierea în Principal 2022/en merg în fundal cât timp ceilalți pași lucrează.
+La final se așteaptă ambele cozi, iar raportul publicării intră în raportul final.
+
+Căile se configurează din config.py (sau variabilele de mediu SITE_*).
+
+    python pipeline.py                      # grupul implicit 'bebe' (Pasul 2-5)
+    python pipeline.py fisiere_gata         # alt grup
+    python pipeline.py --stages pasul3,pasul4
+    python pipeline.py --force              # ignoră amprentele, rulează tot
+    python pipeline.py fisiere_gata --deploy  # publică pe FTP în timp ce pașii lucrează
+    python pipeline.py --list
+"""
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+import importlib.util
+import traceback
+from datetime import datetime
+from graphlib import TopologicalSorter
+
+import config
+import corpus_index
+import ftp_deploy
+import stage_state
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _changed(changes, input_path):
+    """Fișierele schimbate dintr-o intrare (None = rulare completă)"""
+    return None if changes is None else changes.get(input_path, set())
+
+# Coada de publicare activă (doar cu --deploy)
+_deploy = None
+
+def _deploy_push(path):
+    """Pune un fișier terminat în coada de publicare, dacă publicarea e pornită"""
+    if _deploy is not None:
+        _deploy.push(path)
+
+# nume pas -> scriptul, pașii de care depinde, intrările lui și cum se apelează.
+# run primește modulul și fișierele schimbate pe intrare (None = rulare completă).
+STAGES = {
+    'pasul2': {
+        'script': 'Pasul 2 - Converteste bebe.docx in fisiere html (dupa ce ai tradus in engleza cu Google).py',
+        'after': [],
+        'inputs': [os.path.join(config.WORK_DIR, 'bebe.docx'), os.path.join(config.WORK_DIR, 'index.html')],
+        'run': lambda module, changes: module.main(os.path.join(config.WORK_DIR, 'bebe.docx'),
+                                                   os.path.join(config.WORK_DIR, 'index.html'),
+                                                   config.OUTPUT_DIR),
+    },
+    'pasul3': {
+        'script': 'Pasul 3 - ADAUGA LINK-urile din RO in OUTPUT si invers (doar daca ai DATA si CATEGORIILE).py',
+        'after': ['pasul2'],
+        'inputs': [config.RO_DIR, config.OUTPUT_DIR],
+        'run': lambda module, changes: module.main(),
+    },
+    'pasul4': {
+        'script': 'Pasul 4 - Preia DATA si Numele categoriilor din RO si le pune in fisierele noi EN.py',
+        'after': ['pasul3'],
+        'inputs': [config.OUTPUT_DIR, config.RO_DIR],
+        'run': lambda module, changes: module.process_files(config.OUTPUT_DIR, config.RO_DIR,
+                                                            _changed(changes, config.OUTPUT_DIR),
+                                                            _changed(changes, config.RO_DIR)),
+    },
+    'pasul5': {
+        'script': 'Pasul 5 - Duce fiecare articol in fisierul categorii din care face parte si apoi in index FINAL.py',
+        'after': ['pasul4'],
+        'inputs': [config.OUTPUT_DIR, config.EN_DIR, os.path.join(config.RO_DIR, 'index.html')],
+        'run': lambda module, changes: module.main(),
+    },
+    'pasul8_h3': {
+        'script': 'Pasul 8. Replace orice h3 class= text_obisnuit2.py',
+        'after': [],
+        'inputs': [config.FISIERE_GATA_DIR],
+        'run': lambda module, changes: module.main(config.FISIERE_GATA_DIR,
+                                                   _changed(changes, config.FISIERE_GATA_DIR),
+                                                   _deploy_push),
+    },
+    'pasul7_imagini': {
+        'script': 'Pasul 7. Adauga imagine minimalizata in categorii (en) Fisiere Gata.py',
+        'after': ['pasul8_h3'],
+        'inputs': [config.PRINCIPAL_2022_EN_DIR],
+        'run': lambda module, changes: module.main(
+            config.PRINCIPAL_2022_EN_DIR, config.PRINCIPAL_2022_EN_DIR,
+            None if changes is None else module.categories_to_process(
+                config.PRINCIPAL_2022_EN_DIR, changes.get(config.PRINCIPAL_2022_EN_DIR, set()))),
+    },
+}
+
+# Grupuri de pași (echivalentul fișierelor .bat)
+PIPELINES = {
+    'bebe': ['pasul2', 'pasul3', 'pasul4', 'pasul5'],          # Pasul 1 B FINAL.bat
+    'fisiere_gata': ['pasul8_h3', 'pasul7_imagini'],
+}
+
+_loaded_modules = {}
+
+def load_stage_module(name):
+    """Importă scriptul unui pas o singură dată (numele cu spații nu se pot importa direct)"""
+    if name not in _loaded_modules:
+        path = os.path.join(SCRIPTS_DIR, STAGES[name]['script'])
+        module_name = f'pipeline_{name}'
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        # Înregistrat în sys.modules ca un modul importat; procesele copil nu îl pot importa
+        # după acest nume (cu spawn), de aceea pool-urile pașilor trimit funcțiile prin script_pool
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _loaded_modules[name] = module
+    return _loaded_modules[name]
+
+def stage_order(selected):
+    """Ordinea de rulare a pașilor selectați, respectând dependențele dintre ei"""
+    graph = TopologicalSorter()
+    for name in selected:
+        graph.add(name, *[dep for dep in STAGES[name]['after'] if dep in selected])
+    return list(graph.static_order())
+
+def stage_config(name):
+    """Configurația care intră în amprenta unui pas: intrările și conținutul scriptului"""
+    with open(os.path.join(SCRIPTS_DIR, STAGES[name]['script']), 'rb') as f:
+        script_sha1 = hashlib.sha1(f.read()).hexdigest()
+    return {'inputs': STAGES[name]['inputs'], 'script': script_sha1}
+
+def run_stage(name, changes=None):
+    """Rulează un pas; returnează (status, durata, eroare)"""
+    start = time.perf_counter()
+    try:
+        module = load_stage_module(name)
+        STAGES[name]['run'](module, changes)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return 'eroare', time.perf_counter() - start, f"SystemExit({e.code})"
+    except Exception:
+        return 'eroare', time.perf_counter() - start, traceback.format_exc()
+    return 'ok', time.perf_counter() - start, None
+
+def run_pipeline(selected, force=False, state_path=None, deploy=None):
+    """
+    Rulează pașii în ordinea grafului; un pas nu rulează dacă unul dinainte a eșuat.
+    Pașii cu aceeași amprentă a intrărilor ca la ultima rulare reușită sunt săriți
+    (în afară de cazul force=True). deploy: coada de publicare în care pașii pun
+    fișierele terminate (vezi --deploy).
+    """
+    global _deploy
+    _deploy = deploy
+    state_path = state_path or config.PIPELINE_STATE
+    state = stage_state.load_state(state_path)
+    results = []
+    failed = set()
+    for name in stage_order(selected):
+        print()
+        print("=" * 60)
+        print(f"Rulare pas: {name} ({STAGES[name]['script']})")
+        print("=" * 60)
+
+        blocked = [dep for dep in STAGES[name]['after'] if dep in failed]
+        if blocked:
+            print(f"[SARIT] Depinde de pași eșuați: {', '.join(blocked)}")
+            failed.add(name)
+            results.append({'stage': name, 'status': 'sarit', 'seconds': 0.0,
+                            'error': f"depinde de {', '.join(blocked)}"})
+            continue
+
+        if deploy is not None and deploy.copy_dir in STAGES[name]['inputs']:
+            # Pasul citește folderul în care copiază coada: întâi se termină copierile
+            deploy.drain_copies()
+
+        stage_cfg = stage_config(name)
+        inputs = stage_state.snapshot(STAGES[name]['inputs'], state['files'])
+        current = stage_state.fingerprint(inputs, stage_cfg)
+        previous = state['stages'].get(name)
+
+        changes = None
+        if previous and not force:
+            if previous['fingerprint'] == current:
+                print(f"[NESCHIMBAT] Intrările nu s-au schimbat de la ultima rulare, pasul este sărit.")
+                results.append({'stage': name, 'status': 'neschimbat', 'seconds': 0.0, 'error': None})
+                continue
+            if previous['config'] == stage_cfg:
+                changes = stage_state.changed_files(previous['inputs'], inputs)
+                total = sum(len(names) for names in changes.values())
+                print(f"Fișiere schimbate de la ultima rulare: {total}")
+
+        status, seconds, error = run_stage(name, changes)
+        if status == 'ok':
+            print(f"[OK] {name} finalizat în {seconds:.2f}s")
+            # Amprenta se ia după rulare, ca propriile modificări ale pasului să nu-l declanșeze din nou
+            inputs = stage_state.snapshot(STAGES[name]['inputs'], state['files'])
+            state['stages'][name] = {
+                'fingerprint': stage_state.fingerprint(inputs, stage_cfg),
+                'config': stage_cfg,
+                'inputs': inputs,
+                'finished': datetime.now().isoformat(timespec='seconds'),
+            }
+            stage_state.save_state(state_path, state)
+        else:
+            print(f"[EROARE] {name} a eșuat după {seconds:.2f}s")
+            print(error)
+            failed.add(name)
+        results.append({'stage': name, 'status': status, 'seconds': seconds, 'error': error})
+
+    corpus_index.close_shared()
+    _deploy = None
+    return results
+
+def format_report(results, started, deploy_report=None):
+    """Raportul final: durata și statusul fiecărui pas, publicarea, apoi erorile complete"""
+    lines = [f"Pipeline pornit la {started:%Y-%m-%d %H:%M:%S}", ""]
+    lines.append(f"{'Pas':<20} {'Status':<11} {'Durata':>10}")
+    lines.append("-" * 43)
+    for result in results:
+        lines.append(f"{result['stage']:<20} {result['status']:<11} {result['seconds']:>9.2f}s")
+    lines.append("-" * 43)
+    total = sum(result['seconds'] for result in results)
+    errors = [result for result in results if result['status'] in ('eroare', 'sarit')]
+    unchanged = sum(1 for result in results if result['status'] == 'neschimbat')
+    lines.append(f"Total: {len(results)} pași, {unchanged} neschimbați, {len(errors)} cu erori/săriți, {total:.2f}s")
+
+    if deploy_report is not None:
+        lines.append("")
+        lines.extend(ftp_deploy.format_deploy_report(deploy_report))
+
+    for result in errors:
+        lines.append("")
+        lines.append(f"[{result['status'].upper()}] {result['stage']}")
+        lines.append(result['error'].rstrip())
+    return "\n".join(lines) + "\n"
+
+def write_report(report, started, log_dir=None):
+    """Scrie raportul în LOG_DIR (sau în folderul curent, dacă LOG_DIR nu e disponibil)"""
+    log_dir = log_dir or config.LOG_DIR
+    filename = f"pipeline_{started:%Y%m%d_%H%M%S}.log"
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        report_path = os.path.join(log_dir, filename)
+    except OSError:
+        report_path = filename
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(report)
+    return report_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rulează pașii site-ului într-un singur proces.")
+    parser.add_argument('pipeline', nargs='?', default='bebe', choices=sorted(PIPELINES),
+                        help="grupul de pași (implicit: bebe)")
+    parser.add_argument('--stages', help="pașii de rulat, separați prin virgulă (în locul grupului)")
+    parser.add_argument('--log-dir', help="folderul pentru raport (implicit config.LOG_DIR)")
+    parser.add_argument('--force', action='store_true', help="rulează toți pașii, chiar dacă intrările nu s-au schimbat")
+    parser.add_argument('--state', help="fișierul cu amprentele pașilor (implicit config.PIPELINE_STATE)")
+    parser.add_argument('--deploy', action='store_true',
+                        help="publică fișierele din fisiere_gata pe FTP și în Principal 2022/en în timpul pașilor")
+    parser.add_argument('--list', action='store_true', help="afișează pașii și dependențele")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for group, names in PIPELINES.items():
+            print(f"{group}:")
+            for name in stage_order(names):
+                after = ', '.join(STAGES[name]['after']) or '-'
+                print(f"  {name:<16} după: {after:<12} {STAGES[name]['script']}")
+        return 0
+
+    if args.stages:
+        selected = [name.strip() for name in args.stages.split(',') if name.strip()]
+        unknown = [name for name in selected if name not in STAGES]
+        if unknown:
+            parser.error(f"pași necunoscuți: {', '.join(unknown)} (disponibili: {', '.join(STAGES)})")
+    else:
+        selected = PIPELINES[args.pipeline]
+
+    started = datetime.now()
+    deploy = None
+    if args.deploy:
+        import FTP
+        deploy = FTP.start_fisiere_gata_deploy(config.FISIERE_GATA_DIR, config.PRINCIPAL_2022_EN_DIR)
+    results = run_pipeline(selected, args.force, args.state, deploy)
+    deploy_report = FTP.finish_fisiere_gata_deploy(deploy, config.FISIERE_GATA_DIR) if deploy else None
+    report = format_report(results, started, deploy_report)
+    report_path = write_report(report, started, args.log_dir)
+
+    print()
+    print(report)
+    print(f"Raport: {report_path}")
+    deploy_failed = deploy_report is not None and (deploy_report['upload_errors'] or deploy_report['copy_errors'])
+    return 1 if deploy_failed or any(result['status'] in ('eroare', 'sarit') for result in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de reguli de rescriere (find and replace) declarate într-un tabel.
+
+Fiecare regulă are: nume, pattern, înlocuire (text cu \\1 sau funcție),
+regiune (None = tot fișierul, altfel o regiune din page_model.REGIONS, ex.
+'articol', 'flags') și ordine. La construirea unui RuleSet:
+- pattern-urile se compilează o singură dată;
+- regulile se grupează pe regiune: regiunea se extrage o dată, se aplică toate
+  regulile ei și se lipește înapoi o dată;
+- regulile din aceeași regiune cu aceeași ordine sunt independente și se
+  contopesc într-o singură trecere regex (o alternanță); regulile cu ordine
+  diferită se aplică una după alta, ca o regulă să vadă rezultatul celor
+  dinainte;
+- fiecare regulă numără de câte ori s-a aplicat.
+
+    rules = RuleSet(RULE_SETS['pasul8_h3_meta'])
+    content, counts = rules.apply(content)
+
+Rulare directă pe orice foldere, într-o singură trecere prin fișiere:
+    python rewrite_rules.py pasul8_h3_meta pasul0_spacing -- folder1 folder2
+"""
+
+import os
+import re
+import sys
+
+from page_model import Page
+
+def rule(name, pattern, replacement, region=None, order=0, flags=0):
+    """O intrare din tabelul de reguli"""
+    return {'name': name, 'pattern': pattern, 'replacement': replacement,
+            'region': region, 'order': order, 'flags': flags}
+
+def literal(name, text, replacement, region=None, order=0):
+    """Regulă pentru un text fix (fără regex)"""
+    return rule(name, re.escape(text), replacement.replace('\\', r'\\'), region, order)
+
+class RuleSet:
+    """Reguli compilate o dată, grupate pe regiune, cu numărătoare pe regulă"""
+
+    def __init__(self, rules):
+        self.rules = sorted(rules, key=lambda r: r['order'])
+        self.counts = {r['name']: 0 for r in self.rules}
+        self._regions = []  # [(regiune, [trecere, ...])] în ordinea primei reguli din regiune
+        passes_by_region = {}
+        for r in self.rules:
+            if r['region'] not in passes_by_region:
+                passes_by_region[r['region']] = []
+                self._regions.append((r['region'], passes_by_region[r['region']]))
+            compiled = r['pattern'] if not isinstance(r['pattern'], str) else re.compile(r['pattern'], r['flags'])
+            passes = passes_by_region[r['region']]
+            entry = dict(r, compiled=compiled)
+            last = passes[-1] if passes else None
+            if (last is not None and last['order'] == r['order'] and isinstance(r['pattern'], str)
+                    and all(isinstance(m['pattern'], str) and m['flags'] == r['flags'] for m in last['rules'])):
+                last['rules'].append(entry)
+            else:
+                passes.append({'order': r['order'], 'rules': [entry]})
+        for passes in passes_by_region.values():
+            for p in passes:
+                p['merged'] = self._merge(p['rules'])
+
+    @staticmethod
+    def _merge(rules):
+        """O singură alternanță pentru regulile independente (sau None dacă e o singură regulă)"""
+        if len(rules) < 2:
+            return None
+        alternation = '|'.join(f'(?P<_r{i}>{r["pattern"]})' for i, r in enumerate(rules))
+        try:
+            return re.compile(alternation, rules[0]['flags'])
+        except re.error:
+            # Ex. flag-uri inline care nu pot sta în interiorul alternanței: rămân treceri separate
+            return None
+
+    def _run_pass(self, text, p, counts):
+        if p['merged'] is None:
+            for r in p['rules']:
+                text, n = r['compiled'].subn(r['replacement'], text)
+                counts[r['name']] += n
+            return text
+
+        rules = p['rules']
+
+        def replace(match):
+            r = rules[int(match.lastgroup[2:])]
+            counts[r['name']] += 1
+            # Re-potrivim regula singură în același loc, ca grupurile \1, \2 să fie ale ei
+            own = r['compiled'].match(match.string, match.start())
+            if callable(r['replacement']):
+                return r['replacement'](own)
+            return own.expand(r['replacement'])
+
+        return p['merged'].sub(replace, text)
+
+    def apply(self, content):
+        """Aplică toate regulile; returnează (conținut nou, {regulă: număr aplicări})"""
+        counts = {name: 0 for name in self.counts}
+        page = None
+        for region, passes in self._regions:
+            if region is None:
+                if page is not None:
+                    content = page.text
+                    page = None
+                for p in passes:
+                    content = self._run_pass(content, p, counts)
+                continue
+            if page is None:
+                page = Page(content)
+            text = page.get(region)
+            if text is None:
+                continue
+            updated = text
+            for p in passes:
+                updated = self._run_pass(updated, p, counts)
+            if updated != text:
+                page.set(region, updated)
+        if page is not None:
+            content = page.text
+        for name, n in counts.items():
+            self.counts[name] += n
+        return content, counts
+
+    def report(self):
+        """Liniile raportului: de câte ori s-a aplicat fiecare regulă"""
+        return [f"  {name}: {n}" for name, n in self.counts.items()]
+
+def read_text(file_path, encodings=('utf-8', 'latin-1')):
+    """Citește un fișier încercând pe rând encoding-urile date"""
+    for encoding in encodings:
+        try:
+            with open(file_path, 'r', encoding=encoding) as f:
+                return f.read()
+        except UnicodeDecodeError:
+            continue
+    return None
+
+def rewrite_folders(folders, rule_sets, extensions=('.html',), encodings=('utf-8', 'latin-1'), verbose=True):
+    """
+    O singură trecere prin fișierele din foldere: fiecare fișier se citește o dată,
+    trece prin toate seturile de reguli și se scrie o dată, doar dacă s-a schimbat.
+    """
+    stats = {'fisiere': 0, 'modificate': 0, 'erori': 0}
+    for folder in folders:
+        if not os.path.isdir(folder):
+            print(f"ATENȚIE: Folderul nu există: {folder}")
+            continue
+        for filename in os.listdir(folder):
+            if not filename.lower().endswith(extensions):
+                continue
+            file_path = os.path.join(folder, filename)
+            stats['fisiere'] += 1
+            try:
+                content = read_text(file_path, encodings)
+            except OSError as e:
+                content = None
+                print(f"  ✗ Eroare la citirea fișierului {filename}: {e}")
+            if content is None:
+                stats['erori'] += 1
+                continue
+
+            new_content = content
+            fired = 0
+            for rule_set in rule_sets:
+                new_content, counts = rule_set.apply(new_content)
+                fired += sum(counts.values())
+
+            if new_content == content:
+                continue
+            try:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(new_content)
+                stats['modificate'] += 1
+                if verbose:
+                    print(f"  ✓ {filename}: {fired} înlocuiri")
+            except OSError as e:
+                stats['erori'] += 1
+                print(f"  ✗ Eroare la scrierea fișierului {filename}: {e}")
+    return stats
+
+# ---------------------------------------------------------------------------
+# Seturile de reguli ale scripturilor
+# ---------------------------------------------------------------------------
+
+# Pasul 2 - post_process_html: spațiile non-breaking devin spații normale (independente, o trecere)
+PASUL2_POST_PROCESS_RULES = [
+    literal('NBSP', 'NBSP', ' '),
+    literal('U+00A0', '\u00A0', ' '),
+    literal('&nbsp;', '&nbsp;', ' '),
+]
+
+# Pasul 2 - final_regex_replacements (ordinea contează: fiecare regulă vede rezultatul celor dinainte)
+PASUL2_FINAL_RULES = [
+    rule('paragrafe numerotate', r'<strong>(\d+\.\s+)</strong>(.*?)</p>',
+         r'<p class="text_obisnuit"><span class="text_obisnuit2">\1</span>\2</p>', order=10),
+    rule('strong+em -> text_obisnuit2', r'<p class="text_obisnuit"><strong><em>(.*?)</em></strong></p>',
+         r'<p class="text_obisnuit2"><em>\1</em></p>', order=20),
+    rule('strong -> text_obisnuit2', r'<p class="text_obisnuit"><strong>(.*?)</strong></p>',
+         r'<p class="text_obisnuit2">\1</p>', order=30),
+    rule('strong la inceput -> span', r'<p class="text_obisnuit"><strong>(.*?)</strong>(.*?)</p>',
+         r'<p class="text_obisnuit"><span class="text_obisnuit2">\1</span>\2</p>', order=40),
+    rule('<br><br> inainte de Note', r'(<p class="text_obisnuit"><span class="text_obisnuit2">\* Note:)',
+         r'<br><br>\n\1', order=50),
+    rule('<e</p>', r'<e</p>', '</p>', order=60),
+    rule('</span></p>', r'</span></p>', '</p>', order=70),
+    rule('<em></em>', r'<em></em>', '', order=80),
+    rule('</strong> <strong>', r'</strong>\s*<strong>', '', order=90),
+    rule('<strong>', r'<strong>', '', order=100),
+    rule('</strong>', r'</strong>', '', order=100),
+]
+
+QUOTE_CHARS = ['"', '„', '”', "'", '|', '&quot;', '&#39;', '&ldquo;', '&rdquo;', '&lsquo;', '&rsquo;']
+
+def strip_quotes(match):
+    """Elimină ghilimelele din grupul 2 (conținutul unei descrieri)"""
+    content = match.group(2)
+    for char in QUOTE_CHARS:
+        content = content.replace(char, '')
+    content = content.replace('\\"', '')  # Handle escaped quotes
+    return match.group(1) + content + match.group(3)
+
+# Pasul 8 - ghilimele din descrieri și h3 class="text_obisnuit2" -> h2
+PASUL8_H3_META_RULES = [
+    rule('meta description', r'(<meta name="description" content=")(.*?)(">)', strip_quotes, order=10, flags=re.DOTALL),
+    rule('og:description', r'(<meta property="og:description" content=")(.*?)("\s*/>)', strip_quotes, order=20, flags=re.DOTALL),
+    rule('JSON description (with spaces)', r'("description":\s*")(.*?)(",)', strip_quotes, order=30, flags=re.DOTALL),
+    rule('JSON description (no spaces)', r'("description":")(.*?)(",)', strip_quotes, order=40, flags=re.DOTALL),
+    rule('h3 without quotes', r'<h3(\s+class=text_obisnuit2[^>]*)>(.*?)</h3>', r'<h2 class="text_obisnuit2">\2</h2>', order=50, flags=re.DOTALL),
+    rule('h3 with quotes', r'<h3(\s+class="text_obisnuit2"[^>]*)>(.*?)</h3>', r'<h2 class="text_obisnuit2">\2</h2>', order=60, flags=re.DOTALL),
+]
+
+# Pasul 0 - cleanup_paragraph_spacing: fără spații după <p class="text_obisnuit"> / "text_obisnuit2"
+PASUL0_SPACING_RULES = [
+    rule('spatii dupa <p class="text_obisnuit">', r'(<p class="text_obisnuit2?"[^>]*>)\s+', r'\1'),
+]
+
+RULE_SETS = {
+    'pasul2_post_process': PASUL2_POST_PROCESS_RULES,
+    'pasul2_final': PASUL2_FINAL_RULES,
+    'pasul8_h3_meta': PASUL8_H3_META_RULES,
+    'pasul0_spacing': PASUL0_SPACING_RULES,
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if '--' not in argv or argv.index('--') == 0:
+        print("Utilizare: python rewrite_rules.py SET [SET ...] -- FOLDER [FOLDER ...]")
+        print(f"Seturi disponibile: {', '.join(RULE_SETS)}")
+        return 1
+    split = argv.index('--')
+    names, folders = argv[:split], argv[split + 1:]
+    unknown = [name for name in names if name not in RULE_SETS]
+    if unknown:
+        print(f"Seturi necunoscute: {', '.join(unknown)} (disponibile: {', '.join(RULE_SETS)})")
+        return 1
+
+    rule_sets = [RuleSet(RULE_SETS[name]) for name in names]
+    stats = rewrite_folders(folders, rule_sets)
+
+    print(f"\nFișiere: {stats['fisiere']}, modificate: {stats['modificate']}, erori: {stats['erori']}")
+    for name, rule_set in zip(names, rule_sets):
+        print(f"\nSet {name}:")
+        for line in rule_set.report():
+            print(line)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Funcțiile scripturilor Pasul X trimise în procese copil (ProcessPoolExecutor).
+
+Scripturile au nume cu spații, așa că pipeline.py și benchmark-urile le încarcă
+după cale, sub nume de modul pe care un proces copil pornit cu spawn (implicit
+pe Windows) nu le poate importa: pickle trimite funcția ca "modul.nume", iar
+copilul se oprește cu ModuleNotFoundError. script_function împachetează funcția
+ca (calea scriptului, numele ei); în procesul copil scriptul se încarcă după
+cale o singură dată, apoi funcția se apelează normal.
+
+    with ProcessPoolExecutor(initializer=script_function(_init_worker), initargs=(table,)) as pool:
+        results = list(pool.map(script_function(process_file), paths))
+
+POOL_ERRORS sunt erorile pool-ului însuși (procese care nu pornesc, funcții sau
+argumente care nu se pot trimite); doar la ele scripturile revin la procesul
+curent, erorile articolelor se propagă.
+"""
+
+import os
+import sys
+import pickle
+import importlib.util
+from concurrent.futures.process import BrokenProcessPool
+
+POOL_ERRORS = (BrokenProcessPool, pickle.PicklingError, AttributeError, ImportError)
+
+_scripts = {}  # calea scriptului -> modulul încărcat în procesul curent
+
+def load_script(path):
+    """Modulul scriptului de la calea dată, încărcat o singură dată per proces"""
+    module = _scripts.get(path)
+    if module is None:
+        # Scriptul e deja încărcat (rulat direct sau moștenit prin fork): îl refolosim
+        for loaded in list(sys.modules.values()):
+            file_path = getattr(loaded, '__file__', None)
+            if file_path and os.path.abspath(file_path) == path:
+                module = loaded
+                break
+        else:
+            spec = importlib.util.spec_from_file_location(f'script_pool_{len(_scripts)}', path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        _scripts[path] = module
+    return module
+
+class ScriptFunction:
+    """O funcție de nivel modul dintr-un script, trimisă prin calea scriptului și numele ei"""
+
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        return getattr(load_script(self.path), self.name)(*args, **kwargs)
+
+def script_function(function):
+    """ScriptFunction pentru o funcție definită la nivelul unui script"""
+    return ScriptFunction(os.path.abspath(function.__globals__['__file__']), function.__name__)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Amprentele intrărilor fiecărui pas din pipeline.py.
+
+Pentru fiecare pas se păstrează hash-ul fiecărui fișier de intrare și o
+amprentă (hash peste fișiere + configurația pasului). La rularea următoare:
+- dacă amprenta e aceeași, pasul se sare;
+- altfel se calculează ce fișiere s-au schimbat de la ultima rulare reușită,
+  ca pasul să le proceseze doar pe acestea.
+
+Hash-urile se recalculează doar pentru fișierele cu mtime/size schimbat.
+Starea se scrie atomic (fișier temporar + os.replace) într-un JSON.
+"""
+
+import os
+import json
+import hashlib
+
+STATE_VERSION = 1
+
+def empty_state():
+    return {'version': STATE_VERSION, 'files': {}, 'stages': {}}
+
+def load_state(state_path):
+    """Citește starea salvată (sau o stare goală dacă lipsește ori e din altă versiune)"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return empty_state()
+    if state.get('version') != STATE_VERSION:
+        return empty_state()
+    return state
+
+def save_state(state_path, state):
+    """Scrie starea atomic, ca o rulare întreruptă să nu lase un JSON incomplet"""
+    folder = os.path.dirname(os.path.abspath(state_path))
+    os.makedirs(folder, exist_ok=True)
+    temp_path = state_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temp_path, state_path)
+
+def hash_file(path, stat, file_cache):
+    """sha1 al unui fișier, refolosit din cache dacă mtime și size nu s-au schimbat"""
+    cached = file_cache.get(path)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        return cached[2]
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    sha1 = digest.hexdigest()
+    file_cache[path] = [stat.st_mtime, stat.st_size, sha1]
+    return sha1
+
+def snapshot(inputs, file_cache, extensions=('.html',)):
+    """
+    Hash-urile intrărilor unui pas: {intrare: {nume fișier: sha1}}.
+    O intrare poate fi un folder (fișierele lui de pe primul nivel) sau un fișier.
+    """
+    result = {}
+    for input_path in inputs:
+        hashes = {}
+        if os.path.isdir(input_path):
+            for entry in os.scandir(input_path):
+                if entry.is_file() and entry.name.lower().endswith(extensions):
+                    hashes[entry.name] = hash_file(entry.path, entry.stat(), file_cache)
+        elif os.path.isfile(input_path):
+            hashes[os.path.basename(input_path)] = hash_file(input_path, os.stat(input_path), file_cache)
+        result[input_path] = hashes
+    return result
+
+def changed_files(old_snapshot, new_snapshot):
+    """Fișierele noi sau modificate, pe intrare: {intrare: set(nume fișier)}"""
+    changes = {}
+    for input_path, hashes in new_snapshot.items():
+        old_hashes = old_snapshot.get(input_path, {})
+        changes[input_path] = {name for name, sha1 in hashes.items() if old_hashes.get(name) != sha1}
+    return changes
+
+def fingerprint(input_snapshot, stage_config):
+    """Amprenta unui pas: hash peste toate fișierele de intrare și configurația lui"""
+    digest = hashlib.sha1()
+    digest.update(json.dumps(stage_config, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    for input_path in sorted(input_snapshot):
+        digest.update(input_path.encode('utf-8'))
+        for name, sha1 in sorted(input_snapshot[input_path].items()):
+            digest.update(f'\0{name}\0{sha1}'.encode('utf-8'))
+    return digest.hexdigest()